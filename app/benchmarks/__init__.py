@@ -0,0 +1 @@
+"""Standalone latency benchmarks (run with ``python -m benchmarks.<name>``)."""
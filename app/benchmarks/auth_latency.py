@@ -0,0 +1,168 @@
+"""
+Auth dependency load test — p50/p99 latency under concurrent load.
+
+Compares the old inline path (``verify_token`` called directly inside an
+``async def`` dependency, blocking JWKS fetch on a cold store) with
+``verify_token_async`` (async JWKS bootstrap, RSA check on the bounded
+executor). Each request carries a distinct token so the verified-token cache
+never hits. Alongside the authenticated traffic a lightweight ``/ping`` route
+is probed to show how long unrelated requests wait on the event loop.
+
+Usage::
+
+    cd app
+    python -m benchmarks.auth_latency --requests 600 --rate 300
+"""
+import argparse
+import asyncio
+import base64
+import logging
+import os
+import time
+
+os.environ.setdefault("AUTH0_DOMAIN", "bench.example.auth0.com")
+os.environ.setdefault("AUTH0_API_AUDIENCE", "https://bench.example/api")
+
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import Depends, FastAPI
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwk, jwt
+
+from src.auth.auth0 import Auth0Manager
+from src.auth.dependencies import security
+from src.auth.jwks import JWKSKeyStore
+from src.auth.models import JWKS
+
+JWKS_FETCH_SECONDS = 0.2  # simulated network round trip to Auth0
+
+
+def _b64url_uint(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _signing_material():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+    jwks = JWKS(keys=[{"kid": "bench", "kty": "RSA", "alg": "RS256",
+                       "n": _b64url_uint(numbers.n), "e": _b64url_uint(numbers.e)}])
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return jwks, pem
+
+
+def _manager(jwks: JWKS) -> Auth0Manager:
+    def fetch(url):
+        time.sleep(JWKS_FETCH_SECONDS)
+        return jwks
+
+    async def fetch_async(url):
+        await asyncio.sleep(JWKS_FETCH_SECONDS)
+        return jwks
+
+    manager = Auth0Manager()
+    manager.key_store = JWKSKeyStore(
+        manager.key_store.jwks_url, fetcher=fetch, async_fetcher=fetch_async
+    )
+    return manager
+
+
+def _build_app(manager: Auth0Manager, mode: str) -> FastAPI:
+    app = FastAPI()
+
+    async def inline_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+        return manager.verify_token(credentials.credentials)
+
+    async def async_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+        return await manager.verify_token_async(credentials.credentials)
+
+    dependency = inline_user if mode == "before" else async_user
+
+    @app.get("/protected")
+    async def protected(user=Depends(dependency)):
+        return {"sub": user.sub}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def _pct(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index] * 1000
+
+
+async def _run(mode: str, tokens, jwks: JWKS, rate: float):
+    """Open-loop load: request ``i`` is due at ``i / rate`` seconds.
+
+    Latency is measured from the due time, so time spent waiting for a
+    blocked event loop is counted instead of silently omitted.
+    """
+    manager = _manager(jwks)
+    app = _build_app(manager, mode)
+    auth_latencies, ping_latencies = [], []
+
+    async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+        origin = time.perf_counter()
+
+        async def call(path, due, token, sink):
+            delay = origin + due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            headers = {"Authorization": f"Bearer {token}"} if token else {}
+            response = await client.get(path, headers=headers)
+            sink.append(time.perf_counter() - (origin + due))
+            assert response.status_code == 200, response.text
+
+        calls = [call("/protected", i / rate, t, auth_latencies) for i, t in enumerate(tokens)]
+        probes = [
+            call("/ping", i * 0.005, None, ping_latencies)
+            for i in range(int(len(tokens) / rate / 0.005))
+        ]
+        await asyncio.gather(*calls, *probes)
+        elapsed = time.perf_counter() - origin
+
+    manager.close()
+    return elapsed, auth_latencies, ping_latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=600)
+    parser.add_argument("--rate", type=float, default=300, help="arrivals per second")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    jwks, pem = _signing_material()
+    signing_key = jwk.construct(pem, "RS256")
+    tokens = [
+        jwt.encode(
+            {"sub": f"auth0|{i}", "aud": os.environ["AUTH0_API_AUDIENCE"],
+             "iss": f"https://{os.environ['AUTH0_DOMAIN']}/",
+             "exp": int(time.time()) + 3600},
+            signing_key, algorithm="RS256", headers={"kid": "bench"},
+        )
+        for i in range(args.requests)
+    ]
+
+    print(f"{args.requests} requests at {args.rate:.0f}/s, cold JWKS store")
+    print(f"{'mode':<8}{'req/s':>9}{'auth p50':>11}{'auth p99':>11}{'ping p50':>11}{'ping p99':>11}")
+    for mode in ("before", "after"):
+        elapsed, auth, ping = asyncio.run(_run(mode, tokens, jwks, args.rate))
+        print(
+            f"{mode:<8}{len(auth) / elapsed:>9.0f}"
+            f"{_pct(auth, 50):>9.1f}ms{_pct(auth, 99):>9.1f}ms"
+            f"{_pct(ping, 50):>9.1f}ms{_pct(ping, 99):>9.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Search page serialization — per-row enum re-parsing vs lookup tables.
+
+Times turning one page of exercise rows into the JSON body of
+``GET /exercises``. The old path is reproduced here: ``_to_response``
+lower-cased and parsed ``MuscleGroup`` / ``DifficultyLevel`` with
+try/except for every row and built validated models; FastAPI then dumped
+them, validated them again against ``response_model`` and encoded the
+result with ``JSONResponse``. The new path maps values through the
+precomputed lookups, builds the models without validation and encodes the
+page in one ``TypeAdapter.dump_json`` call.
+
+Usage::
+
+    cd app
+    python -m benchmarks.exercise_serialization --rows 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List
+
+os.environ.setdefault("AUTH0_DOMAIN", "bench.example.auth0.com")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.api.exercises import _search_page_response
+from src.models.exercises import DifficultyLevel, ExerciseResponse, MuscleGroup
+
+_response_field = create_response_field(name="Response_search_exercises", type_=List[ExerciseResponse])
+_loop = asyncio.new_event_loop()
+
+
+def _legacy_to_response(e) -> ExerciseResponse:
+    muscle_group = None
+    if e.primary_muscle_group:
+        try:
+            muscle_group = MuscleGroup(e.primary_muscle_group.lower())
+        except ValueError:
+            muscle_group = None
+    difficulty = None
+    if e.difficulty_level:
+        try:
+            difficulty = DifficultyLevel(e.difficulty_level.lower())
+        except ValueError:
+            difficulty = None
+    return ExerciseResponse(
+        exercise_id=e.exercise_id,
+        creator_id=e.creator_id,
+        name=e.name,
+        description=e.description,
+        equipment_required=e.equipment_required.split(",") if e.equipment_required else None,
+        primary_muscle_group=muscle_group,
+        difficulty_level=difficulty,
+        instructions=e.instructions,
+        created_at=e.created_at,
+    )
+
+
+def _legacy_page(rows) -> bytes:
+    content = _loop.run_until_complete(serialize_response(
+        field=_response_field,
+        response_content=[_legacy_to_response(e) for e in rows],
+        is_coroutine=False,
+    ))
+    return JSONResponse(content).body
+
+
+def _new_page(rows) -> bytes:
+    return _search_page_response(rows).body
+
+
+def _rows(n: int):
+    """Rows as the API writes them: canonical enum values, stripped strings."""
+    rng = random.Random(3)
+    muscles = [m.value for m in MuscleGroup]
+    levels = [d.value for d in DifficultyLevel]
+    return [
+        SimpleNamespace(
+            exercise_id=uuid.uuid4(),
+            creator_id=rng.choice([None, uuid.uuid4()]),
+            name=f"Exercise {i}",
+            description=("A compound movement. " * 4).strip(),
+            equipment_required=rng.choice([None, "barbell", "dumbbell,bench", "cable,handle,bench"]),
+            primary_muscle_group=rng.choice(muscles),
+            difficulty_level=rng.choice(levels),
+            instructions=("Brace, move under control, return to start. " * 5).strip(),
+            created_at=datetime(2026, 1, 1),
+        )
+        for i in range(n)
+    ]
+
+
+def _time(fn, rows, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    assert json.loads(_legacy_page(rows)) == json.loads(_new_page(rows))
+
+    legacy_ms = _time(_legacy_page, rows, args.repeat)
+    new_ms = _time(_new_page, rows, args.repeat)
+    print(f"{args.rows} rows per page, median of {args.repeat}")
+    print(f"{'legacy mapper + response_model':<34} {legacy_ms:>8.2f} ms")
+    print(f"{'lookup tables + dump_json':<34} {new_ms:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Typeahead latency — database search vs the in-memory exercise catalog.
+
+Seeds a SQLite stand-in with a synthetic catalog (unique generated names,
+mixed muscle groups, difficulties and equipment, plus the name token rows
+migration 023 adds), then replays search-as-you-type sessions: one search
+per keystroke for a handful of target names, with and without a muscle
+group filter. Each keystroke is timed through ``ExerciseRepository.search``
+(token index in the database) and ``ExerciseCatalog.search`` (snapshot
+already loaded). Also reports the cost of the initial snapshot load and of
+an incremental refresh after a batch of edits.
+
+Usage::
+
+    cd app
+    python -m benchmarks.exercise_typeahead --exercises 50000
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+os.environ.setdefault("AUTH0_DOMAIN", "bench.example.auth0.com")
+
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import Session
+
+from src.db.orm_models import Base, Exercise, ExerciseNameToken
+from src.db.sqlite_compat import SQLITE_EXECUTION_OPTIONS
+from src.models.exercises import DifficultyLevel, MuscleGroup
+from src.repositories.exercise_catalog import ExerciseCatalog
+from src.repositories.exercise_repository import ExerciseRepository
+from src.repositories.exercise_search import name_tokens, normalize_name
+
+EQUIPMENT = ["Barbell", "Dumbbell", "Kettlebell", "Cable", "Band", "Machine", "Smith", "Trap Bar",
+             "Landmine", "Sandbag", "Medicine Ball", "Suspension"]
+MOVEMENTS = ["Bench Press", "Squat", "Deadlift", "Row", "Curl", "Lunge", "Shoulder Press",
+             "Fly", "Pullover", "Shrug", "Extension", "Raise", "Thrust", "Step Up", "Carry",
+             "Clean", "Snatch", "Pulldown", "Kickback", "Good Morning", "Split Squat",
+             "Calf Raise", "Face Pull", "Crunch", "Rollout", "Woodchop", "Press Around",
+             "Hip Hinge", "Push Up", "Dip"]
+GRIPS = ["", "Wide Grip", "Close Grip", "Neutral Grip", "Reverse Grip", "Single Arm",
+         "Alternating", "Pause", "Tempo", "Deficit", "Banded", "Isometric"]
+POSITIONS = ["", "Incline", "Decline", "Seated", "Standing", "Kneeling", "Half Kneeling",
+             "Prone", "Supine", "Bulgarian", "Staggered", "Sumo", "Elevated", "Floor", "Wall"]
+
+TARGETS = ["Dumbbell Incline Bench Press", "Barbell Sumo Deadlift Pause",
+           "Cable Face Pull", "Kettlebell Single Arm Row", "Trap Bar Deadlift"]
+
+
+def _names(n: int):
+    for equipment, position, movement, grip in itertools.product(EQUIPMENT, POSITIONS, MOVEMENTS, GRIPS):
+        yield equipment, " ".join(p for p in (equipment, position, movement, grip) if p)
+    raise ValueError(f"Only {len(EQUIPMENT) * len(POSITIONS) * len(MOVEMENTS) * len(GRIPS)} names available")
+
+
+def _seed(engine, n: int) -> None:
+    Base.metadata.create_all(engine)
+    rng = random.Random(7)
+    now = datetime(2026, 1, 1)
+    muscles = [m.value for m in MuscleGroup]
+    levels = [d.value for d in DifficultyLevel]
+    exercises, tokens = [], []
+    for i, (equipment, name) in zip(range(n), _names(n)):
+        created = now - timedelta(minutes=i)
+        exercise_id = uuid.uuid4()
+        exercises.append({
+            "exercise_id": exercise_id,
+            "name": name,
+            "name_normalized": normalize_name(name),
+            "equipment_required": ",".join({equipment.lower(), rng.choice(EQUIPMENT).lower()}),
+            "primary_muscle_group": rng.choice(muscles),
+            "difficulty_level": rng.choice(levels),
+            "created_at": created,
+            "updated_at": created,
+        })
+        tokens.extend({"token": t, "exercise_id": exercise_id} for t in name_tokens(name))
+    with Session(engine) as db:
+        for i in range(0, len(exercises), 5000):
+            db.execute(insert(Exercise), exercises[i:i + 5000])
+        for i in range(0, len(tokens), 20000):
+            db.execute(insert(ExerciseNameToken), tokens[i:i + 20000])
+        db.commit()
+
+
+def _keystrokes():
+    for target in TARGETS:
+        for end in range(1, len(target) + 1):
+            if not target[end - 1].isspace():
+                yield target[:end]
+
+
+def _percentiles(samples):
+    ordered = sorted(samples)
+    return statistics.median(ordered), ordered[int(len(ordered) * 0.99) - 1]
+
+
+def _replay(search, **filters):
+    samples = []
+    for text in _keystrokes():
+        started = time.perf_counter()
+        search(name=text, limit=20, **filters)
+        samples.append((time.perf_counter() - started) * 1000)
+    return _percentiles(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--exercises", type=int, default=50000)
+    parser.add_argument("--edits", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{tmp}/bench.db", execution_options=SQLITE_EXECUTION_OPTIONS
+        )
+        _seed(engine, args.exercises)
+
+        with Session(engine) as db:
+            repo = ExerciseRepository(db)
+            catalog = ExerciseCatalog(refresh_seconds=3600)
+
+            started = time.perf_counter()
+            catalog.refresh(db)
+            load_ms = (time.perf_counter() - started) * 1000
+
+            for text in _keystrokes():
+                assert [e.name for e in repo.search(name=text, limit=20)] == \
+                    [r.name for r in catalog.search(db, name=text, limit=20)], text
+
+            keystrokes = sum(1 for _ in _keystrokes())
+            print(f"{args.exercises} exercises, {keystrokes} keystrokes, page size 20")
+            print(f"snapshot load: {load_ms:.0f} ms, {catalog.stats()['tokens']} distinct tokens")
+            print(f"{'search':<28} {'p50 ms':>8} {'p99 ms':>8}")
+            for label, filters in (("name", {}), ("name + muscle group", {"muscle_group": MuscleGroup.CHEST})):
+                db_p50, db_p99 = _replay(repo.search, **filters)
+                mem_p50, mem_p99 = _replay(lambda **kw: catalog.search(db, **kw), **filters)
+                print(f"{'database, ' + label:<28} {db_p50:>8.2f} {db_p99:>8.2f}")
+                print(f"{'catalog, ' + label:<28} {mem_p50:>8.3f} {mem_p99:>8.3f}")
+
+            edited = db.execute(
+                Exercise.__table__.select().with_only_columns(Exercise.exercise_id).limit(args.edits)
+            ).scalars().all()
+            later = datetime.utcnow() + timedelta(minutes=1)
+            db.execute(update(Exercise), [
+                {"exercise_id": exercise_id, "description": "edited", "updated_at": later}
+                for exercise_id in edited
+            ])
+            started = time.perf_counter()
+            catalog.refresh(db)
+            refresh_ms = (time.perf_counter() - started) * 1000
+            print(f"incremental refresh after {args.edits} edits: {refresh_ms:.1f} ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
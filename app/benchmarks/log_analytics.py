@@ -0,0 +1,184 @@
+"""
+History analytics — per-row ORM loop vs columnar NumPy arrays.
+
+Seeds a SQLite stand-in with one user's synthetic multi-year history (about
+four workouts a week, six exercises × four sets × four steps each, some
+steps without a weight) and computes the three ``/analytics`` series over
+all of it: 28-day rolling volume, best estimated 1RM per day for one
+exercise, and week-over-week volume changes. The old path loads the
+workout logs with their set/step-log trees as ORM objects and walks every
+step in Python; the new path is ``LogAnalytics``, which streams the same
+rows into arrays with one query. Both start from an empty identity map and
+must agree on every value.
+
+Usage::
+
+    cd app
+    python -m benchmarks.log_analytics --years 5 --steps 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+os.environ.setdefault("AUTH0_DOMAIN", "bench.example.auth0.com")
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session, selectinload
+
+from src.db.orm_models import Base, Exercise, SetLog, SetStepLog, User, WorkoutLog
+from src.db.sqlite_compat import SQLITE_EXECUTION_OPTIONS
+from src.repositories.log_analytics import LogAnalytics
+from src.repositories.personal_record_repository import E1RM_MAX_REPS
+from src.repositories.workout_stats_repository import week_start
+
+EXERCISES_PER_WORKOUT = 6
+SETS_PER_EXERCISE = 4
+STEPS_PER_SET = 4
+STEPS_PER_WORKOUT = EXERCISES_PER_WORKOUT * SETS_PER_EXERCISE * STEPS_PER_SET
+WINDOW = 28
+
+
+def _seed(engine, years: int, steps: int):
+    Base.metadata.create_all(engine)
+    rng = random.Random(11)
+    user_id = uuid.uuid4()
+    exercise_ids = [uuid.uuid4() for _ in range(12)]
+    workouts = max(steps // STEPS_PER_WORKOUT, 1)
+    first_day = datetime(2026, 10, 18) - timedelta(days=365 * years)
+    spacing = 365 * years / workouts
+
+    logs, sets, step_rows = [], [], []
+    for w in range(workouts):
+        start = first_day + timedelta(days=int(w * spacing), hours=rng.randint(6, 20))
+        log_id = uuid.uuid4()
+        logs.append({"workout_log_id": log_id, "user_id": user_id, "start_time": start,
+                     "end_time": start + timedelta(minutes=70), "created_at": start})
+        progress = 1 + w / workouts  # weights climb over the years
+        for order, exercise_id in enumerate(rng.sample(exercise_ids, EXERCISES_PER_WORKOUT), 1):
+            for set_number in range(1, SETS_PER_EXERCISE + 1):
+                set_id = uuid.uuid4()
+                sets.append({"set_log_id": set_id, "workout_log_id": log_id,
+                             "set_order": (order - 1) * SETS_PER_EXERCISE + set_number,
+                             "exercise_id": exercise_id, "set_number": set_number, "created_at": start})
+                for step_order in range(1, STEPS_PER_SET + 1):
+                    weight = None
+                    if rng.random() > 0.05:
+                        weight = round(rng.uniform(20, 140) * progress / 2.5) * 2.5
+                    step_rows.append({"set_step_log_id": uuid.uuid4(), "set_log_id": set_id,
+                                      "step_order": step_order, "completed_reps": rng.randint(1, 15),
+                                      "completed_weight": weight, "created_at": start})
+
+    with Session(engine) as db:
+        db.add(User(user_id=user_id, auth0_sub="auth0|bench", email="bench@example.com"))
+        db.execute(insert(Exercise), [{"exercise_id": e, "name": f"Lift {i}"} for i, e in enumerate(exercise_ids)])
+        db.execute(insert(WorkoutLog), logs)
+        for i in range(0, len(sets), 5000):
+            db.execute(insert(SetLog), sets[i:i + 5000])
+        for i in range(0, len(step_rows), 20000):
+            db.execute(insert(SetStepLog), step_rows[i:i + 20000])
+        db.commit()
+    return user_id, exercise_ids[0], len(step_rows)
+
+
+def _orm_loop(db, user_id, exercise_id):
+    """The per-row path: load every log tree, then walk each step."""
+    logs = db.execute(
+        select(WorkoutLog)
+        .options(selectinload(WorkoutLog.set_logs).selectinload(SetLog.step_logs))
+        .where(WorkoutLog.user_id == user_id)
+        .order_by(WorkoutLog.start_time)
+    ).scalars().all()
+    daily = defaultdict(float)
+    weekly = defaultdict(float)
+    best = {}
+    for log in logs:
+        day = log.start_time.date()
+        for set_log in log.set_logs:
+            for step in set_log.step_logs:
+                if step.completed_weight is None:
+                    continue
+                weight = float(step.completed_weight)
+                daily[day] += step.completed_reps * weight
+                weekly[week_start(day)] += step.completed_reps * weight
+                if set_log.exercise_id == exercise_id and 1 <= step.completed_reps <= E1RM_MAX_REPS and weight > 0:
+                    reps = step.completed_reps
+                    estimate = weight if reps == 1 else weight * (1 + reps / 30)
+                    best[day] = max(best.get(day, 0.0), estimate)
+
+    first, last = min(daily), max(daily)
+    rolling = []
+    day = first
+    while day <= last:
+        rolling.append(sum(daily.get(day - timedelta(days=d), 0.0) for d in range(WINDOW)))
+        day += timedelta(days=1)
+    weeks = []
+    week = week_start(first)
+    while week <= week_start(last):
+        weeks.append(weekly.get(week, 0.0))
+        week += timedelta(days=7)
+    changes = [b - a for a, b in zip([0.0] + weeks, weeks)]
+    return rolling, [best[d] for d in sorted(best)], changes
+
+
+def _vectorized(db, user_id, exercise_id):
+    analytics = LogAnalytics(db)
+    rolling = analytics.rolling_volume(user_id, window=WINDOW).rolling_volume
+    trend = analytics.e1rm_trend(user_id, exercise_id).estimated_1rm
+    changes = analytics.weekly_volume(user_id).volume_change
+    return rolling, trend, changes
+
+
+def _time(engine, compute, user_id, exercise_id, runs: int):
+    samples, result = [], None
+    for _ in range(runs):
+        with Session(engine) as db:
+            started = time.perf_counter()
+            result = compute(db, user_id, exercise_id)
+            samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def _same(a, b):
+    return len(a) == len(b) and all(abs(x - y) < 0.011 for x, y in zip(a, b))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--steps", type=int, default=100000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{tmp}/bench.db", execution_options=SQLITE_EXECUTION_OPTIONS
+        )
+        user_id, exercise_id, steps = _seed(engine, args.years, args.steps)
+
+        orm_ms, expected = _time(engine, _orm_loop, user_id, exercise_id, args.runs)
+        numpy_ms, actual = _time(engine, _vectorized, user_id, exercise_id, args.runs)
+        for name, a, b in zip(("rolling volume", "e1RM trend", "weekly change"), expected, actual):
+            assert _same(a, b), name
+
+        with Session(engine) as db:
+            analytics = LogAnalytics(db)
+            started = time.perf_counter()
+            history = analytics.history(user_id)
+            load_ms = (time.perf_counter() - started) * 1000
+
+        print(f"{steps} steps over {args.years} years, median of {args.runs} runs")
+        print(f"{'path':<34} {'ms':>9}")
+        print(f"{'ORM loop (3 series)':<34} {orm_ms:>9.1f}")
+        print(f"{'NumPy (3 series, 4 queries)':<34} {numpy_ms:>9.1f}")
+        print(f"{'  of which one history load':<34} {load_ms:>9.1f}  ({len(history.days)} rows)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
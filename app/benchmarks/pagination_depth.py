@@ -0,0 +1,115 @@
+"""
+Page latency at depth — OFFSET vs keyset cursor for ``list_by_user``.
+
+Seeds one user with a long workout-log history in a SQLite stand-in (with the
+same ``(UserId, StartTime DESC, WorkoutLogId DESC)`` index migration 022 adds
+on Azure SQL), then times ``LogRepository.list_by_user`` for a page at
+increasing depths, once via ``offset`` and once via the equivalent cursor.
+OFFSET cost grows with the number of rows skipped; the cursor page is a
+seek and stays flat.
+
+Usage::
+
+    cd app
+    python -m benchmarks.pagination_depth --logs 50000 --page-size 50
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+os.environ.setdefault("AUTH0_DOMAIN", "bench.example.auth0.com")
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from src.db.orm_models import Base, User, WorkoutLog
+from src.db.sqlite_compat import SQLITE_EXECUTION_OPTIONS
+from src.repositories.log_repository import LogRepository
+from src.repositories.pagination import encode_cursor
+
+
+def _seed(engine, user_id: uuid.UUID, n_logs: int) -> None:
+    Base.metadata.create_all(engine)
+    start = datetime(2020, 1, 1)
+    with Session(engine) as db:
+        db.execute(insert(User), [{"user_id": user_id, "auth0_sub": "auth0|bench",
+                                     "email": "bench@example.com"}])
+        rows = [
+            {
+                "workout_log_id": uuid.uuid4(),
+                "user_id": user_id,
+                "start_time": start + timedelta(hours=i),
+                "end_time": start + timedelta(hours=i, minutes=45),
+            }
+            for i in range(n_logs)
+        ]
+        for i in range(0, len(rows), 5000):
+            db.execute(insert(WorkoutLog), rows[i:i + 5000])
+        db.execute(text(
+            "CREATE INDEX IX_WorkoutLogs_UserId_StartTime_Keyset "
+            "ON WorkoutLogs (UserId, StartTime DESC, WorkoutLogId DESC)"
+        ))
+        db.commit()
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logs", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{tmp}/bench.db", execution_options=SQLITE_EXECUTION_OPTIONS
+        )
+        user_id = uuid.uuid4()
+        _seed(engine, user_id, args.logs)
+
+        depths = [0, 1000, 5000, 10000, 25000, args.logs - args.page_size]
+        depths = sorted({d for d in depths if 0 <= d < args.logs})
+
+        with Session(engine) as db:
+            repo = LogRepository(db)
+            # Newest-first order, so the cursor for depth d is row d-1
+            ordered = repo.list_by_user(user_id, limit=args.logs)
+
+            print(f"{args.logs} logs, page size {args.page_size}, median of {args.repeat}")
+            print(f"{'depth':>8} {'offset ms':>10} {'cursor ms':>10}")
+            for depth in depths:
+                cursor = None
+                if depth:
+                    prev = ordered[depth - 1]
+                    cursor = encode_cursor(prev.start_time, prev.workout_log_id)
+
+                by_offset = repo.list_by_user(user_id, offset=depth, limit=args.page_size)
+                by_cursor = repo.list_by_user(user_id, cursor=cursor, limit=args.page_size)
+                assert [l.workout_log_id for l in by_offset] == [l.workout_log_id for l in by_cursor]
+
+                offset_ms = _time(
+                    lambda: repo.list_by_user(user_id, offset=depth, limit=args.page_size),
+                    args.repeat,
+                )
+                cursor_ms = _time(
+                    lambda: repo.list_by_user(user_id, cursor=cursor, limit=args.page_size),
+                    args.repeat,
+                )
+                print(f"{depth:>8} {offset_ms:>10.2f} {cursor_ms:>10.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
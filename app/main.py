@@ -5,8 +5,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
-from src.api import health, fitness, users, exercises, programs
+from src.api import health, fitness, users, exercises, programs, analytics
+from src.auth.auth0 import auth0_manager
 from src.config import settings
+from src.db.session import dispose_async_engine
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,6 +28,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # Include routers
@@ -34,14 +37,19 @@ app.include_router(fitness.router, prefix="/api/v1")
 app.include_router(users.router, prefix="/api/v1")
 app.include_router(exercises.router, prefix="/api/v1")
 app.include_router(programs.router, prefix="/api/v1")
+app.include_router(analytics.router, prefix="/api/v1")
 
 @app.on_event("startup")
 async def startup_event():
     logger.info("Application startup")
+    await auth0_manager.startup()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Application shutdown")
+    auth0_manager.close()
+    if settings.DB_ASYNC_ENABLED:
+        await dispose_async_engine()
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1 @@
+"""One-off maintenance commands (run with ``python -m scripts.<name>``)."""
@@ -0,0 +1,56 @@
+"""
+Keyset-batched maintenance loop shared by the backfill / rebuild scripts.
+"""
+import argparse
+import logging
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.db.session import get_session_factory
+
+logger = logging.getLogger(__name__)
+
+
+def for_each_batch(
+    column: Any,
+    batch_size: int,
+    fn: Callable[[Session, List[Any]], None],
+    label: str,
+    *,
+    rows: Optional[Any] = None,
+) -> int:
+    """Call ``fn(db, batch)`` for every row in keyset batches ordered by
+    ``column``, committing each batch on its own; returns how many rows were
+    processed.
+
+    ``rows`` is what each batch holds (e.g. a mapped class); by default the
+    values of ``column`` itself. ``label`` is logged with the running count.
+    """
+    session_factory = get_session_factory()
+    processed = 0
+    last_key = None
+    while True:
+        with session_factory() as db:
+            stmt = select(column if rows is None else rows).order_by(column).limit(batch_size)
+            if last_key is not None:
+                stmt = stmt.where(column > last_key)
+            batch = list(db.execute(stmt).scalars().all())
+            if not batch:
+                return processed
+            fn(db, batch)
+            db.commit()
+            last_key = batch[-1] if rows is None else getattr(batch[-1], column.key)
+            processed += len(batch)
+            logger.info(label, processed)
+
+
+def main(doc: str, job: Callable[[int], int], label: str, default_batch_size: int = 500) -> None:
+    """Command-line entry point: ``--batch-size``, then ``job`` and its total."""
+    parser = argparse.ArgumentParser(description=doc.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=default_batch_size)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    total = job(args.batch_size)
+    print(label % total)
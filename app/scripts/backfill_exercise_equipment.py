@@ -0,0 +1,36 @@
+"""
+Backfill the normalized exercise equipment relation.
+
+Migration 025 creates ``ExerciseEquipment`` empty. This fills it from each
+exercise's ``EquipmentRequired`` (comma-joined, or a JSON array in rows
+written by hand), using the same canonical names as the API. It is
+idempotent; every exercise (soft-deleted ones included) is rewritten in
+keyset batches, each committed on its own.
+
+Usage::
+
+    cd app
+    python -m scripts.backfill_exercise_equipment --batch-size 500
+"""
+from scripts._batches import for_each_batch, main as run
+from src.db.orm_models import Exercise
+from src.repositories.exercise_repository import ExerciseRepository
+
+LABEL = "Backfilled equipment for %d exercises"
+
+
+def backfill(batch_size: int) -> int:
+    """Rewrite the equipment rows of every exercise; returns how many were processed."""
+    return for_each_batch(
+        Exercise.exercise_id, batch_size,
+        lambda db, batch: ExerciseRepository(db).reindex_equipment(batch),
+        LABEL, rows=Exercise,
+    )
+
+
+def main() -> None:
+    run(__doc__, backfill, LABEL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Backfill the exercise name search index.
+
+Migration 023 adds ``Exercises.NameNormalized`` and ``ExerciseNameTokens``
+but cannot populate them: normalization (accent folding, tokenizing) lives
+in ``src.repositories.exercise_search``. Run this once after the migration,
+and again whenever ``normalize_name`` changes. It is idempotent; every
+exercise (soft-deleted ones included) is reindexed in keyset batches, each
+committed on its own.
+
+Usage::
+
+    cd app
+    python -m scripts.backfill_exercise_search --batch-size 500
+"""
+from scripts._batches import for_each_batch, main as run
+from src.db.orm_models import Exercise
+from src.repositories.exercise_repository import ExerciseRepository
+
+LABEL = "Reindexed %d exercises"
+
+
+def backfill(batch_size: int) -> int:
+    """Reindex every exercise; returns how many were processed."""
+    return for_each_batch(
+        Exercise.exercise_id, batch_size,
+        lambda db, batch: ExerciseRepository(db).reindex_names(batch),
+        LABEL, rows=Exercise,
+    )
+
+
+def main() -> None:
+    run(__doc__, backfill, LABEL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Backfill the materialized daily training volume.
+
+Migration 029 creates ``DailyExerciseVolume`` empty; the API only keeps
+rows current for days it writes to. This computes every user's rows from
+their whole set/step-log history. It is idempotent (each user's rows are
+replaced); users are processed in keyset batches, each committed on its
+own.
+
+Usage::
+
+    cd app
+    python -m scripts.backfill_training_volume --batch-size 200
+"""
+from scripts._batches import for_each_batch, main as run
+from src.db.orm_models import User
+from src.repositories.training_volume_repository import TrainingVolumeRepository
+
+LABEL = "Backfilled training volume for %d users"
+
+
+def backfill(batch_size: int) -> int:
+    """Rebuild the daily volume rows of every user; returns how many were processed."""
+    return for_each_batch(
+        User.user_id, batch_size,
+        lambda db, batch: TrainingVolumeRepository(db).rebuild(batch),
+        LABEL,
+    )
+
+
+def main() -> None:
+    run(__doc__, backfill, LABEL, default_batch_size=200)
+
+
+if __name__ == "__main__":
+    main()
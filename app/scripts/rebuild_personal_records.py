@@ -0,0 +1,38 @@
+"""
+Rebuild every user's personal records from their step logs.
+
+Migration 030 creates ``PersonalRecords`` empty; the API only applies
+steps logged from then on. This recomputes each user's records from their
+whole history — once after the migration, or after manual data fixes. It
+is idempotent (each user's rows are replaced); users are processed in
+keyset batches, each committed on its own.
+
+Usage::
+
+    cd app
+    python -m scripts.rebuild_personal_records --batch-size 200
+"""
+from scripts._batches import for_each_batch, main as run
+from src.db.orm_models import User
+from src.repositories.personal_record_repository import PersonalRecordRepository
+
+LABEL = "Rebuilt personal records for %d users"
+
+
+def _recompute(db, user_ids) -> None:
+    records = PersonalRecordRepository(db)
+    for user_id in user_ids:
+        records.recompute(user_id)
+
+
+def rebuild(batch_size: int) -> int:
+    """Recompute the records of every user; returns how many were processed."""
+    return for_each_batch(User.user_id, batch_size, _recompute, LABEL)
+
+
+def main() -> None:
+    run(__doc__, rebuild, LABEL, default_batch_size=200)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Rebuild the per-user workout stats rollup from scratch.
+
+``UserWorkoutStats`` is maintained incrementally as logs are finished or
+deleted, and a missing row is built on first use. This recomputes every
+user's row from ``WorkoutLogs`` — after manual data fixes, or to refresh
+the this-week/this-month counters in bulk. It is idempotent; users are
+processed in keyset batches, each committed on its own.
+
+Usage::
+
+    cd app
+    python -m scripts.rebuild_workout_stats --batch-size 500
+"""
+from scripts._batches import for_each_batch, main as run
+from src.db.orm_models import User
+from src.repositories.workout_stats_repository import WorkoutStatsRepository
+
+LABEL = "Rebuilt workout stats for %d users"
+
+
+def rebuild(batch_size: int) -> int:
+    """Recompute the rollup row of every user; returns how many were processed."""
+    return for_each_batch(
+        User.user_id, batch_size,
+        lambda db, batch: WorkoutStatsRepository(db).rebuild(batch),
+        LABEL,
+    )
+
+
+def main() -> None:
+    run(__doc__, rebuild, LABEL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Analytics Endpoints — chart series computed over the current user's full
+step-log history (rolling volume, estimated-1RM trends, weekly changes).
+"""
+import uuid
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from src.auth.dependencies import get_current_user, resolve_user_id
+from src.auth.models import UserContext
+from src.db.session import get_db
+from src.models.logs import EstimatedOneRepMaxTrend, RollingVolumeSeries, WeeklyVolumeChange
+from src.repositories.log_analytics import LogAnalytics
+
+router = APIRouter(tags=["analytics"])
+
+
+def _check_range(start_date: Optional[date], end_date: Optional[date]) -> None:
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date is after end_date")
+
+
+@router.get("/analytics/volume", response_model=RollingVolumeSeries)
+def get_rolling_volume(
+    window: int = Query(7, ge=1, le=365, description="Days in the rolling sum"),
+    start_date: Optional[date] = Query(None, description="First day to include"),
+    end_date: Optional[date] = Query(None, description="Last day to include"),
+    exercise_id: Optional[uuid.UUID] = Query(None, description="Only this exercise"),
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The current user's volume (reps × weight) per day and over a rolling window.
+
+    Parallel arrays with an entry for every calendar day in range.
+    """
+    _check_range(start_date, end_date)
+    user_id = resolve_user_id(user, db)
+    return LogAnalytics(db).rolling_volume(
+        user_id, window=window, exercise_id=exercise_id, start_date=start_date, end_date=end_date
+    )
+
+
+@router.get("/analytics/exercises/{exercise_id}/e1rm", response_model=EstimatedOneRepMaxTrend)
+def get_e1rm_trend(
+    exercise_id: uuid.UUID,
+    start_date: Optional[date] = Query(None, description="First day to include"),
+    end_date: Optional[date] = Query(None, description="Last day to include"),
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The current user's best estimated 1RM per training day for an exercise."""
+    _check_range(start_date, end_date)
+    user_id = resolve_user_id(user, db)
+    trend = LogAnalytics(db).e1rm_trend(user_id, exercise_id, start_date=start_date, end_date=end_date)
+    if trend is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
+    return trend
+
+
+@router.get("/analytics/weekly", response_model=WeeklyVolumeChange)
+def get_weekly_volume(
+    start_date: Optional[date] = Query(None, description="First day to include"),
+    end_date: Optional[date] = Query(None, description="Last day to include"),
+    exercise_id: Optional[uuid.UUID] = Query(None, description="Only this exercise"),
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The current user's volume and reps per week with week-over-week changes."""
+    _check_range(start_date, end_date)
+    user_id = resolve_user_id(user, db)
+    return LogAnalytics(db).weekly_volume(
+        user_id, exercise_id=exercise_id, start_date=start_date, end_date=end_date
+    )
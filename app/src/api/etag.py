@@ -0,0 +1,44 @@
+"""
+Conditional GET helpers — strong ETags and ``If-None-Match`` handling
+"""
+from typing import Callable, Hashable
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from src.cache import ResponseCache
+
+
+def _if_none_match(request: Request, etag: str) -> bool:
+    """True if the request's ``If-None-Match`` matches ``etag``.
+
+    RFC 9110 uses weak comparison here, so a ``W/`` prefix is ignored.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def cached_json_response(
+    request: Request,
+    cache: ResponseCache,
+    key: Hashable,
+    version: Hashable,
+    build: Callable[[], BaseModel],
+) -> Response:
+    """Serve ``build()`` as JSON through ``cache`` with a strong ETag.
+
+    ``build`` (the tree load and mapping) only runs when there is no entry
+    for ``version``; a matching ``If-None-Match`` gets an empty 304.
+    """
+    entry = cache.get(key, version)
+    if entry is None:
+        entry = cache.put(key, version, build().model_dump_json().encode("utf-8"))
+
+    headers = {"ETag": entry.etag, "Cache-Control": "private, no-cache"}
+    if _if_none_match(request, entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
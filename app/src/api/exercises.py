@@ -3,15 +3,22 @@ Exercise Endpoints — CRUD, search, and ownership.
 """
 import logging
 import uuid
+from datetime import date
+from functools import partial
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.auth.dependencies import get_current_user
+from src.auth.dependencies import get_current_user, resolve_user_id
 from src.auth.models import UserContext
-from src.db.session import get_db
+from src.db.session import get_async_db_if_enabled, get_db
 from src.models.exercises import (
+    DIFFICULTY_LEVEL_LOOKUP,
+    MUSCLE_GROUP_LOOKUP,
     DifficultyLevel,
     ExerciseCreate,
     ExerciseResponse,
@@ -19,63 +26,58 @@ from src.models.exercises import (
     ExerciseUpdate,
     MuscleGroup,
 )
-from src.repositories.exercise_repository import ExerciseRepository
-from src.repositories.user_repository import UserRepository
+from src.models.logs import ExercisePerformanceHistory, ExerciseRecords, PerformanceBucket
+from src.repositories.exercise_catalog import exercise_catalog
+from src.repositories.exercise_repository import AsyncExerciseRepository, ExerciseRepository
+from src.repositories.log_repository import LogRepository
+from src.repositories.personal_record_repository import PersonalRecordRepository
 
 router = APIRouter(tags=["exercises"])
 logger = logging.getLogger(__name__)
 
-
-def _resolve_user_id(user: UserContext, db: Session) -> uuid.UUID:
-    db_user = UserRepository(db).get_by_auth0_sub(user.auth0_sub)
-    if db_user is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return db_user.user_id
+_exercise_list = TypeAdapter(List[ExerciseResponse])
 
 
 def _to_response(e) -> ExerciseResponse:
-    # Safely convert muscle group to enum, handling invalid values
-    muscle_group = None
-    if e.primary_muscle_group:
-        muscle_group_lower = e.primary_muscle_group.lower()
-        try:
-            muscle_group = MuscleGroup(muscle_group_lower)
-        except ValueError:
-            # Invalid muscle group in database, set to None
-            muscle_group = None
-    
-    # Safely convert difficulty level to enum, handling invalid values
-    difficulty = None
-    if e.difficulty_level:
-        difficulty_lower = e.difficulty_level.lower()
-        try:
-            difficulty = DifficultyLevel(difficulty_lower)
-        except ValueError:
-            # Invalid difficulty level in database, set to None
-            difficulty = None
-    
-    return ExerciseResponse(
+    # Stored values are canonical, so enum mapping is a lookup and the
+    # model is built without re-validating each field.
+    return ExerciseResponse.model_construct(
         exercise_id=e.exercise_id,
         creator_id=e.creator_id,
         name=e.name,
         description=e.description,
         equipment_required=e.equipment_required.split(",") if e.equipment_required else None,
-        primary_muscle_group=muscle_group,
-        difficulty_level=difficulty,
+        primary_muscle_group=MUSCLE_GROUP_LOOKUP.get(e.primary_muscle_group),
+        difficulty_level=DIFFICULTY_LEVEL_LOOKUP.get(e.difficulty_level),
         instructions=e.instructions,
         created_at=e.created_at,
     )
 
 
+def _search_page_response(exercises) -> Response:
+    """Serialize a search page in one pass.
+
+    Returning the models would have FastAPI dump them to dicts and
+    validate them again against ``response_model`` before encoding.
+    """
+    return Response(
+        content=_exercise_list.dump_json([_to_response(e) for e in exercises]),
+        media_type="application/json",
+    )
+
+
 # ---------------------------------------------------------------------------
 # CRUD
 # ---------------------------------------------------------------------------
 
 @router.get("/exercises", response_model=List[ExerciseResponse])
 def search_exercises(
-    name: Optional[str] = Query(None, description="Filter by name (partial match)"),
+    name: Optional[str] = Query(None, description="Search by name: word prefixes, ranked, typo-tolerant"),
     muscle_group: Optional[str] = Query(None, description="Filter by muscle group"),
     difficulty: Optional[str] = Query(None, description="Filter by difficulty level"),
+    equipment: Optional[List[str]] = Query(
+        None, description="Equipment available (repeatable); excludes exercises needing anything else"
+    ),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
     user: UserContext = Depends(get_current_user),
@@ -99,30 +101,79 @@ def search_exercises(
         except ValueError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid difficulty level: {difficulty}")
     
-    exercises = repo.search(
+    search = (
+        partial(exercise_catalog.search, db)
+        if exercise_catalog.enabled
+        else repo.search
+    )
+    exercises = search(
         name=name,
         muscle_group=muscle_group_enum,
         difficulty=difficulty_enum,
+        equipment=equipment,
         offset=offset,
         limit=limit,
     )
-    return [_to_response(e) for e in exercises]
+    return _search_page_response(exercises)
 
 
 @router.get("/exercises/{exercise_id}", response_model=ExerciseResponse)
-def get_exercise(
+async def get_exercise(
     exercise_id: uuid.UUID,
     user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db),
+    async_db: Optional[AsyncSession] = Depends(get_async_db_if_enabled),
 ):
-    """Get a single exercise by ID."""
-    repo = ExerciseRepository(db)
-    exercise = repo.get_by_id(exercise_id)
+    """Get a single exercise by ID.
+
+    Read through the ``AsyncSession`` when ``DB_ASYNC_ENABLED`` is set;
+    otherwise the sync session is used on the threadpool.
+    """
+    if async_db is not None:
+        exercise = await AsyncExerciseRepository(async_db).get_by_id(exercise_id)
+    else:
+        exercise = await run_in_threadpool(ExerciseRepository(db).get_by_id, exercise_id)
     if exercise is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
     return _to_response(exercise)
 
 
+@router.get("/exercises/{exercise_id}/performance", response_model=ExercisePerformanceHistory)
+def get_exercise_performance(
+    exercise_id: uuid.UUID,
+    start_date: Optional[date] = Query(None, description="First day to include (workout start date)"),
+    end_date: Optional[date] = Query(None, description="Last day to include"),
+    bucket: Optional[PerformanceBucket] = Query(None, description="Also split totals per day, week or month"),
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The current user's sets, reps and weights for an exercise."""
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date is after end_date")
+    user_id = resolve_user_id(user, db)
+    performance = LogRepository(db).exercise_performance(
+        user_id, exercise_id, start_date=start_date, end_date=end_date, bucket=bucket
+    )
+    if performance is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
+    return performance
+
+
+@router.get("/exercises/{exercise_id}/records", response_model=ExerciseRecords)
+def get_exercise_records(
+    exercise_id: uuid.UUID,
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The current user's personal records for an exercise: max weight,
+    best estimated 1RM and the best weight for each rep count."""
+    user_id = resolve_user_id(user, db)
+    records = PersonalRecordRepository(db).get_records(user_id, exercise_id)
+    if records is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Exercise not found")
+    return records
+
+
 @router.post("/exercises", response_model=ExerciseResponse, status_code=status.HTTP_201_CREATED)
 def create_exercise(
     data: ExerciseCreate,
@@ -130,7 +181,7 @@ def create_exercise(
     db: Session = Depends(get_db),
 ):
     """Create a new exercise owned by the current user."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ExerciseRepository(db)
 
     # Check for name collision
@@ -153,7 +204,7 @@ def update_exercise(
     db: Session = Depends(get_db),
 ):
     """Update an exercise. Only the creator (or admin for system exercises) may edit."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ExerciseRepository(db)
     exercise = repo.get_by_id(exercise_id)
     if exercise is None:
@@ -171,7 +222,7 @@ def delete_exercise(
     db: Session = Depends(get_db),
 ):
     """Soft-delete an exercise. Only the creator may delete."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ExerciseRepository(db)
     exercise = repo.get_by_id(exercise_id)
     if exercise is None:
@@ -4,12 +4,15 @@ All raw SQL replaced by SQLAlchemy repository layer.
 """
 import logging
 import uuid
+from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.auth.dependencies import get_current_user
+from src.api.etag import cached_json_response
+from src.auth.dependencies import get_current_user, resolve_user_id
 from src.auth.models import UserContext
 from src.db.session import get_db
 from src.models.workouts import (
@@ -22,12 +25,18 @@ from src.models.workouts import (
     SetResponse,
     SetStepResponse,
 )
-from src.models.exercises import ExerciseSummary
+from src.models.exercises import MUSCLE_GROUP_LOOKUP, ExerciseSummary, MuscleGroup
 from src.models.logs import (
+    LogBatchItemStatus,
+    LogBatchRequest,
+    LogBatchResponse,
     WorkoutLogCreate,
     WorkoutLogResponse,
     WorkoutLogSummary,
     WorkoutLogUpdate,
+    PerformanceBucket,
+    TrainingVolumeSeries,
+    WorkoutStats,
     SetLogCreate,
     SetLogUpdate,
     SetLogResponse,
@@ -35,9 +44,11 @@ from src.models.logs import (
     SetStepLogUpdate,
     SetStepLogResponse,
 )
-from src.repositories.user_repository import UserRepository
-from src.repositories.workout_repository import WorkoutRepository
+from src.repositories.workout_repository import WorkoutRepository, workout_response_cache
 from src.repositories.log_repository import LogRepository
+from src.repositories.pagination import next_cursor
+from src.repositories.training_volume_repository import TrainingVolumeRepository
+from src.repositories.workout_stats_repository import WorkoutStatsRepository
 
 router = APIRouter(tags=["fitness"])
 logger = logging.getLogger(__name__)
@@ -47,17 +58,6 @@ logger = logging.getLogger(__name__)
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _resolve_user_id(user: UserContext, db: Session) -> uuid.UUID:
-    """Look up the internal user_id from the Auth0 sub claim."""
-    db_user = UserRepository(db).get_by_auth0_sub(user.auth0_sub)
-    if db_user is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found – call /users/sync first",
-        )
-    return db_user.user_id
-
-
 def _workout_to_response(w) -> WorkoutResponse:
     """Map an ORM Workout (with eager-loaded tree) to the Pydantic response."""
     sets_list = getattr(w, "sets", []) or []
@@ -89,7 +89,7 @@ def _workout_to_response(w) -> WorkoutResponse:
                     ExerciseSummary(
                         exercise_id=s.exercise.exercise_id,
                         name=s.exercise.name,
-                        primary_muscle_group=s.exercise.primary_muscle_group,
+                        primary_muscle_group=MUSCLE_GROUP_LOOKUP.get(s.exercise.primary_muscle_group),
                     )
                     if s.exercise
                     else None
@@ -115,7 +115,7 @@ def create_workout(
     Sets may reference an existing exercise (``exercise_id``) or create one
     inline (``new_exercise``). See ``SetCreate`` for details.
     """
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = WorkoutRepository(db)
     try:
         workout = repo.create_workout(data, user_id)
@@ -126,19 +126,32 @@ def create_workout(
 
 @router.get("/workouts", response_model=List[WorkoutSummary])
 def list_workouts(
+    response: Response,
     shared: bool = Query(False, description="If true, list public workouts instead of own"),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page; overrides offset"),
     user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List workout summaries (own or shared)."""
+    """List workout summaries (own or shared).
+
+    When more rows may follow, the ``X-Next-Cursor`` response header holds
+    the cursor for the next page.
+    """
     repo = WorkoutRepository(db)
-    if shared:
-        workouts = repo.list_shared(offset=offset, limit=limit)
-    else:
-        user_id = _resolve_user_id(user, db)
-        workouts = repo.list_by_creator(user_id, offset=offset, limit=limit)
+    try:
+        if shared:
+            workouts = repo.list_shared(offset=offset, limit=limit, cursor=cursor)
+        else:
+            user_id = resolve_user_id(user, db)
+            workouts = repo.list_by_creator(user_id, offset=offset, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    cursor_out = next_cursor(workouts, limit, "created_at", "workout_id")
+    if cursor_out:
+        response.headers["X-Next-Cursor"] = cursor_out
 
     return [
         WorkoutSummary(
@@ -151,18 +164,72 @@ def list_workouts(
     ]
 
 
+@router.get("/workouts/stats", response_model=WorkoutStats)
+def get_workout_stats(
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Totals and this-week/this-month counts of the current user's finished workouts.
+
+    Read from the user's rollup row, which logging keeps current.
+    """
+    user_id = resolve_user_id(user, db)
+    return WorkoutStatsRepository(db).get_stats(user_id)
+
+
+@router.get("/workouts/volume", response_model=TrainingVolumeSeries)
+def get_training_volume(
+    bucket: PerformanceBucket = Query(PerformanceBucket.DAY, description="Sum per day, week or month"),
+    start_date: Optional[date] = Query(None, description="First day to include"),
+    end_date: Optional[date] = Query(None, description="Last day to include"),
+    exercise_id: Optional[uuid.UUID] = Query(None, description="Only this exercise"),
+    muscle_group: Optional[MuscleGroup] = Query(None, description="Only exercises for this muscle group"),
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """The current user's training volume (reps × weight), sets and reps over time.
+
+    Returned as parallel arrays (``dates[i]`` ↔ ``volume[i]``, ``sets[i]``,
+    ``reps[i]``) read from the daily rollup.
+    """
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="start_date is after end_date")
+    user_id = resolve_user_id(user, db)
+    return TrainingVolumeRepository(db).series(
+        user_id,
+        bucket=bucket,
+        start_date=start_date,
+        end_date=end_date,
+        exercise_id=exercise_id,
+        muscle_group=muscle_group,
+    )
+
+
 @router.get("/workouts/{workout_id}", response_model=WorkoutResponse)
 def get_workout(
     workout_id: uuid.UUID,
+    request: Request,
     user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get a single workout with its full set/step tree."""
+    """Get a single workout with its full set/step tree.
+
+    Carries a strong ``ETag``. The body is cached per version stamp, so a
+    repeat fetch — or a ``304`` for a matching ``If-None-Match`` — costs
+    one version lookup instead of loading the tree.
+    """
     repo = WorkoutRepository(db)
-    workout = repo.get_with_tree(workout_id)
-    if workout is None:
+    version = repo.get_version(workout_id)
+    if version is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
-    return _workout_to_response(workout)
+
+    def build() -> WorkoutResponse:
+        workout = repo.get_with_tree(workout_id)
+        if workout is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
+        return _workout_to_response(workout)
+
+    return cached_json_response(request, workout_response_cache, workout_id, version, build)
 
 
 @router.patch("/workouts/{workout_id}", response_model=WorkoutResponse)
@@ -173,7 +240,7 @@ def update_workout(
     db: Session = Depends(get_db),
 ):
     """Update top-level workout fields."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = WorkoutRepository(db)
     workout = repo.get_with_tree(workout_id)
     if workout is None:
@@ -191,7 +258,7 @@ def delete_workout(
     db: Session = Depends(get_db),
 ):
     """Soft-delete a workout."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = WorkoutRepository(db)
     workout = repo.get_by_id(workout_id)
     if workout is None:
@@ -240,7 +307,7 @@ def _log_to_response(log) -> WorkoutLogResponse:
                     ExerciseSummary(
                         exercise_id=sl.exercise.exercise_id,
                         name=sl.exercise.name,
-                        primary_muscle_group=sl.exercise.primary_muscle_group,
+                        primary_muscle_group=MUSCLE_GROUP_LOOKUP.get(sl.exercise.primary_muscle_group),
                     )
                     if sl.exercise
                     else None
@@ -257,24 +324,44 @@ def start_workout_log(
     user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Start a new workout log session."""
-    user_id = _resolve_user_id(user, db)
+    """Start a new workout log session, or record a complete one.
+
+    ``set_logs`` (with nested steps) may be included to log a finished
+    session — e.g. a watch import or history backfill — in a single call.
+    """
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    log = repo.create_workout_log(data, user_id)
+    try:
+        log = repo.create_workout_log(data, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     return _log_to_response(log)
 
 
 @router.get("/workouts/logs", response_model=List[WorkoutLogSummary])
 def list_workout_logs(
+    response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page; overrides offset"),
     user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List workout log summaries for the current user."""
-    user_id = _resolve_user_id(user, db)
+    """List workout log summaries for the current user, newest first.
+
+    When more rows may follow, the ``X-Next-Cursor`` response header holds
+    the cursor for the next page.
+    """
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    logs = repo.list_by_user(user_id, offset=offset, limit=limit)
+    try:
+        logs = repo.list_by_user(user_id, offset=offset, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    cursor_out = next_cursor(logs, limit, "start_time", "workout_log_id")
+    if cursor_out:
+        response.headers["X-Next-Cursor"] = cursor_out
     return [
         WorkoutLogSummary(
             workout_log_id=l.workout_log_id,
@@ -294,7 +381,7 @@ def get_workout_log(
     db: Session = Depends(get_db),
 ):
     """Get a single workout log with its full set/step tree."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
     log = repo.get_with_tree(log_id)
     if log is None or log.user_id != user_id:
@@ -310,7 +397,7 @@ def finish_workout_log(
     db: Session = Depends(get_db),
 ):
     """Finish a workout log (set end_time, notes)."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
     log = repo.get_with_tree(log_id)
     if log is None or log.user_id != user_id:
@@ -319,6 +406,21 @@ def finish_workout_log(
     return _log_to_response(updated)
 
 
+@router.delete("/workouts/logs/{log_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_workout_log(
+    log_id: uuid.UUID,
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Delete a workout log with its set and step logs."""
+    user_id = resolve_user_id(user, db)
+    repo = LogRepository(db)
+    log = repo.get_by_id(log_id)
+    if log is None or log.user_id != user_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
+    repo.delete(log)
+
+
 # ---------------------------------------------------------------------------
 # Nested CRUD: Workout Sets
 # ---------------------------------------------------------------------------
@@ -331,7 +433,7 @@ def create_workout_set(
     db: Session = Depends(get_db),
 ):
     """Create a new set within a workout template."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = WorkoutRepository(db)
     
     # Verify ownership
@@ -339,7 +441,10 @@ def create_workout_set(
     if workout is None or workout.creator_id != user_id:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout not found")
     
-    set_obj = repo.create_set(workout_id, data, user_id)
+    try:
+        set_obj = repo.create_set(workout_id, data, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     return SetResponse.model_validate(set_obj)
 
 
@@ -352,7 +457,7 @@ def update_workout_set(
     db: Session = Depends(get_db),
 ):
     """Update a set within a workout template."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = WorkoutRepository(db)
     
     # Verify ownership
@@ -377,7 +482,7 @@ def delete_workout_set(
     db: Session = Depends(get_db),
 ):
     """Delete a set from a workout template."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = WorkoutRepository(db)
     
     # Verify ownership
@@ -398,6 +503,23 @@ def delete_workout_set(
 # Nested CRUD: Workout Log Sets & Steps
 # ---------------------------------------------------------------------------
 
+def _authorize_log_access(
+    repo: LogRepository,
+    log_id: uuid.UUID,
+    user_id: uuid.UUID,
+    set_log_id: Optional[uuid.UUID] = None,
+    step_log_id: Optional[uuid.UUID] = None,
+) -> None:
+    """404 unless the user owns the log and each child belongs to its parent."""
+    access = repo.check_access(log_id, user_id, set_log_id, step_log_id)
+    if not access.log:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
+    if set_log_id is not None and not access.set_log:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Set log not found")
+    if step_log_id is not None and not access.step_log:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Step log not found")
+
+
 @router.post("/workouts/logs/{log_id}/sets", response_model=SetLogResponse)
 def add_set_log(
     log_id: uuid.UUID,
@@ -406,17 +528,15 @@ def add_set_log(
     db: Session = Depends(get_db),
 ):
     """Add a set log mid-workout (reuse from template or create inline)."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    
-    # Verify ownership
-    log = repo.get_with_tree(log_id)
-    if log is None or log.user_id != user_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
-    
-    set_log = repo.add_set_log(log_id, data)
-    return SetLogResponse.model_validate(set_log)
+    _authorize_log_access(repo, log_id, user_id)
 
+    try:
+        set_log = repo.add_set_log(log_id, data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return SetLogResponse.model_validate(set_log)
 
 
 @router.patch("/workouts/logs/{log_id}/sets/{set_log_id}", response_model=SetLogResponse)
@@ -428,19 +548,11 @@ def update_set_log(
     db: Session = Depends(get_db),
 ):
     """Update a set log during/after workout."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    
-    # Verify ownership
-    log = repo.get_with_tree(log_id)
-    if log is None or log.user_id != user_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
-    
-    # Fetch the set log
+    _authorize_log_access(repo, log_id, user_id, set_log_id=set_log_id)
+
     set_log = repo.get_set_log(set_log_id)
-    if set_log is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Set log not found")
-    
     updated_set_log = repo.update_set_log(set_log, data)
     return SetLogResponse.model_validate(updated_set_log)
 
@@ -453,20 +565,11 @@ def delete_set_log(
     db: Session = Depends(get_db),
 ):
     """Remove a set log from a workout."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    
-    # Verify ownership
-    log = repo.get_with_tree(log_id)
-    if log is None or log.user_id != user_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
-    
-    # Fetch the set log
-    set_log = repo.get_set_log(set_log_id)
-    if set_log is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Set log not found")
-    
-    repo.delete_set_log(set_log)
+    _authorize_log_access(repo, log_id, user_id, set_log_id=set_log_id)
+
+    repo.delete_set_log(repo.get_set_log(set_log_id))
 
 
 @router.post("/workouts/logs/{log_id}/sets/{set_log_id}/steps", response_model=SetStepLogResponse)
@@ -478,14 +581,10 @@ def add_step_log(
     db: Session = Depends(get_db),
 ):
     """Add a step log to a set log during/after workout."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    
-    # Verify ownership
-    log = repo.get_with_tree(log_id)
-    if log is None or log.user_id != user_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
-    
+    _authorize_log_access(repo, log_id, user_id, set_log_id=set_log_id)
+
     step_log = repo.create_step_log(set_log_id, data)
     return SetStepLogResponse.model_validate(step_log)
 
@@ -500,19 +599,11 @@ def update_step_log(
     db: Session = Depends(get_db),
 ):
     """Update a step log during/after workout."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    
-    # Verify ownership
-    log = repo.get_with_tree(log_id)
-    if log is None or log.user_id != user_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
-    
-    # Fetch the step log
+    _authorize_log_access(repo, log_id, user_id, set_log_id=set_log_id, step_log_id=step_log_id)
+
     step_log = repo.get_step_log(step_log_id)
-    if step_log is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Step log not found")
-    
     updated_step_log = repo.update_step_log(step_log, data)
     return SetStepLogResponse.model_validate(updated_step_log)
 
@@ -526,17 +617,45 @@ def delete_step_log(
     db: Session = Depends(get_db),
 ):
     """Remove a step log from a set log."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = LogRepository(db)
-    
-    # Verify ownership
-    log = repo.get_with_tree(log_id)
-    if log is None or log.user_id != user_id:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workout log not found")
-    
-    # Fetch the step log
-    step_log = repo.get_step_log(step_log_id)
-    if step_log is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Step log not found")
-    
-    repo.delete_step_log(step_log)
+    _authorize_log_access(repo, log_id, user_id, set_log_id=set_log_id, step_log_id=step_log_id)
+
+    repo.delete_step_log(repo.get_step_log(step_log_id))
+
+
+@router.post("/workouts/logs/{log_id}/batch", response_model=LogBatchResponse)
+def apply_log_batch(
+    log_id: uuid.UUID,
+    data: LogBatchRequest,
+    user: UserContext = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Apply queued set/step log changes from an offline client in one request.
+
+    Operations run in order within a single transaction; each gets its own
+    result, and invalid ones are reported as ``failed`` without blocking the
+    rest. Creates carrying client IDs are idempotent, so a batch can be
+    safely resent after a dropped response.
+    """
+    user_id = resolve_user_id(user, db)
+    repo = LogRepository(db)
+    _authorize_log_access(repo, log_id, user_id)
+
+    try:
+        results = repo.apply_batch(log_id, data.operations)
+    except IntegrityError as e:
+        db.rollback()
+        logger.warning(f"Log batch for {log_id} conflicted: {e.orig}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Batch conflicts with concurrent changes to this workout log; nothing was applied",
+        )
+
+    failed = sum(1 for r in results if r.status == LogBatchItemStatus.FAILED)
+    return LogBatchResponse(
+        workout_log_id=log_id,
+        applied=len(results) - failed,
+        failed=failed,
+        results=results,
+    )
@@ -1,9 +1,13 @@
 """
 Health Check Endpoints
 """
+from typing import Any, Dict
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from src.db.session import get_pool_stats
+
 router = APIRouter()
 
 class HealthResponse(BaseModel):
@@ -14,3 +18,8 @@ class HealthResponse(BaseModel):
 async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "version": "1.0.0"}
+
+@router.get("/health/db-pool")
+async def db_pool_stats() -> Dict[str, Any]:
+    """Connection pool occupancy, checkout wait histogram and timeouts"""
+    return get_pool_stats()
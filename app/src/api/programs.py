@@ -5,10 +5,11 @@ import logging
 import uuid
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from src.auth.dependencies import get_current_user
+from src.api.etag import cached_json_response
+from src.auth.dependencies import get_current_user, resolve_user_id
 from src.auth.models import UserContext
 from src.db.session import get_db
 from src.models.programs import (
@@ -29,20 +30,17 @@ from src.models.program_assignments import (
     UserProgramAssignmentUpdate,
 )
 from src.models.workouts import WorkoutSummary
-from src.repositories.program_repository import ProgramAssignmentRepository, ProgramRepository
-from src.repositories.user_repository import UserRepository
+from src.repositories.pagination import next_cursor
+from src.repositories.program_repository import (
+    ProgramAssignmentRepository,
+    ProgramRepository,
+    program_response_cache,
+)
 
 router = APIRouter(tags=["programs"])
 logger = logging.getLogger(__name__)
 
 
-def _resolve_user_id(user: UserContext, db: Session) -> uuid.UUID:
-    db_user = UserRepository(db).get_by_auth0_sub(user.auth0_sub)
-    if db_user is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return db_user.user_id
-
-
 def _program_to_response(p) -> ProgramResponse:
     schedule = getattr(p, "program_workouts", []) or []
     return ProgramResponse(
@@ -85,7 +83,7 @@ def create_program(
     db: Session = Depends(get_db),
 ):
     """Create a program with its workout schedule."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramRepository(db)
     program = repo.create_program(data, user_id)
     return _program_to_response(program)
@@ -93,19 +91,32 @@ def create_program(
 
 @router.get("/programs", response_model=List[ProgramSummary])
 def list_programs(
+    response: Response,
     shared: bool = Query(False),
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page; overrides offset"),
     user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List programs (own or shared)."""
+    """List programs (own or shared).
+
+    When more rows may follow, the ``X-Next-Cursor`` response header holds
+    the cursor for the next page.
+    """
     repo = ProgramRepository(db)
-    if shared:
-        programs = repo.list_shared(offset=offset, limit=limit)
-    else:
-        user_id = _resolve_user_id(user, db)
-        programs = repo.list_by_creator(user_id, offset=offset, limit=limit)
+    try:
+        if shared:
+            programs = repo.list_shared(offset=offset, limit=limit, cursor=cursor)
+        else:
+            user_id = resolve_user_id(user, db)
+            programs = repo.list_by_creator(user_id, offset=offset, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    cursor_out = next_cursor(programs, limit, "created_at", "program_id")
+    if cursor_out:
+        response.headers["X-Next-Cursor"] = cursor_out
     return [
         ProgramSummary(
             program_id=p.program_id,
@@ -121,15 +132,28 @@ def list_programs(
 @router.get("/programs/{program_id}", response_model=ProgramResponse)
 def get_program(
     program_id: uuid.UUID,
+    request: Request,
     user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get a program with its full schedule."""
+    """Get a program with its full schedule.
+
+    Carries a strong ``ETag``. The body is cached per version stamp, so a
+    repeat fetch — or a ``304`` for a matching ``If-None-Match`` — costs
+    one version lookup instead of loading the schedule.
+    """
     repo = ProgramRepository(db)
-    program = repo.get_with_schedule(program_id)
-    if program is None:
+    version = repo.get_version(program_id)
+    if version is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
-    return _program_to_response(program)
+
+    def build() -> ProgramResponse:
+        program = repo.get_with_schedule(program_id)
+        if program is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Program not found")
+        return _program_to_response(program)
+
+    return cached_json_response(request, program_response_cache, program_id, version, build)
 
 
 @router.patch("/programs/{program_id}", response_model=ProgramResponse)
@@ -140,7 +164,7 @@ def update_program(
     db: Session = Depends(get_db),
 ):
     """Update a program's top-level fields."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramRepository(db)
     program = repo.get_with_schedule(program_id)
     if program is None:
@@ -158,7 +182,7 @@ def delete_program(
     db: Session = Depends(get_db),
 ):
     """Soft-delete a program."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramRepository(db)
     program = repo.get_by_id(program_id)
     if program is None:
@@ -180,7 +204,7 @@ def enroll_in_program(
     db: Session = Depends(get_db),
 ):
     """Enrol the current user in a program."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     # Validate program exists
     p_repo = ProgramRepository(db)
     if p_repo.get_by_id(program_id) is None:
@@ -208,7 +232,7 @@ def list_assignments(
     db: Session = Depends(get_db),
 ):
     """List the current user's program assignments."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramAssignmentRepository(db)
     assignments = repo.list_by_user(user_id, status=assignment_status, offset=offset, limit=limit)
     return [
@@ -232,7 +256,7 @@ def get_assignment(
     db: Session = Depends(get_db),
 ):
     """Get a single assignment with its workout logs."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramAssignmentRepository(db)
     assignment = repo.get_with_logs(assignment_id)
     if assignment is None or assignment.user_id != user_id:
@@ -248,7 +272,7 @@ def update_assignment(
     db: Session = Depends(get_db),
 ):
     """Update assignment status (pause, resume, complete, abandon)."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramAssignmentRepository(db)
     assignment = repo.get_with_logs(assignment_id)
     if assignment is None or assignment.user_id != user_id:
@@ -264,7 +288,7 @@ def get_assignment_progress(
     db: Session = Depends(get_db),
 ):
     """Get calculated progress for an assignment."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramAssignmentRepository(db)
     assignment = repo.get_by_id(assignment_id)
     if assignment is None or assignment.user_id != user_id:
@@ -286,7 +310,7 @@ def update_program_workout_log(
     db: Session = Depends(get_db),
 ):
     """Mark a scheduled workout as complete, skipped, or update notes."""
-    user_id = _resolve_user_id(user, db)
+    user_id = resolve_user_id(user, db)
     repo = ProgramAssignmentRepository(db)
     assignment = repo.get_by_id(assignment_id)
     if assignment is None or assignment.user_id != user_id:
@@ -1,18 +1,22 @@
 """
 Auth0 JWT Validation and Token Handling
 """
+import asyncio
 import json
 import logging
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import requests
 from jose import JWTError, jwt
+from jose.backends.base import Key
 from jose.exceptions import JWTClaimsError
 from datetime import datetime, timedelta
 
 from src.config import settings
-from src.auth.models import TokenPayload, JWKS
+from src.auth.models import TokenPayload
+from src.auth.jwks import JWKSKeyStore
+from src.auth.token_cache import VerifiedTokenCache
 
 logger = logging.getLogger(__name__)
 
@@ -30,22 +34,35 @@ class Auth0Manager:
             )
         self.audience = settings.AUTH0_API_AUDIENCE or f"https://{self.domain}/api/v2/"
         self.issuer = f"https://{self.domain}/"
-        self.jwks_client = None
+        self.key_store = JWKSKeyStore(
+            f"{self.issuer}.well-known/jwks.json",
+            refresh_interval=settings.AUTH0_JWKS_REFRESH_SECONDS,
+            min_refetch_interval=settings.AUTH0_JWKS_MIN_REFETCH_SECONDS,
+        )
+        self.token_cache = VerifiedTokenCache(
+            max_size=settings.AUTH0_TOKEN_CACHE_MAX_SIZE,
+            enabled=settings.AUTH0_TOKEN_CACHE_ENABLED,
+        )
+        self._verify_executor = ThreadPoolExecutor(
+            max_workers=settings.AUTH0_VERIFY_MAX_WORKERS,
+            thread_name_prefix="auth0-verify",
+        )
     
-    @lru_cache(maxsize=1)
-    def get_jwks(self) -> JWKS:
-        """Fetch and cache Auth0 JWKS (public keys) for token validation"""
+    async def startup(self) -> None:
+        """Load signing keys asynchronously and start the background refresh"""
         try:
-            response = requests.get(f"{self.issuer}.well-known/jwks.json", timeout=5)
-            response.raise_for_status()
-            jwks_data = response.json()
-            return JWKS(**jwks_data)
-        except Exception as e:
-            logger.error(f"Failed to fetch Auth0 JWKS: {str(e)}")
-            raise
+            await self.key_store.ensure_loaded_async()
+        except JWTError:
+            logger.warning("Starting without Auth0 signing keys; the background refresh will retry")
+        self.key_store.start()
     
-    def get_public_key(self, token: str) -> str:
-        """Extract the public key from JWKS for the given token"""
+    def close(self) -> None:
+        """Stop background refresh and release the verification pool"""
+        self.key_store.stop()
+        self._verify_executor.shutdown(wait=False)
+    
+    def get_public_key(self, token: str) -> Key:
+        """Return the verification key from the JWKS key store for the given token"""
         try:
             # Decode without verification to get the header
             unverified_header = jwt.get_unverified_header(token)
@@ -53,58 +70,19 @@ class Auth0Manager:
             logger.error(f"Failed to decode JWT header: {str(e)}")
             raise
         
-        # Get JWKS and find matching key by kid
-        jwks = self.get_jwks()
         kid = unverified_header.get("kid")
-        
         if not kid:
             raise JWTError("Token does not contain 'kid' in header")
         
-        for key in jwks.keys:
-            if key.kid == kid:
-                # Convert JWK to PEM format for verification
-                return self._jwk_to_pem(key)
-        
-        raise JWTError(f"Unable to find matching key with kid: {kid}")
-    
-    @staticmethod
-    def _jwk_to_pem(jwk) -> str:
-        """Convert JWK to PEM format for PyJWT validation"""
-        from cryptography.hazmat.primitives import serialization
-        from cryptography.hazmat.backends import default_backend
-        from cryptography.hazmat.primitives.asymmetric import rsa
-        import base64
-        
-        # Decode base64url encoded values
-        def _decode_base64_url(data: str) -> bytes:
-            # Add padding if necessary
-            padding = 4 - len(data) % 4
-            if padding != 4:
-                data += '=' * padding
-            return base64.urlsafe_b64decode(data)
-        
-        # Extract components
-        n_bytes = _decode_base64_url(jwk.n)
-        e_bytes = _decode_base64_url(jwk.e)
-        
-        # Convert to integers
-        n = int.from_bytes(n_bytes, byteorder='big')
-        e = int.from_bytes(e_bytes, byteorder='big')
-        
-        # Create RSA public key
-        public_key = rsa.RSAPublicNumbers(e, n).public_key(default_backend())
-        
-        # Convert to PEM format
-        pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return pem.decode('utf-8')
+        return self.key_store.get_key(kid)
     
     def verify_token(self, token: str) -> TokenPayload:
         """
         Verify Auth0 JWT token and extract claims
         
+        Previously verified tokens are served from ``token_cache`` until
+        their ``exp`` claim, skipping the signature check and key lookup.
+        
         Args:
             token: JWT token from Authorization header
             
@@ -115,6 +93,30 @@ class Auth0Manager:
             JWTError: If token is invalid or verification fails
             JWTClaimsError: If token claims are invalid
         """
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+        return self._verify_uncached(token)
+    
+    async def verify_token_async(self, token: str) -> TokenPayload:
+        """
+        Verify a token without blocking the event loop
+        
+        Cache hits are answered inline. Otherwise the JWKS is loaded through
+        the async HTTP client if it has never been fetched, and the RSA
+        signature check runs on a bounded thread pool
+        (``AUTH0_VERIFY_MAX_WORKERS``).
+        """
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+        
+        await self.key_store.ensure_loaded_async()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._verify_executor, self._verify_uncached, token)
+    
+    def _verify_uncached(self, token: str) -> TokenPayload:
+        """Run the full signature and claims check, caching the result"""
         try:
             # Get public key for this token
             public_key = self.get_public_key(token)
@@ -135,6 +137,7 @@ class Auth0Manager:
             
             # Extract and validate claims
             token_payload = TokenPayload(**payload)
+            self.token_cache.put(token, token_payload)
             
             logger.info(f"Token verified for user: {token_payload.sub}")
             return token_payload
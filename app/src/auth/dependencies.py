@@ -2,15 +2,18 @@
 FastAPI Dependencies for Auth0 Protected Routes
 """
 import logging
+import uuid
 from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
 
 from src.auth.auth0 import auth0_manager
 from src.auth.models import UserContext, TokenPayload
 from jose import JWTError
 from jose.exceptions import JWTClaimsError
+from src.repositories.user_repository import UserRepository
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,9 @@ async def get_current_user(
     """
     Dependency: Extract and validate user from Auth0 token
     
+    Verification is awaited via ``verify_token_async`` so the RSA check and
+    any JWKS fetch never run on the event loop.
+    
     Usage:
         @app.get("/api/v1/workouts")
         async def get_workouts(user: UserContext = Depends(get_current_user)):
@@ -39,7 +45,7 @@ async def get_current_user(
     
     try:
         # Verify and decode token
-        token_payload: TokenPayload = auth0_manager.verify_token(token)
+        token_payload: TokenPayload = await auth0_manager.verify_token_async(token)
         
         # Build user context from token claims
         user_context = UserContext(
@@ -74,3 +80,22 @@ async def get_current_user(
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
+
+
+def resolve_user_id(user: UserContext, db: Session) -> uuid.UUID:
+    """
+    Look up the internal user_id for the authenticated Auth0 subject
+    
+    Served from the process-wide ``user_id_cache`` when possible, so most
+    requests skip the Users round trip entirely.
+    
+    Raises:
+        HTTPException 404: If the user has not been synced yet
+    """
+    user_id = UserRepository(db).resolve_user_id(user.auth0_sub)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found – call /users/sync first",
+        )
+    return user_id
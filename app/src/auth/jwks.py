@@ -0,0 +1,200 @@
+"""
+Auth0 JWKS key store with background refresh
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+
+import httpx
+import requests
+from jose import JWTError, jwk
+from jose.backends.base import Key
+
+from src.auth.models import JWKS
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_jwks(url: str, timeout: float = 5) -> JWKS:
+    """Fetch a JWKS document over HTTP"""
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return JWKS(**response.json())
+
+
+async def fetch_jwks_async(url: str, timeout: float = 5) -> JWKS:
+    """Fetch a JWKS document with the async HTTP client"""
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        return JWKS(**response.json())
+
+
+class JWKSKeyStore:
+    """Holds Auth0 signing keys indexed by ``kid`` as ready-to-use key objects.
+
+    Keys are constructed once per fetch rather than once per request. A daemon
+    thread (see ``start``) refreshes the set on a fixed interval, and an
+    unknown ``kid`` schedules a rate-limited background refetch so that key
+    rotation is picked up without any request waiting on the network. Async
+    callers bootstrap an empty store with ``ensure_loaded_async``; a sync
+    lookup on an empty store schedules the same background fetch and fails
+    fast, and the scheduler keeps retrying until the first fetch succeeds.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        refresh_interval: float = 3600,
+        min_refetch_interval: float = 30,
+        fetcher: Optional[Callable[[str], JWKS]] = None,
+        async_fetcher: Optional[Callable[[str], Awaitable[JWKS]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self.min_refetch_interval = min_refetch_interval
+        self._fetcher = fetcher or fetch_jwks
+        self._async_fetcher = async_fetcher or fetch_jwks_async
+        self._clock = clock
+        self._keys: Dict[str, Key] = {}
+        self._loaded = False
+        self._last_fetch_attempt: Optional[float] = None
+        self._lock = threading.Lock()
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._scheduler_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def kids(self) -> list:
+        return list(self._keys)
+
+    # -- refresh -------------------------------------------------------------
+
+    def load(self, jwks: JWKS) -> None:
+        """Replace the key set with the keys in ``jwks``"""
+        keys: Dict[str, Key] = {}
+        for key in jwks.keys:
+            if key.kty != "RSA":
+                continue
+            try:
+                keys[key.kid] = jwk.construct(key.model_dump(), key.alg or "RS256")
+            except Exception as e:
+                logger.warning(f"Skipping unusable JWKS key {key.kid}: {str(e)}")
+        # Swap the whole dict so readers never see a partially built set
+        self._keys = keys
+        self._loaded = True
+
+    def refresh(self) -> bool:
+        """Fetch the JWKS now. Keeps the previous keys if the fetch fails."""
+        self._last_fetch_attempt = self._clock()
+        try:
+            jwks = self._fetcher(self.jwks_url)
+        except Exception as e:
+            logger.error(f"Failed to fetch Auth0 JWKS: {str(e)}")
+            return False
+        self.load(jwks)
+        logger.info(f"Loaded {len(self._keys)} Auth0 signing key(s)")
+        return True
+
+    async def refresh_async(self) -> bool:
+        """Fetch the JWKS with the async HTTP client"""
+        self._last_fetch_attempt = self._clock()
+        try:
+            jwks = await self._async_fetcher(self.jwks_url)
+        except Exception as e:
+            logger.error(f"Failed to fetch Auth0 JWKS: {str(e)}")
+            return False
+        self.load(jwks)
+        logger.info(f"Loaded {len(self._keys)} Auth0 signing key(s)")
+        return True
+
+    async def ensure_loaded_async(self) -> None:
+        """Bootstrap an empty store without blocking the event loop
+
+        Concurrent callers share one fetch. After a failed fetch, callers
+        within ``min_refetch_interval`` fail fast instead of fetching again.
+
+        Raises:
+            JWTError: If the store is still empty
+        """
+        if self._loaded:
+            return
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            last = self._last_fetch_attempt
+            if not self._loaded and (last is None or self._clock() - last >= self.min_refetch_interval):
+                await self.refresh_async()
+        if not self._loaded:
+            raise JWTError("Auth0 signing keys are not loaded yet")
+
+    def request_refresh(self) -> bool:
+        """Schedule a background refetch unless one ran too recently.
+
+        Returns True if a refetch was scheduled.
+        """
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            last = self._last_fetch_attempt
+            if last is not None and self._clock() - last < self.min_refetch_interval:
+                return False
+            self._last_fetch_attempt = self._clock()
+            self._refresh_thread = threading.Thread(
+                target=self.refresh, name="jwks-refetch", daemon=True
+            )
+            self._refresh_thread.start()
+            return True
+
+    # -- lookup --------------------------------------------------------------
+
+    def get_key(self, kid: str) -> Key:
+        """Return the verification key for ``kid``
+
+        Never fetches inline: while the store is empty, or the ``kid`` is
+        unknown, a rate-limited background refetch is requested instead.
+
+        Raises:
+            JWTError: If no key with this ``kid`` is known
+        """
+        if not self._loaded:
+            self.request_refresh()
+            raise JWTError("Auth0 signing keys are not loaded yet")
+
+        key = self._keys.get(kid)
+        if key is None:
+            self.request_refresh()
+            raise JWTError(f"Unable to find matching key with kid: {kid}")
+        return key
+
+    # -- scheduler -----------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the periodic background refresh (idempotent)"""
+        if self._scheduler_thread is not None and self._scheduler_thread.is_alive():
+            return
+        self._stop.clear()
+        self._scheduler_thread = threading.Thread(
+            target=self._run, name="jwks-refresh", daemon=True
+        )
+        self._scheduler_thread.start()
+
+    def stop(self) -> None:
+        """Stop the periodic background refresh"""
+        self._stop.set()
+
+    def _run(self) -> None:
+        # Until the first fetch succeeds, retry at the refetch rate limit
+        while not self._loaded and not self.refresh():
+            if self._stop.wait(self.min_refetch_interval):
+                return
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
@@ -0,0 +1,62 @@
+"""
+In-process cache of verified Auth0 tokens
+"""
+import hashlib
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.auth.models import TokenPayload
+from src.cache import TTLCache
+
+
+class VerifiedTokenCache:
+    """Bounded LRU cache of decoded token payloads, keyed by token hash.
+
+    A ``TTLCache`` on the wall clock whose entries expire at the token's own
+    ``exp`` claim, so a cached payload is never returned for a token that
+    ``jwt.decode`` would reject as expired. Tokens without an ``exp`` claim
+    are never cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._clock = clock
+        self._entries: TTLCache[TokenPayload] = TTLCache(
+            max_size=max_size if enabled else 0, ttl=float("inf"), clock=clock
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._entries.enabled
+
+    @staticmethod
+    def _key(token: str) -> str:
+        """Hash the raw token so bearer credentials are not held in memory."""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[TokenPayload]:
+        """Return the cached payload for ``token`` if present and unexpired."""
+        if not self.enabled:
+            return None
+        return self._entries.get(self._key(token))
+
+    def put(self, token: str, payload: TokenPayload) -> None:
+        """Cache a verified payload until its ``exp`` claim."""
+        if not self.enabled or payload.exp is None:
+            return
+        ttl = payload.exp - self._clock()
+        if ttl <= 0:
+            return
+        self._entries.set(self._key(token), payload, ttl=ttl)
+
+    def clear(self) -> None:
+        """Drop all cached entries (counters are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit-rate counters."""
+        return self._entries.stats()
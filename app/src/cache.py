@@ -0,0 +1,261 @@
+"""
+In-process caching helpers
+"""
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, NamedTuple, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe, size-bounded LRU cache whose entries expire after ``ttl`` seconds.
+
+    A ``ttl`` or ``max_size`` of 0 disables the cache (every ``get`` misses).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+
+class CachedResponse(NamedTuple):
+    version: Hashable
+    etag: str
+    body: bytes
+
+
+class ResponseCache:
+    """Serialized response bodies keyed by entity ID, each tagged with the
+    version stamp it was built from.
+
+    An entry is only served for that exact version, so a write made by
+    another worker (which moves the version in the database) is never
+    served stale; local writes also ``invalidate`` to free the slot early.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2000,
+        ttl: float = 600,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._entries: TTLCache[CachedResponse] = TTLCache(max_size=max_size, ttl=ttl, clock=clock)
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        """Strong ETag: a digest of the exact response bytes."""
+        return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry.version != version:
+            return None
+        return entry
+
+    def put(self, key: Hashable, version: Hashable, body: bytes) -> CachedResponse:
+        entry = CachedResponse(version, self.make_etag(body), body)
+        self._entries.set(key, entry)
+        return entry
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._entries.stats()
+
+
+class CacheBackend(ABC):
+    """Key/value store shared by worker processes (e.g. Redis or Memcached).
+
+    Values are bytes. Implementations must be thread-safe; any failure
+    should be raised, and callers treat it as a miss. A subclass missing
+    one of the methods cannot be instantiated.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment a counter (missing counters start at 0)."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Process-local ``CacheBackend``, for tests and single-worker setups."""
+
+    def __init__(self, max_size: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self._values: TTLCache[bytes] = TTLCache(max_size=max_size, ttl=float("inf"), clock=clock)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key in self._counters:
+                return str(self._counters[key]).encode("ascii")
+        return self._values.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._values.set(key, value, ttl=ttl)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class CatalogCache:
+    """Time-bounded cache for pages of a listing that is the same for every
+    user (e.g. the shared workout catalog).
+
+    Level 1 is a per-process ``TTLCache``; level 2 an optional
+    ``CacheBackend`` shared by all workers. Keys embed a generation number
+    that ``invalidate`` bumps, retiring every cached page at once — in all
+    workers when the generation lives in a shared backend, otherwise only
+    locally, with other workers converging within ``ttl``.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_size: int = 1000,
+        ttl: float = 60,
+        backend: Optional[CacheBackend] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.backend = backend
+        self._local: TTLCache[bytes] = TTLCache(max_size=max_size, ttl=ttl, clock=clock)
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._local.enabled
+
+    def use_backend(self, backend: Optional[CacheBackend]) -> None:
+        """Attach (or detach, with None) a shared backend."""
+        self.backend = backend
+        self._local.clear()
+
+    def get(self, params: Hashable) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        generation = self._current_generation()
+        value = self._local.get((generation, params))
+        if value is None and self.backend is not None:
+            value = self._backend_call(self.backend.get, self._key(generation, params))
+            if value is not None:
+                self._local.set((generation, params), value)
+        return value
+
+    def set(self, params: Hashable, value: bytes) -> None:
+        if not self.enabled:
+            return
+        generation = self._current_generation()
+        self._local.set((generation, params), value)
+        if self.backend is not None:
+            self._backend_call(self.backend.set, self._key(generation, params), value, self.ttl)
+
+    def invalidate(self) -> None:
+        """Retire every cached page."""
+        self._local.clear()
+        if self.backend is not None:
+            self._backend_call(self.backend.incr, f"{self.namespace}:gen")
+        else:
+            self._generation += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._local.stats(), "shared_backend": self.backend is not None}
+
+    def _current_generation(self) -> int:
+        if self.backend is None:
+            return self._generation
+        raw = self._backend_call(self.backend.get, f"{self.namespace}:gen")
+        return int(raw) if raw is not None else 0
+
+    def _key(self, generation: int, params: Hashable) -> str:
+        return f"{self.namespace}:{generation}:{params!r}"
+
+    @staticmethod
+    def _backend_call(fn: Callable[..., Any], *args: Any) -> Any:
+        # A shared-cache outage must degrade to a miss, never fail the request
+        try:
+            return fn(*args)
+        except Exception:
+            return None
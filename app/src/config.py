@@ -2,7 +2,7 @@
 Application Configuration
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Literal
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
@@ -19,6 +19,23 @@ class Settings(BaseSettings):
     DB_USER: str = ""
     DB_PASSWORD: str = ""
     DB_ODBC_DRIVER: str = "ODBC Driver 17 for SQL Server"
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Replace connections older than this; -1 disables
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "always"
+    DB_POOL_PRE_PING_IDLE_SECONDS: int = 300  # Threshold for DB_POOL_PRE_PING=idle
+    DB_ASYNC_ENABLED: bool = False  # Enable the AsyncSession / get_async_db path
+    DB_ASYNC_URL: str = ""  # Optional override, e.g. sqlite+aiosqlite:///./local.db
+    
+    # Cache Settings
+    USER_ID_CACHE_TTL_SECONDS: int = 300  # auth0_sub -> user_id; 0 disables
+    USER_ID_CACHE_MAX_SIZE: int = 10000
+    TREE_CACHE_TTL_SECONDS: int = 600  # GET /workouts/{id}, /programs/{id} bodies; 0 disables
+    TREE_CACHE_MAX_SIZE: int = 2000
+    CATALOG_CACHE_TTL_SECONDS: int = 60  # Shared workout/program list pages; 0 disables
+    CATALOG_CACHE_MAX_SIZE: int = 1000
+    EXERCISE_CATALOG_REFRESH_SECONDS: float = 5.0  # GET /exercises served from memory; 0 disables
     
     # Azure Settings
     AZURE_SUBSCRIPTION_ID: str = ""
@@ -34,6 +51,11 @@ class Settings(BaseSettings):
     AUTH0_CLIENT_ID_NATIVE: str = ""
     AUTH0_CLIENT_SECRET_NATIVE: str = ""
     AUTH0_API_AUDIENCE: str = ""  # API identifier from Auth0
+    AUTH0_JWKS_REFRESH_SECONDS: int = 3600  # Background JWKS refresh interval
+    AUTH0_JWKS_MIN_REFETCH_SECONDS: int = 30  # Rate limit for unknown-kid refetches
+    AUTH0_VERIFY_MAX_WORKERS: int = 4  # Threads for off-loop signature verification
+    AUTH0_TOKEN_CACHE_ENABLED: bool = True  # Cache verified tokens until their exp
+    AUTH0_TOKEN_CACHE_MAX_SIZE: int = 10000
     
     # Connection string
     @property
@@ -42,6 +64,14 @@ class Settings(BaseSettings):
         driver = self.DB_ODBC_DRIVER.replace(" ", "+")
         return f"mssql+pyodbc://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_SERVER}:{self.DB_PORT}/{self.DB_NAME}?driver={driver}"
     
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """Construct async (aioodbc) connection string unless overridden"""
+        if self.DB_ASYNC_URL:
+            return self.DB_ASYNC_URL
+        driver = self.DB_ODBC_DRIVER.replace(" ", "+")
+        return f"mssql+aioodbc://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_SERVER}:{self.DB_PORT}/{self.DB_NAME}?driver={driver}"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
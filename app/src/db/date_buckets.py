@@ -0,0 +1,77 @@
+"""
+Calendar bucketing of datetime columns for grouped aggregates.
+
+``day_start(col)``, ``week_start(col)`` and ``month_start(col)`` render as
+the first day (a DATE) of the day, ISO week (Monday) or month containing
+``col``, so a query can ``GROUP BY`` them directly. ``day_number(col)`` is
+the day as an integer count from ``DAY_NUMBER_EPOCH``, for callers that
+build arrays rather than date objects. The default rendering is T-SQL;
+``src.db.sqlite_compat`` registers the SQLite equivalents.
+"""
+
+from datetime import date
+
+from sqlalchemy import Date, Integer
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class _DateBucket(FunctionElement):
+    type = Date()
+    inherit_cache = True
+
+
+class day_start(_DateBucket):
+    name = "day_start"
+    inherit_cache = True
+
+
+class week_start(_DateBucket):
+    name = "week_start"
+    inherit_cache = True
+
+
+class month_start(_DateBucket):
+    name = "month_start"
+    inherit_cache = True
+
+
+class day_number(FunctionElement):
+    type = Integer()
+    name = "day_number"
+    inherit_cache = True
+
+
+# Day 0 of day_number (T-SQL's datetime 0)
+DAY_NUMBER_EPOCH = date(1900, 1, 1)
+
+
+@compiles(day_start)
+def _compile_day_start(element, compiler, **kw):
+    return f"CAST({compiler.process(element.clauses, **kw)} AS DATE)"
+
+
+@compiles(week_start)
+def _compile_week_start(element, compiler, **kw):
+    # Day 0 (1900-01-01) was a Monday, so this ignores SET DATEFIRST
+    col = compiler.process(element.clauses, **kw)
+    return f"CAST(DATEADD(DAY, DATEDIFF(DAY, 0, {col}) / 7 * 7, 0) AS DATE)"
+
+
+@compiles(month_start)
+def _compile_month_start(element, compiler, **kw):
+    col = compiler.process(element.clauses, **kw)
+    return f"DATEFROMPARTS(YEAR({col}), MONTH({col}), 1)"
+
+
+@compiles(day_number)
+def _compile_day_number(element, compiler, **kw):
+    return f"DATEDIFF(DAY, 0, {compiler.process(element.clauses, **kw)})"
+
+
+# Keyed by period name ("day", "week", "month")
+BUCKET_START = {
+    "day": day_start,
+    "week": week_start,
+    "month": month_start,
+}
@@ -71,7 +71,18 @@ class User(Base):
 
 class Exercise(Base):
     __tablename__ = "Exercises"
-    __table_args__ = {"schema": "dbo"}
+    __table_args__ = (
+        CheckConstraint(
+            "PrimaryMuscleGroup IN ('chest', 'back', 'shoulders', 'biceps', 'triceps', 'forearms', "
+            "'abs', 'obliques', 'quads', 'hamstrings', 'glutes', 'calves', 'full_body', 'cardio')",
+            name="CK_Exercises_PrimaryMuscleGroup",
+        ),
+        CheckConstraint(
+            "DifficultyLevel IN ('beginner', 'intermediate', 'advanced')",
+            name="CK_Exercises_DifficultyLevel",
+        ),
+        {"schema": "dbo"},
+    )
 
     exercise_id: Mapped[uuid.UUID] = mapped_column(
         "ExerciseId", UNIQUEIDENTIFIER, primary_key=True, default=uuid.uuid4
@@ -80,6 +91,7 @@ class Exercise(Base):
         "CreatorId", UNIQUEIDENTIFIER, ForeignKey("dbo.Users.UserId", ondelete="SET NULL")
     )
     name: Mapped[str] = mapped_column("Name", String(255), unique=True, nullable=False)
+    name_normalized: Mapped[Optional[str]] = mapped_column("NameNormalized", String(255))  # see exercise_search.normalize_name
     description: Mapped[Optional[str]] = mapped_column("Description", Text)
     equipment_required: Mapped[Optional[str]] = mapped_column("EquipmentRequired", Text)  # JSON string
     primary_muscle_group: Mapped[Optional[str]] = mapped_column("PrimaryMuscleGroup", String(100))
@@ -94,6 +106,34 @@ class Exercise(Base):
     sets: Mapped[List["Set"]] = relationship(back_populates="exercise")
 
 
+class ExerciseNameToken(Base):
+    """One normalized word of an exercise name; keyed for prefix seeks on ``Token``."""
+    __tablename__ = "ExerciseNameTokens"
+    __table_args__ = (
+        Index("IX_ExerciseNameTokens_ExerciseId_Token", "ExerciseId", "Token"),
+        {"schema": "dbo"},
+    )
+
+    token: Mapped[str] = mapped_column("Token", String(64), primary_key=True)
+    exercise_id: Mapped[uuid.UUID] = mapped_column(
+        "ExerciseId", UNIQUEIDENTIFIER, ForeignKey("dbo.Exercises.ExerciseId", ondelete="CASCADE"), primary_key=True
+    )
+
+
+class ExerciseEquipment(Base):
+    """One canonical equipment name required by an exercise (see exercise_equipment)."""
+    __tablename__ = "ExerciseEquipment"
+    __table_args__ = (
+        Index("IX_ExerciseEquipment_Equipment_ExerciseId", "Equipment", "ExerciseId"),
+        {"schema": "dbo"},
+    )
+
+    exercise_id: Mapped[uuid.UUID] = mapped_column(
+        "ExerciseId", UNIQUEIDENTIFIER, ForeignKey("dbo.Exercises.ExerciseId", ondelete="CASCADE"), primary_key=True
+    )
+    equipment: Mapped[str] = mapped_column("Equipment", String(100), primary_key=True)
+
+
 # ---------------------------------------------------------------------------
 # Workouts
 # ---------------------------------------------------------------------------
@@ -280,6 +320,28 @@ class WorkoutLog(Base):
     program_workout_logs: Mapped[List["ProgramWorkoutLog"]] = relationship(back_populates="workout_log")
 
 
+class UserWorkoutStats(Base):
+    """Per-user rollup of finished workout logs, kept current by LogRepository.
+
+    ``WeekWorkouts``/``MonthWorkouts`` count finished logs that started in
+    the week (Monday) / month beginning ``WeekStart``/``MonthStart``; they
+    describe "this week" only while those dates are still current.
+    """
+    __tablename__ = "UserWorkoutStats"
+    __table_args__ = {"schema": "dbo"}
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        "UserId", UNIQUEIDENTIFIER, ForeignKey("dbo.Users.UserId", ondelete="CASCADE"), primary_key=True
+    )
+    total_workouts: Mapped[int] = mapped_column("TotalWorkouts", Integer, nullable=False, default=0)
+    total_duration_minutes: Mapped[int] = mapped_column("TotalDurationMinutes", Integer, nullable=False, default=0)
+    week_start: Mapped[Optional[date]] = mapped_column("WeekStart", Date)
+    week_workouts: Mapped[int] = mapped_column("WeekWorkouts", Integer, nullable=False, default=0)
+    month_start: Mapped[Optional[date]] = mapped_column("MonthStart", Date)
+    month_workouts: Mapped[int] = mapped_column("MonthWorkouts", Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column("UpdatedAt", DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
 # ---------------------------------------------------------------------------
 # SetLogs
 # ---------------------------------------------------------------------------
@@ -319,6 +381,10 @@ class SetStepLog(Base):
     __tablename__ = "SetStepLogs"
     __table_args__ = (
         UniqueConstraint("SetLogId", "StepOrder", name="IX_SetStepLogs_SetLogId_StepOrder"),
+        Index(
+            "IX_SetStepLogs_SetLogId_Performance", "SetLogId",
+            mssql_include=["CompletedReps", "CompletedWeight"],
+        ),
         {"schema": "dbo"},
     )
 
@@ -344,6 +410,57 @@ class SetStepLog(Base):
     original_set_step: Mapped[Optional["SetStep"]] = relationship(back_populates="set_step_logs")
 
 
+class DailyExerciseVolume(Base):
+    """Per-user, per-exercise training totals for one day (workout start date, UTC).
+
+    Materialized from set/step logs by LogRepository; ``Volume`` is
+    SUM(CompletedReps * CompletedWeight).
+    """
+    __tablename__ = "DailyExerciseVolume"
+    __table_args__ = (
+        Index(
+            "IX_DailyExerciseVolume_UserId_Day", "UserId", "Day",
+            mssql_include=["ExerciseId", "Sets", "Reps", "Volume"],
+        ),
+        {"schema": "dbo"},
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        "UserId", UNIQUEIDENTIFIER, ForeignKey("dbo.Users.UserId", ondelete="CASCADE"), primary_key=True
+    )
+    exercise_id: Mapped[uuid.UUID] = mapped_column(
+        "ExerciseId", UNIQUEIDENTIFIER, ForeignKey("dbo.Exercises.ExerciseId", ondelete="NO ACTION"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column("Day", Date, primary_key=True)
+    sets: Mapped[int] = mapped_column("Sets", Integer, nullable=False)
+    reps: Mapped[int] = mapped_column("Reps", Integer, nullable=False)
+    volume: Mapped[Decimal] = mapped_column("Volume", Numeric(18, 2), nullable=False)
+
+
+class PersonalRecord(Base):
+    """A user's heaviest logged weight for an exact rep count of an exercise.
+
+    Maintained by LogRepository. ``SetStepLogId`` is the step that set the
+    record (not a foreign key: deleting it triggers a recompute instead).
+    """
+    __tablename__ = "PersonalRecords"
+    __table_args__ = (
+        Index("IX_PersonalRecords_SetStepLogId", "SetStepLogId"),
+        {"schema": "dbo"},
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        "UserId", UNIQUEIDENTIFIER, ForeignKey("dbo.Users.UserId", ondelete="CASCADE"), primary_key=True
+    )
+    exercise_id: Mapped[uuid.UUID] = mapped_column(
+        "ExerciseId", UNIQUEIDENTIFIER, ForeignKey("dbo.Exercises.ExerciseId", ondelete="NO ACTION"), primary_key=True
+    )
+    reps: Mapped[int] = mapped_column("Reps", Integer, primary_key=True)
+    weight: Mapped[Decimal] = mapped_column("Weight", Numeric(10, 2), nullable=False)
+    set_step_log_id: Mapped[uuid.UUID] = mapped_column("SetStepLogId", UNIQUEIDENTIFIER, nullable=False)
+    achieved_at: Mapped[datetime] = mapped_column("AchievedAt", DateTime, nullable=False)
+
+
 # ---------------------------------------------------------------------------
 # UserProgramAssignments
 # ---------------------------------------------------------------------------
@@ -0,0 +1,130 @@
+"""
+Connection pool instrumentation and pre-ping strategies.
+
+``InstrumentedQueuePool`` / ``InstrumentedAsyncQueuePool`` time every
+checkout (including the wait for a free connection) into a ``PoolMetrics``
+histogram and count checkout timeouts, so pool exhaustion shows up in
+``/health/db-pool`` before it shows up as 500s.
+
+``install_idle_pre_ping`` implements the ``idle`` pre-ping strategy: only
+connections that sat in the pool longer than a threshold are pinged on
+checkout, instead of paying a round trip on every checkout.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram; a final bucket catches the rest
+WAIT_BUCKETS_MS: List[float] = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000]
+
+
+class PoolMetrics:
+    """Checkout wait-time histogram and timeout counter for one pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def observe_wait(self, seconds: float) -> None:
+        wait_ms = seconds * 1000
+        index = len(WAIT_BUCKETS_MS)
+        for i, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.checkouts += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"le_{bound:g}ms" for bound in WAIT_BUCKETS_MS] + ["le_inf"]
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "wait_ms_avg": (self.wait_ms_total / self.checkouts) if self.checkouts else 0.0,
+                "wait_ms_max": self.wait_ms_max,
+                "wait_histogram": dict(zip(labels, self.bucket_counts)),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times ``_do_get``, the pool's checkout path including queue waits."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.observe_wait(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """``QueuePool`` with checkout telemetry."""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` with checkout telemetry."""
+
+
+def install_idle_pre_ping(target: Any, idle_seconds: float) -> None:
+    """Ping a connection on checkout only if it was idle for ``idle_seconds``.
+
+    ``target`` is an Engine or Pool. A failed ping raises
+    ``DisconnectionError``, which makes the pool discard the connection and
+    retry with a fresh one, the same recovery ``pool_pre_ping`` performs.
+    """
+
+    @event.listens_for(target, "checkin")
+    def _record_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(target, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.close()
+        except Exception as e:
+            raise exc.DisconnectionError() from e
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """Current occupancy plus checkout metrics when the pool is instrumented."""
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            timeout_seconds=pool.timeout(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
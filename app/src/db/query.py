@@ -1,77 +1,131 @@
 """
-Database utilities for SQL Server connections
+Database utilities for raw SQL against SQL Server
+
+Queries run on connections borrowed from the shared engine pool
+(``src.db.session.get_engine``), so reporting scripts pay the TLS / login
+handshake once per process rather than once per query. Parameters are
+named (``:user_id``) and bound by SQLAlchemy; a tuple of positional
+parameters is still accepted for ``?``-style driver SQL.
+
+Failures are raised as ``QueryError`` subclasses so callers can tell a
+missing driver or an unreachable server from a bad statement.
 """
-from typing import List, Dict, Any
-import sys
-from pathlib import Path
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union
+
+from sqlalchemy import Engine, exc, text
 
-try:
-    import pyodbc
-    PYODBC_IMPORT_ERROR = None
-except Exception as import_error:
-    pyodbc = None
-    PYODBC_IMPORT_ERROR = import_error
+Params = Union[Mapping[str, Any], Sequence[Any], None]
 
-# Add parent directory to path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.config import settings
+class QueryError(RuntimeError):
+    """Base class for raw-SQL failures."""
 
 
-class DatabaseDriverError(RuntimeError):
+class DatabaseDriverError(QueryError):
     """Raised when database driver dependencies are unavailable."""
 
 
-def _get_pyodbc_module():
-    """Return pyodbc module or raise actionable error when unavailable."""
-    if pyodbc is None:
+class DatabaseConnectionError(QueryError):
+    """Raised when no usable connection could be obtained (server unreachable,
+    dropped connection, or pool checkout timeout)."""
+
+
+class QueryExecutionError(QueryError):
+    """Raised when the server rejects the statement."""
+
+
+class IntegrityViolationError(QueryExecutionError):
+    """Raised when the statement violates a constraint."""
+
+
+@contextmanager
+def _translate_errors(connecting: bool = False) -> Iterator[None]:
+    """Map driver / SQLAlchemy exceptions onto the ``QueryError`` hierarchy.
+
+    With ``connecting=True`` every database error means no connection could
+    be obtained; otherwise only invalidated connections count as such.
+    """
+    try:
+        yield
+    except QueryError:
+        raise
+    except ImportError as e:
         raise DatabaseDriverError(
             "pyodbc failed to load. On macOS, install ODBC runtime dependencies "
             "(e.g., unixODBC and Microsoft ODBC Driver for SQL Server) and reinstall pyodbc."
-        ) from PYODBC_IMPORT_ERROR
-
-    return pyodbc
-
-def get_connection_string() -> str:
-    """Build connection string from environment variables"""
-    db_server = settings.DB_SERVER
-    db_name = settings.DB_NAME
-    db_user = settings.DB_USER
-    db_password = settings.DB_PASSWORD
-    db_odbc_driver = settings.DB_ODBC_DRIVER
-    
-    if not all([db_server, db_name, db_user, db_password]):
-        raise ValueError("Missing database configuration in environment variables")
-    
-    return f"Driver={{{db_odbc_driver}}};Server=tcp:{db_server},1433;Database={db_name};Uid={db_user};Pwd={db_password};Encrypt=yes;TrustServerCertificate=no;Connection Timeout=30;"
-
-def execute_query(query: str, params: tuple = ()) -> List[Dict[str, Any]]:
-    """Execute a SELECT query and return results as list of dicts"""
-    conn = None
+        ) from e
+    except exc.TimeoutError as e:
+        raise DatabaseConnectionError(f"Timed out waiting for a pooled connection: {str(e)}") from e
+    except exc.DBAPIError as e:
+        if connecting or e.connection_invalidated:
+            raise DatabaseConnectionError(f"Database connection failed: {str(e.orig)}") from e
+        if isinstance(e, exc.IntegrityError):
+            raise IntegrityViolationError(f"Constraint violation: {str(e.orig)}") from e
+        raise QueryExecutionError(f"Database query failed: {str(e.orig)}") from e
+    except exc.SQLAlchemyError as e:
+        if connecting:
+            raise DatabaseConnectionError(f"Database connection failed: {str(e)}") from e
+        raise QueryExecutionError(f"Database query failed: {str(e)}") from e
 
-    try:
-        pyodbc_module = _get_pyodbc_module()
-        conn_str = get_connection_string()
-        conn = pyodbc_module.connect(conn_str)
-        cursor = conn.cursor()
-        
-        cursor.execute(query, params)
-
-        if cursor.description is None:
-            conn.commit()
-            return []
-
-        columns = [desc[0] for desc in cursor.description]
-        
-        results = []
-        for row in cursor.fetchall():
-            results.append(dict(zip(columns, row)))
-
-        conn.commit()
-        
-        return results
-    except Exception as e:
-        raise Exception(f"Database query failed: {str(e)}")
-    finally:
-        if conn is not None:
-            conn.close()
+
+def _resolve_engine(engine: Optional[Engine]) -> Engine:
+    if engine is not None:
+        return engine
+    from src.db.session import get_engine
+    return get_engine()
+
+
+def _execute(conn, query: str, params: Params):
+    if params is None or isinstance(params, Mapping):
+        return conn.execute(text(query), dict(params or {}))
+    return conn.exec_driver_sql(query, tuple(params))
+
+
+def execute_query(
+    query: str,
+    params: Params = None,
+    engine: Optional[Engine] = None,
+) -> List[Dict[str, Any]]:
+    """Execute a statement in its own transaction and return rows as dicts.
+
+    Statements that return no rows (INSERT / UPDATE / DDL) return ``[]``.
+
+    Raises:
+        QueryError: (a subclass of) on any driver or database failure
+    """
+    with _translate_errors(connecting=True):
+        conn = _resolve_engine(engine).connect()
+    with conn, _translate_errors():
+        with conn.begin():
+            result = _execute(conn, query, params)
+            if not result.returns_rows:
+                return []
+            return [dict(row) for row in result.mappings()]
+
+
+def stream_query(
+    query: str,
+    params: Params = None,
+    batch_size: int = 1000,
+    engine: Optional[Engine] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield rows as dicts, fetching ``batch_size`` rows per round trip.
+
+    The pooled connection is held until the iterator is exhausted or closed,
+    so consume it promptly (or wrap it in ``contextlib.closing``).
+
+    Raises:
+        QueryError: (a subclass of) on any driver or database failure
+    """
+    with _translate_errors(connecting=True):
+        conn = _resolve_engine(engine).connect()
+    with conn, _translate_errors():
+        result = _execute(
+            conn.execution_options(yield_per=batch_size), query, params
+        )
+        if not result.returns_rows:
+            return
+        for batch in result.mappings().partitions(batch_size):
+            for row in batch:
+                yield dict(row)
@@ -4,20 +4,54 @@ SQLAlchemy session management.
 Provides the engine, session factory, and a FastAPI dependency
 ``get_db`` that yields a session per request with automatic commit / rollback.
 
+When ``DB_ASYNC_ENABLED`` is set, the async counterparts
+(``get_async_engine``, ``get_async_session_factory`` and ``get_async_db``)
+serve ``async def`` endpoints with an ``AsyncSession`` so they do not hold a
+threadpool worker for the duration of each database round trip. Endpoints
+that support both modes depend on ``get_async_db_if_enabled``.
+
+Pool sizing, timeout, recycle and the pre-ping strategy come from the
+``DB_POOL_*`` settings; both engines use instrumented pools whose telemetry
+is reported by ``get_pool_stats``.
+
 Engine creation is lazy so that the module can be imported without a live
 ODBC driver (e.g. during CI lint / test on macOS without unixODBC).
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from sqlalchemy import create_engine, Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session
 
 from src.config import settings
+from src.db.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    install_idle_pre_ping,
+    pool_status,
+)
 
 # Lazy singleton
 _engine: Optional[Engine] = None
 _SessionLocal: Optional[sessionmaker] = None
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+
+def _pool_kwargs() -> Dict[str, Any]:
+    """Pool sizing and pre-ping options from settings."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
 
 
 def get_engine() -> Engine:
@@ -26,12 +60,13 @@ def get_engine() -> Engine:
     if _engine is None:
         _engine = create_engine(
             settings.DATABASE_URL,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            poolclass=InstrumentedQueuePool,
             echo=settings.DEBUG,
             connect_args={"fast_executemany": True},
+            **_pool_kwargs(),
         )
+        if settings.DB_POOL_PRE_PING == "idle":
+            install_idle_pre_ping(_engine, settings.DB_POOL_PRE_PING_IDLE_SECONDS)
     return _engine
 
 
@@ -45,6 +80,16 @@ def get_session_factory() -> sessionmaker:
     return _SessionLocal
 
 
+def get_pool_stats() -> Dict[str, Any]:
+    """Occupancy and checkout telemetry for each engine created so far."""
+    stats: Dict[str, Any] = {}
+    if _engine is not None:
+        stats["sync"] = pool_status(_engine.pool)
+    if _async_engine is not None:
+        stats["async"] = pool_status(_async_engine.sync_engine.pool)
+    return stats
+
+
 def get_db():
     """FastAPI dependency — yields a SQLAlchemy session.
 
@@ -65,3 +110,78 @@ def get_db():
     finally:
         db.close()
 
+
+# ---------------------------------------------------------------------------
+# Async mode (DB_ASYNC_ENABLED)
+# ---------------------------------------------------------------------------
+
+def get_async_engine() -> AsyncEngine:
+    """Return (and cache) the async SQLAlchemy engine."""
+    global _async_engine
+    if _async_engine is None:
+        if not settings.DB_ASYNC_ENABLED:
+            raise RuntimeError(
+                "Async database mode is disabled. Set DB_ASYNC_ENABLED=true to use it."
+            )
+        url = settings.ASYNC_DATABASE_URL
+        kwargs = {"echo": settings.DEBUG}
+        if url.startswith("sqlite"):
+            # Local / test stand-in: no dbo schema, no pool sizing
+            from src.db.sqlite_compat import SQLITE_EXECUTION_OPTIONS
+            kwargs["execution_options"] = SQLITE_EXECUTION_OPTIONS
+        else:
+            kwargs.update(poolclass=InstrumentedAsyncQueuePool, **_pool_kwargs())
+        _async_engine = create_async_engine(url, **kwargs)
+        if settings.DB_POOL_PRE_PING == "idle" and not url.startswith("sqlite"):
+            install_idle_pre_ping(
+                _async_engine.sync_engine, settings.DB_POOL_PRE_PING_IDLE_SECONDS
+            )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Return (and cache) the async session factory."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _AsyncSessionLocal
+
+
+async def get_async_db():
+    """FastAPI dependency — yields an ``AsyncSession``.
+
+    Usage::
+
+        @router.get("/items")
+        async def list_items(db: AsyncSession = Depends(get_async_db)):
+            ...
+    """
+    factory = get_async_session_factory()
+    async with factory() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def get_async_db_if_enabled():
+    """FastAPI dependency — ``get_async_db`` when ``DB_ASYNC_ENABLED`` is set,
+    otherwise yields None so the endpoint falls back to its sync session."""
+    if not settings.DB_ASYNC_ENABLED:
+        yield None
+        return
+    async for db in get_async_db():
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections (application shutdown)."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _AsyncSessionLocal = None
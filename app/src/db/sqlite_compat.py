@@ -0,0 +1,63 @@
+"""
+SQLite stand-in support for tests and local benchmarks.
+
+The ORM models target Azure SQL: tables live in the ``dbo`` schema, keys are
+UNIQUEIDENTIFIER, ``WorkoutLogs.TotalDurationMinutes`` is a T-SQL computed
+column and ``src.db.date_buckets`` renders T-SQL date functions. Importing
+this module registers SQLite renderings for those constructs; engines built
+with ``SQLITE_EXECUTION_OPTIONS`` drop the schema prefix.
+Nothing here is used against SQL Server.
+"""
+
+from sqlalchemy import Computed
+from sqlalchemy.dialects.mssql import UNIQUEIDENTIFIER
+from sqlalchemy.ext.compiler import compiles
+
+from src.db.date_buckets import day_number, day_start, month_start, week_start
+
+SQLITE_EXECUTION_OPTIONS = {"schema_translate_map": {"dbo": None}}
+
+# T-SQL computed-column expressions and their SQLite equivalents
+_COMPUTED_SQL = {
+    # DATEDIFF counts minute boundaries crossed, so truncate both ends first
+    "DATEDIFF(MINUTE, StartTime, EndTime)": (
+        "CAST(ROUND((julianday(strftime('%Y-%m-%d %H:%M', EndTime))"
+        " - julianday(strftime('%Y-%m-%d %H:%M', StartTime))) * 1440) AS INTEGER)"
+    ),
+}
+
+
+@compiles(UNIQUEIDENTIFIER, "sqlite")
+def _compile_uniqueidentifier(type_, compiler, **kw):
+    # Matches the 32-char hex storage of the generic Uuid type
+    return "CHAR(32)"
+
+
+@compiles(Computed, "sqlite")
+def _compile_computed(element, compiler, **kw):
+    sqltext = _COMPUTED_SQL.get(str(element.sqltext))
+    if sqltext is None:
+        return compiler.visit_computed_column(element, **kw)
+    return f"GENERATED ALWAYS AS ({sqltext})"
+
+
+@compiles(day_start, "sqlite")
+def _compile_day_start(element, compiler, **kw):
+    return f"date({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(week_start, "sqlite")
+def _compile_week_start(element, compiler, **kw):
+    # Back six days, then forward to the next Monday (or stay on it)
+    return f"date({compiler.process(element.clauses, **kw)}, '-6 days', 'weekday 1')"
+
+
+@compiles(month_start, "sqlite")
+def _compile_month_start(element, compiler, **kw):
+    return f"date({compiler.process(element.clauses, **kw)}, 'start of month')"
+
+
+@compiles(day_number, "sqlite")
+def _compile_day_number(element, compiler, **kw):
+    # julianday('1900-01-01') is 2415020.5
+    return f"CAST(julianday(date({compiler.process(element.clauses, **kw)})) - 2415020.5 AS INTEGER)"
@@ -83,7 +83,24 @@ from .logs import (
     WorkoutLogInDB,
     WorkoutLogResponse,
     WorkoutLogSummary,
+    LogBatchAction,
+    LogBatchTarget,
+    LogBatchItemStatus,
+    LogBatchOperation,
+    LogBatchRequest,
+    LogBatchItemResult,
+    LogBatchResponse,
     ExercisePerformance,
+    PerformanceBucket,
+    ExercisePerformancePeriod,
+    ExercisePerformanceHistory,
+    TrainingVolumeSeries,
+    RollingVolumeSeries,
+    EstimatedOneRepMaxTrend,
+    WeeklyVolumeChange,
+    RepMax,
+    EstimatedOneRepMax,
+    ExerciseRecords,
     WorkoutStats,
 )
 
@@ -167,8 +184,26 @@ __all__ = [
     "WorkoutLogInDB",
     "WorkoutLogResponse",
     "WorkoutLogSummary",
+    # Log batches
+    "LogBatchAction",
+    "LogBatchTarget",
+    "LogBatchItemStatus",
+    "LogBatchOperation",
+    "LogBatchRequest",
+    "LogBatchItemResult",
+    "LogBatchResponse",
     # Analytics
     "ExercisePerformance",
+    "PerformanceBucket",
+    "ExercisePerformancePeriod",
+    "ExercisePerformanceHistory",
+    "TrainingVolumeSeries",
+    "RollingVolumeSeries",
+    "EstimatedOneRepMaxTrend",
+    "WeeklyVolumeChange",
+    "RepMax",
+    "EstimatedOneRepMax",
+    "ExerciseRecords",
     "WorkoutStats",
     # Program Assignments
     "AssignmentStatus",
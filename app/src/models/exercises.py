@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import Field
@@ -35,6 +35,23 @@ class MuscleGroup(str, Enum):
     CARDIO = "cardio"
 
 
+def _stored_forms(member: Enum) -> List[str]:
+    """Spellings of an enum value found in rows not written through the API."""
+    value = member.value
+    return [value, value.upper(), value.title(), value.capitalize(), value.replace("_", " ").title()]
+
+
+# Stored value -> enum member, built once. Writes store ``.value`` (and
+# migration 026 canonicalized older rows), so reading a row is one dict
+# lookup; unknown values map to None.
+MUSCLE_GROUP_LOOKUP: Dict[str, MuscleGroup] = {
+    form: member for member in MuscleGroup for form in _stored_forms(member)
+}
+DIFFICULTY_LEVEL_LOOKUP: Dict[str, DifficultyLevel] = {
+    form: member for member in DifficultyLevel for form in _stored_forms(member)
+}
+
+
 class ExerciseBase(DBModelBase):
     """Base exercise fields."""
     name: str = Field(..., max_length=255, description="Exercise name")
@@ -1,14 +1,15 @@
 """Workout logging models - tracking completed workouts, sets, and performance."""
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Optional
+from enum import Enum
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import Field, computed_field
 
 from .base import DBModelBase, CreatedAtMixin
-from .exercises import ExerciseSummary
+from .exercises import ExerciseSummary, MuscleGroup
 
 
 # ============================================================================
@@ -142,6 +143,10 @@ class WorkoutLogCreate(WorkoutLogBase):
         None, 
         description="If completed as part of a program"
     )
+    set_logs: List[SetLogCreate] = Field(
+        default_factory=list,
+        description="Logged sets, for submitting a complete session in one call"
+    )
 
 
 class WorkoutLogUpdate(DBModelBase):
@@ -186,6 +191,85 @@ class WorkoutLogSummary(DBModelBase):
     original_workout_id: Optional[UUID] = None
 
 
+# ============================================================================
+# Batch Models - Offline sync of set/step log changes for one workout log
+# ============================================================================
+
+class LogBatchAction(str, Enum):
+    """What a batch operation does."""
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class LogBatchTarget(str, Enum):
+    """Which kind of row a batch operation touches."""
+    SET_LOG = "set_log"
+    STEP_LOG = "step_log"
+
+
+class LogBatchItemStatus(str, Enum):
+    """Outcome of one batch operation."""
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    UNCHANGED = "unchanged"  # Replay of a create/delete that was already applied
+    FAILED = "failed"
+
+
+class LogBatchOperation(DBModelBase):
+    """One set-log or step-log change within a batch.
+
+    ``data`` is validated as ``SetLogCreate`` / ``SetLogUpdate`` /
+    ``SetStepLogCreate`` / ``SetStepLogUpdate`` depending on ``action`` and
+    ``target``. Creates may carry a client-generated ID so that replaying
+    the same batch is idempotent.
+    """
+    action: LogBatchAction
+    target: LogBatchTarget
+    client_ref: Optional[str] = Field(
+        None,
+        max_length=100,
+        description="Client correlation key, echoed in the result",
+    )
+    set_log_id: Optional[UUID] = Field(
+        None,
+        description="Set log to update/delete, parent of a step log, or client ID for a set-log create",
+    )
+    set_log_ref: Optional[str] = Field(
+        None,
+        max_length=100,
+        description="client_ref of a set log created earlier in this batch (parent of a step-log create)",
+    )
+    step_log_id: Optional[UUID] = Field(
+        None,
+        description="Step log to update/delete, or client ID for a step-log create",
+    )
+    data: Optional[Dict[str, Any]] = Field(None, description="Create / update payload")
+
+
+class LogBatchRequest(DBModelBase):
+    """Ordered batch of changes, applied in a single transaction."""
+    operations: List[LogBatchOperation] = Field(..., min_length=1, max_length=500)
+
+
+class LogBatchItemResult(DBModelBase):
+    """Per-operation result, in request order."""
+    index: int
+    client_ref: Optional[str] = None
+    status: LogBatchItemStatus
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class LogBatchResponse(DBModelBase):
+    """Batch outcome; failed operations are skipped, the rest are applied."""
+    workout_log_id: UUID
+    applied: int
+    failed: int
+    results: List[LogBatchItemResult]
+
+
 # ============================================================================
 # Aggregation Models - For analytics and summaries
 # ============================================================================
@@ -200,6 +284,108 @@ class ExercisePerformance(DBModelBase):
     avg_weight: Optional[Decimal] = None
 
 
+class PerformanceBucket(str, Enum):
+    """Calendar period for splitting performance history."""
+    DAY = "day"
+    WEEK = "week"    # ISO weeks, starting Monday
+    MONTH = "month"
+
+
+class ExercisePerformancePeriod(DBModelBase):
+    """Performance for one day/week/month of an exercise's history."""
+    period_start: date
+    total_sets: int
+    total_reps: int
+    max_weight: Optional[Decimal] = None
+    avg_weight: Optional[Decimal] = None
+
+
+class ExercisePerformanceHistory(ExercisePerformance):
+    """Performance over a date range, optionally split into calendar periods."""
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    bucket: Optional[PerformanceBucket] = None
+    periods: List[ExercisePerformancePeriod] = Field(default_factory=list)
+
+
+class TrainingVolumeSeries(DBModelBase):
+    """Training volume per calendar period as parallel arrays, oldest first.
+
+    Entry ``i`` of ``volume`` (sum of reps × weight), ``sets`` and ``reps``
+    belongs to the period starting ``dates[i]``.
+    """
+    bucket: PerformanceBucket
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    exercise_id: Optional[UUID] = None
+    muscle_group: Optional[MuscleGroup] = None
+    dates: List[date] = Field(default_factory=list)
+    volume: List[float] = Field(default_factory=list)
+    sets: List[int] = Field(default_factory=list)
+    reps: List[int] = Field(default_factory=list)
+
+
+class RollingVolumeSeries(DBModelBase):
+    """Volume per calendar day and its trailing ``window``-day sum, as
+    parallel arrays covering every day from ``start_date`` to ``end_date``."""
+    window: int
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    exercise_id: Optional[UUID] = None
+    dates: List[date] = Field(default_factory=list)
+    volume: List[float] = Field(default_factory=list)
+    rolling_volume: List[float] = Field(default_factory=list)
+
+
+class EstimatedOneRepMaxTrend(DBModelBase):
+    """Best estimated 1RM per training day for one exercise, oldest first."""
+    exercise_id: UUID
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    dates: List[date] = Field(default_factory=list)
+    estimated_1rm: List[float] = Field(default_factory=list)
+    best_to_date: List[float] = Field(default_factory=list)
+    slope_per_week: Optional[float] = Field(
+        None, description="Least-squares trend of estimated_1rm, in weight units per week"
+    )
+
+
+class WeeklyVolumeChange(DBModelBase):
+    """Volume and reps per week (Monday start) with the change from the
+    week before, as parallel arrays covering every week in range."""
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    exercise_id: Optional[UUID] = None
+    week_starts: List[date] = Field(default_factory=list)
+    volume: List[float] = Field(default_factory=list)
+    reps: List[int] = Field(default_factory=list)
+    volume_change: List[float] = Field(default_factory=list)
+    volume_change_pct: List[Optional[float]] = Field(
+        default_factory=list, description="None when the previous week had no volume"
+    )
+
+
+class RepMax(DBModelBase):
+    """Heaviest weight logged for an exact rep count."""
+    reps: int
+    weight: Decimal
+    set_step_log_id: UUID
+    achieved_at: datetime = Field(..., description="Start time of the workout it was logged in")
+
+
+class EstimatedOneRepMax(RepMax):
+    """Best estimated 1RM and the rep max it was estimated from."""
+    estimated_1rm: Decimal
+
+
+class ExerciseRecords(DBModelBase):
+    """A user's personal records for one exercise."""
+    exercise_id: UUID
+    max_weight: Optional[RepMax] = None
+    estimated_1rm: Optional[EstimatedOneRepMax] = None
+    rep_maxes: List[RepMax] = Field(default_factory=list, description="Best weight per rep count, by reps")
+
+
 class WorkoutStats(DBModelBase):
     """Aggregated stats for a user's workout history."""
     total_workouts: int
@@ -2,29 +2,23 @@
 
 import uuid
 from datetime import datetime
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.db.orm_models import Base
 
 T = TypeVar("T", bound=Base)
 
 
-class BaseRepository(Generic[T]):
-    """Generic CRUD repository.
-
-    Subclasses set ``model`` to the ORM class they manage.
-    """
+class _StatementMixin(Generic[T]):
+    """Statement builders shared by the sync and async repositories."""
 
     model: Type[T]
 
-    def __init__(self, db: Session):
-        self.db = db
-
-    # -- helpers -------------------------------------------------------------
-
     def _active_filter(self, stmt: Any) -> Any:
         """If the model has a ``deleted_at`` column, exclude soft-deleted rows."""
         col = getattr(self.model, "deleted_at", None)
@@ -32,19 +26,78 @@ class BaseRepository(Generic[T]):
             stmt = stmt.where(col.is_(None))
         return stmt
 
-    # -- read ----------------------------------------------------------------
-
-    def get_by_id(self, entity_id: uuid.UUID) -> Optional[T]:
+    def _get_by_id_stmt(self, entity_id: uuid.UUID) -> Any:
         pk_col = list(self.model.__table__.primary_key)[0]
         stmt = select(self.model).where(pk_col == entity_id)
-        stmt = self._active_filter(stmt)
-        return self.db.execute(stmt).scalars().first()
+        return self._active_filter(stmt)
 
-    def list_all(self, *, offset: int = 0, limit: int = 50) -> List[T]:
+    def _list_all_stmt(self, offset: int, limit: int) -> Any:
         stmt = select(self.model)
         stmt = self._active_filter(stmt)
-        stmt = stmt.offset(offset).limit(limit)
-        return list(self.db.execute(stmt).scalars().all())
+        return stmt.offset(offset).limit(limit)
+
+    def _update_returning_stmt(self, entity: Any, values: Dict[str, Any]) -> Any:
+        """``UPDATE ... RETURNING`` every mapped column for one row.
+
+        Renders as ``OUTPUT inserted.*`` on SQL Server. Built on the table
+        rather than the entity so column ``onupdate`` defaults still apply
+        but the session's identity map is left to ``_load_returned``.
+        ``entity`` may be any mapped class, not just ``model`` (e.g. a
+        ``Set`` updated through ``WorkoutRepository``).
+        """
+        mapper = inspect(type(entity))
+        table = mapper.local_table
+        pk_col = list(table.primary_key)[0]
+        pk_value = getattr(entity, mapper.get_property_by_column(pk_col).key)
+        return (
+            update(table)
+            .where(pk_col == pk_value)
+            .values({mapper.attrs[key].columns[0]: value for key, value in values.items()})
+            .returning(*(attr.columns[0] for attr in mapper.column_attrs))
+        )
+
+    def _load_returned(self, entity: Any, row: Any) -> None:
+        """Set the returned row on ``entity`` as its committed (clean) state."""
+        for attr, value in zip(inspect(type(entity)).column_attrs, row):
+            set_committed_value(entity, attr.key, value)
+
+    def _stale_relationships(self, entity: Any, values: Dict[str, Any]) -> List[str]:
+        """Loaded relationships whose foreign key is among ``values`` (e.g.
+        ``Set.exercise`` after an ``exercise_id`` change)."""
+        mapper = inspect(type(entity))
+        loaded = inspect(entity).dict
+        return [
+            rel.key
+            for rel in mapper.relationships
+            if rel.key in loaded
+            and any(mapper.get_property_by_column(col).key in values for col in rel.local_columns)
+        ]
+
+    def _server_generated_attrs(self, entity: Any) -> List[str]:
+        """Attributes the database computes (computed columns, server onupdate)."""
+        return [
+            attr.key
+            for attr in inspect(type(entity)).column_attrs
+            if attr.columns[0].computed is not None or attr.columns[0].server_onupdate is not None
+        ]
+
+
+class BaseRepository(_StatementMixin[T]):
+    """Generic CRUD repository.
+
+    Subclasses set ``model`` to the ORM class they manage.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # -- read ----------------------------------------------------------------
+
+    def get_by_id(self, entity_id: uuid.UUID) -> Optional[T]:
+        return self.db.execute(self._get_by_id_stmt(entity_id)).scalars().first()
+
+    def list_all(self, *, offset: int = 0, limit: int = 50) -> List[T]:
+        return list(self.db.execute(self._list_all_stmt(offset, limit)).scalars().all())
 
     # -- write ---------------------------------------------------------------
 
@@ -54,6 +107,33 @@ class BaseRepository(Generic[T]):
         self.db.refresh(entity)
         return entity
 
+    def update_fields(self, entity: Any, values: Dict[str, Any]) -> Any:
+        """Write ``values`` (attribute name -> value) to ``entity``'s row.
+
+        One ``UPDATE ... RETURNING`` both applies the change and reads the
+        row back, replacing the flush + refresh pair. Loaded relationships
+        are left intact unless ``values`` changes their foreign key; those
+        are expired and load again on next access. On a dialect without
+        UPDATE RETURNING the values are flushed and only server-generated
+        columns are refreshed.
+        """
+        if not values:
+            return entity
+        stale = self._stale_relationships(entity, values)
+        if self.db.get_bind().dialect.update_returning:
+            row = self.db.execute(self._update_returning_stmt(entity, values)).one()
+            self._load_returned(entity, row)
+        else:
+            for field, value in values.items():
+                setattr(entity, field, value)
+            self.db.flush()
+            generated = self._server_generated_attrs(entity)
+            if generated:
+                self.db.refresh(entity, attribute_names=generated)
+        if stale:
+            self.db.expire(entity, stale)
+        return entity
+
     def delete(self, entity: T) -> None:
         """Soft-delete if supported, otherwise hard-delete."""
         if hasattr(entity, "deleted_at"):
@@ -61,3 +141,83 @@ class BaseRepository(Generic[T]):
         else:
             self.db.delete(entity)
         self.db.flush()
+
+    # -- cache invalidation --------------------------------------------------
+
+    def _invalidate_after_commit(self, cache: Any) -> None:
+        """Call ``cache.invalidate()`` now and again when the session commits.
+
+        The second call closes the window in which a concurrent reader
+        re-caches pre-commit data between the write and the commit.
+        """
+        cache.invalidate()
+        pending = self.db.info.setdefault("invalidate_after_commit", set())
+        if not pending:
+            event.listen(self.db, "after_commit", _run_pending_invalidations, once=True)
+        pending.add(cache)
+
+
+def _run_pending_invalidations(session: Session) -> None:
+    for cache in session.info.pop("invalidate_after_commit", ()):
+        cache.invalidate()
+
+
+class AsyncBaseRepository(_StatementMixin[T]):
+    """Async counterpart of ``BaseRepository`` for an ``AsyncSession``.
+
+    Used by ``async def`` endpoints when ``DB_ASYNC_ENABLED`` is set (see
+    ``session.get_async_db_if_enabled``).
+    Subclasses set ``model`` exactly as with ``BaseRepository``.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # -- read ----------------------------------------------------------------
+
+    async def get_by_id(self, entity_id: uuid.UUID) -> Optional[T]:
+        result = await self.db.execute(self._get_by_id_stmt(entity_id))
+        return result.scalars().first()
+
+    async def list_all(self, *, offset: int = 0, limit: int = 50) -> List[T]:
+        result = await self.db.execute(self._list_all_stmt(offset, limit))
+        return list(result.scalars().all())
+
+    # -- write ---------------------------------------------------------------
+
+    async def create(self, entity: T) -> T:
+        self.db.add(entity)
+        await self.db.flush()
+        await self.db.refresh(entity)
+        return entity
+
+    async def update_fields(self, entity: Any, values: Dict[str, Any]) -> Any:
+        """Async counterpart of ``BaseRepository.update_fields``.
+
+        Relationships whose foreign key changed are reloaded rather than
+        expired, since an ``AsyncSession`` cannot lazy-load them.
+        """
+        if not values:
+            return entity
+        stale = self._stale_relationships(entity, values)
+        if self.db.bind.dialect.update_returning:
+            result = await self.db.execute(self._update_returning_stmt(entity, values))
+            self._load_returned(entity, result.one())
+        else:
+            for field, value in values.items():
+                setattr(entity, field, value)
+            await self.db.flush()
+            generated = self._server_generated_attrs(entity)
+            if generated:
+                await self.db.refresh(entity, attribute_names=generated)
+        if stale:
+            await self.db.refresh(entity, attribute_names=stale)
+        return entity
+
+    async def delete(self, entity: T) -> None:
+        """Soft-delete if supported, otherwise hard-delete."""
+        if hasattr(entity, "deleted_at"):
+            setattr(entity, "deleted_at", datetime.utcnow())
+        else:
+            await self.db.delete(entity)
+        await self.db.flush()
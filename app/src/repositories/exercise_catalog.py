@@ -0,0 +1,410 @@
+"""In-process exercise catalog – snapshot plus typeahead and filter indexes.
+
+Every active exercise is held in memory, one integer *slot* each. Filters
+are bitmaps (Python ints, bit ``n`` = slot ``n``) per muscle group,
+difficulty and equipment item, so a filtered search is a handful of ANDs.
+Names are indexed per token (``exercise_search.name_tokens``): edge n-grams
+up to ``EDGE_NGRAM_MAX`` characters map straight to a bitmap, and longer
+prefixes are resolved against the sorted token vocabulary. Ranking and typo
+tolerance match ``ExerciseRepository.search``.
+
+The snapshot refreshes incrementally: rows whose ``CreatedAt``,
+``UpdatedAt`` or ``DeletedAt`` moved past the last watermark are re-read and
+re-indexed. A change replaces the row's slot (the old one becomes a
+tombstone); tombstones are compacted away once they outnumber live slots.
+"""
+
+import bisect
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from src.config import settings
+from src.db.orm_models import Exercise
+from src.models.exercises import DifficultyLevel, MuscleGroup
+from src.repositories.exercise_equipment import canonical_equipment, parse_equipment_required
+from src.repositories.exercise_search import closest_tokens, name_tokens, normalize_name
+
+EDGE_NGRAM_MAX = 3  # Token prefixes up to this length get their own bitmap
+
+# Rows are re-read from slightly before the watermark so that writes whose
+# timestamps were taken before a concurrent refresh, but committed after it,
+# are still picked up. Re-applying an unchanged row is a no-op.
+_REFRESH_OVERLAP = timedelta(seconds=30)
+
+# Below this many matches, results are sorted directly instead of walking
+# the name-ordered slot list.
+_SORT_THRESHOLD = 2048
+
+_COMPACT_MIN_DEAD = 1024
+
+_SNAPSHOT_COLUMNS = (
+    Exercise.exercise_id,
+    Exercise.creator_id,
+    Exercise.name,
+    Exercise.description,
+    Exercise.equipment_required,
+    Exercise.primary_muscle_group,
+    Exercise.difficulty_level,
+    Exercise.instructions,
+    Exercise.created_at,
+    Exercise.updated_at,
+    Exercise.deleted_at,
+)
+
+
+def _iter_slots(bits: int) -> Iterator[int]:
+    """Set bit positions of ``bits``, highest first."""
+    digits = bin(bits)
+    top = len(digits) - 1
+    i = digits.find("1", 2)
+    while i != -1:
+        yield top - i
+        i = digits.find("1", i + 1)
+
+
+def _changed_at(row: Row) -> datetime:
+    return max(ts for ts in (row.created_at, row.updated_at, row.deleted_at) if ts is not None)
+
+
+class ExerciseCatalog:
+    """Indexed in-memory snapshot of active exercises.
+
+    ``search`` refreshes the snapshot (through the caller's session) when it
+    is older than ``refresh_seconds``, or after ``invalidate``. Rows are
+    returned as SQLAlchemy ``Row`` objects exposing the ``Exercise``
+    attribute names. Safe to share between request threads.
+    """
+
+    def __init__(self, refresh_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._bind: Any = None
+        self._watermark: Optional[datetime] = None
+        self._next_refresh = 0.0
+        self._full_loads = 0
+        self._incremental_loads = 0
+        self._reset()
+
+    @property
+    def enabled(self) -> bool:
+        return self.refresh_seconds > 0
+
+    def _reset(self) -> None:
+        self._rows: List[Optional[Row]] = []
+        self._names: List[str] = []
+        self._norms: List[str] = []
+        self._slot_of: Dict[uuid.UUID, int] = {}
+        self._dead = 0
+        self._live = 0
+        self._token_bits: Dict[str, int] = {}
+        self._ngram_bits: Dict[str, int] = {}
+        self._vocab: List[str] = []
+        self._muscle_bits: Dict[str, int] = {}
+        self._difficulty_bits: Dict[str, int] = {}
+        self._equipment_bits: Dict[str, int] = {}
+        self._name_order: List[int] = []  # slots by name (tombstones included)
+        self._norm_order: List[tuple] = []  # (normalized name, slot), sorted
+
+    # -- freshness -----------------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Refresh from the database before the next search."""
+        self._next_refresh = 0.0
+
+    def clear(self) -> None:
+        """Drop the snapshot; the next search reloads it in full."""
+        with self._lock:
+            self._reset()
+            self._bind = None
+            self._watermark = None
+            self._next_refresh = 0.0
+
+    def refresh(self, db: Session) -> None:
+        """Load the snapshot, or apply the rows changed since the last load."""
+        with self._lock:
+            bind = db.get_bind()
+            full = bind is not self._bind
+            stmt = select(*_SNAPSHOT_COLUMNS)
+            if full:
+                self._reset()
+                self._watermark = None
+                stmt = stmt.where(Exercise.deleted_at.is_(None))
+            elif self._watermark is not None:
+                since = self._watermark - _REFRESH_OVERLAP
+                stmt = stmt.where(or_(
+                    Exercise.created_at >= since,
+                    Exercise.updated_at >= since,
+                    Exercise.deleted_at >= since,
+                ))
+            rows = db.execute(stmt).all()
+
+            # OR-ing one bit at a time into a large int copies the whole
+            # bitmap; big batches set bits in a buffer and OR once per key.
+            pending: Optional[Dict[tuple, List[int]]] = {} if len(rows) > 64 else None
+            added: List[int] = []
+            for row in rows:
+                slot = self._apply(row, pending)
+                if slot is not None:
+                    added.append(slot)
+                changed_at = _changed_at(row)
+                if self._watermark is None or changed_at > self._watermark:
+                    self._watermark = changed_at
+            if pending:
+                self._flush_pending(pending)
+            self._index_order(added)
+
+            if self._dead > _COMPACT_MIN_DEAD and self._dead > len(self._slot_of):
+                self._compact()
+            self._bind = bind
+            if full:
+                self._full_loads += 1
+            else:
+                self._incremental_loads += 1
+            self._next_refresh = self._clock() + self.refresh_seconds
+
+    def _apply(self, row: Row, pending: Optional[Dict[tuple, List[int]]] = None) -> Optional[int]:
+        """Index ``row`` (replacing its previous version); returns a new slot."""
+        slot = self._slot_of.get(row.exercise_id)
+        if slot is not None:
+            if self._rows[slot] == row:
+                return None
+            self._remove(slot)
+        if row.deleted_at is not None:
+            return None
+        return self._add(row, pending)
+
+    def _add(self, row: Row, pending: Optional[Dict[tuple, List[int]]] = None) -> int:
+        """Give ``row`` a new slot. With ``pending``, bits are collected
+        there (keyed by ``(id(index), key)``) for ``_flush_pending``.
+        """
+        slot = len(self._rows)
+        self._rows.append(row)
+        self._names.append(row.name)
+        self._norms.append(normalize_name(row.name))
+        self._slot_of[row.exercise_id] = slot
+        if pending is None:
+            bit = 1 << slot
+            self._live |= bit
+            for index, key in self._index_keys(row):
+                index[key] = index.get(key, 0) | bit
+        else:
+            pending.setdefault((None, None), []).append(slot)  # live bitmap
+            for index, key in self._index_keys(row):
+                pending.setdefault((id(index), key), []).append(slot)
+        return slot
+
+    def _flush_pending(self, pending: Dict[tuple, List[int]]) -> None:
+        indexes = {id(index): index for index in (
+            self._token_bits, self._ngram_bits, self._muscle_bits,
+            self._difficulty_bits, self._equipment_bits,
+        )}
+        for (index_id, key), slots in pending.items():
+            buffer = bytearray(max(slots) // 8 + 1)
+            for slot in slots:
+                buffer[slot >> 3] |= 1 << (slot & 7)
+            bits = int.from_bytes(buffer, "little")
+            if index_id is None:
+                self._live |= bits
+            else:
+                index = indexes[index_id]
+                index[key] = index.get(key, 0) | bits
+
+    def _remove(self, slot: int) -> None:
+        row = self._rows[slot]
+        keep = ~(1 << slot)
+        self._live &= keep
+        for index, key in self._index_keys(row):
+            index[key] &= keep
+        for token in name_tokens(row.name):
+            if not self._token_bits[token]:
+                del self._token_bits[token]
+                i = bisect.bisect_left(self._vocab, token)
+                if i < len(self._vocab) and self._vocab[i] == token:
+                    del self._vocab[i]
+        self._rows[slot] = None
+        del self._slot_of[row.exercise_id]
+        self._dead += 1
+
+    def _index_keys(self, row: Row) -> Iterator[tuple]:
+        """``(bitmap index, key)`` pairs that ``row``'s slot belongs to."""
+        ngrams = set()
+        for token in name_tokens(row.name):
+            yield self._token_bits, token
+            ngrams.update(token[:n] for n in range(1, min(EDGE_NGRAM_MAX, len(token)) + 1))
+        for ngram in ngrams:
+            yield self._ngram_bits, ngram
+        if row.primary_muscle_group:
+            yield self._muscle_bits, row.primary_muscle_group
+        if row.difficulty_level:
+            yield self._difficulty_bits, row.difficulty_level
+        for item in parse_equipment_required(row.equipment_required):
+            yield self._equipment_bits, item
+
+    def _index_order(self, added: List[int]) -> None:
+        """Merge new slots into the sorted name / vocabulary lists."""
+        if not added:
+            return
+        if len(added) > 64:
+            live = sorted(self._slot_of.values())
+            self._name_order = sorted(live, key=self._name_key)
+            self._norm_order = sorted((self._norms[s], s) for s in live)
+            self._vocab = sorted(self._token_bits)
+            return
+        for slot in added:
+            bisect.insort(self._name_order, slot, key=self._name_key)
+            bisect.insort(self._norm_order, (self._norms[slot], slot))
+            for token in name_tokens(self._names[slot]):
+                i = bisect.bisect_left(self._vocab, token)
+                if i == len(self._vocab) or self._vocab[i] != token:
+                    self._vocab.insert(i, token)
+
+    def _name_key(self, slot: int) -> tuple:
+        """Name order: normalized (case-folded) name, then the raw name,
+        as ``ExerciseRepository.search`` orders in SQL."""
+        return (self._norms[slot], self._names[slot])
+
+    def _compact(self) -> None:
+        """Rebuild without tombstones."""
+        rows = [row for row in self._rows if row is not None]
+        self._reset()
+        pending: Dict[tuple, List[int]] = {}
+        added = [self._add(row, pending) for row in rows]
+        self._flush_pending(pending)
+        self._index_order(added)
+
+    # -- search --------------------------------------------------------------
+
+    def search(
+        self,
+        db: Session,
+        *,
+        name: Optional[str] = None,
+        muscle_group: Optional[MuscleGroup] = None,
+        difficulty: Optional[DifficultyLevel] = None,
+        equipment: Optional[Iterable[str]] = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> List[Row]:
+        """``ExerciseRepository.search`` answered from the snapshot."""
+        if self._clock() >= self._next_refresh or db.get_bind() is not self._bind:
+            self.refresh(db)
+
+        with self._lock:
+            bits = self._live
+            if muscle_group:
+                bits &= self._muscle_bits.get(muscle_group.value, 0)
+            if difficulty:
+                bits &= self._difficulty_bits.get(difficulty.value, 0)
+            if equipment is not None:
+                available = set(canonical_equipment(equipment))
+                for item, item_bits in self._equipment_bits.items():
+                    if item not in available:
+                        bits &= ~item_bits
+
+            tokens = name_tokens(name) if name else []
+            if not tokens:
+                return self._page(bits, None, offset, limit)
+
+            matched = bits
+            for token in tokens:
+                matched &= self._prefix_bits(token)
+            if matched:
+                return self._page(matched, " ".join(tokens), offset, limit)
+            return self._search_with_typos(bits, tokens, offset, limit)
+
+    def _prefix_bits(self, prefix: str) -> int:
+        if len(prefix) <= EDGE_NGRAM_MAX:
+            return self._ngram_bits.get(prefix, 0)
+        bits = 0
+        i = bisect.bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            bits |= self._token_bits[self._vocab[i]]
+            i += 1
+        return bits
+
+    def _page(self, bits: int, query: Optional[str], offset: int, limit: int) -> List[Row]:
+        """Slots in ``bits`` ordered exact name, name prefix, then name."""
+        end = offset + limit
+        if not bits:
+            return []
+
+        def rank(slot: int) -> tuple:
+            norm = self._norms[slot]
+            if query is None:
+                return (0, *self._name_key(slot))
+            return (0 if norm == query else 1 if norm.startswith(query) else 2, *self._name_key(slot))
+
+        if bits.bit_count() <= _SORT_THRESHOLD:
+            slots = sorted(_iter_slots(bits), key=rank)
+            return [self._rows[s] for s in slots[offset:end]]
+
+        # Many matches: the first page is found long before the end of the
+        # name-ordered walk.
+        mask = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+        def member(slot: int) -> bool:
+            i = slot >> 3
+            return i < len(mask) and bool(mask[i] >> (slot & 7) & 1)
+
+        page: List[int] = []
+        if query is not None:
+            i = bisect.bisect_left(self._norm_order, (query,))
+            while i < len(self._norm_order) and self._norm_order[i][0].startswith(query):
+                slot = self._norm_order[i][1]
+                if member(slot):
+                    page.append(slot)
+                i += 1
+            page.sort(key=rank)
+        ranked = set(page)
+        for slot in self._name_order:
+            if len(page) >= end:
+                break
+            if member(slot) and slot not in ranked:
+                page.append(slot)
+        return [self._rows[s] for s in page[offset:end]]
+
+    def _search_with_typos(self, bits: int, tokens: List[str], offset: int, limit: int) -> List[Row]:
+        allowed: List[Dict[str, int]] = []
+        for token in tokens:
+            lo = bisect.bisect_left(self._vocab, token[0])
+            hi = bisect.bisect_left(self._vocab, chr(ord(token[0]) + 1))
+            matches = closest_tokens(token, self._vocab[lo:hi])
+            if not matches:
+                return []
+            allowed.append(matches)
+            token_bits = 0
+            for match in matches:
+                token_bits |= self._token_bits[match]
+            bits &= token_bits
+
+        def score(slot: int) -> tuple:
+            words = name_tokens(self._names[slot])
+            distance = sum(
+                min(matches[word] for word in words if word in matches)
+                for matches in allowed
+            )
+            return (distance, *self._name_key(slot))
+
+        slots = sorted(_iter_slots(bits), key=score)
+        return [self._rows[s] for s in slots[offset:offset + limit]]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._slot_of),
+            "tombstones": self._dead,
+            "tokens": len(self._token_bits),
+            "full_loads": self._full_loads,
+            "incremental_loads": self._incremental_loads,
+            "watermark": self._watermark,
+        }
+
+
+exercise_catalog = ExerciseCatalog(refresh_seconds=settings.EXERCISE_CATALOG_REFRESH_SECONDS)
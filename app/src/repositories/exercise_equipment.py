@@ -0,0 +1,34 @@
+"""Exercise equipment names.
+
+``Exercises.EquipmentRequired`` keeps the list as the client sent it. The
+``ExerciseEquipment`` relation holds one canonical name per row so that
+equipment filters are index seeks instead of string parsing per row.
+"""
+
+import json
+from typing import Iterable, List, Optional
+
+MAX_EQUIPMENT_LENGTH = 100  # ExerciseEquipment.Equipment is NVARCHAR(100)
+
+
+def canonical_equipment(items: Iterable[str]) -> List[str]:
+    """Distinct trimmed, lower-cased, single-spaced names, in order."""
+    names = (" ".join(str(item).lower().split())[:MAX_EQUIPMENT_LENGTH] for item in items)
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def parse_equipment_required(raw: Optional[str]) -> List[str]:
+    """Canonical items of a stored ``EquipmentRequired`` value.
+
+    Values are comma-joined; rows written by hand may hold a JSON array.
+    """
+    if not raw:
+        return []
+    if raw.lstrip().startswith("["):
+        try:
+            items = json.loads(raw)
+        except ValueError:
+            items = None
+        if isinstance(items, list):
+            return canonical_equipment(items)
+    return canonical_equipment(raw.split(","))
@@ -1,14 +1,28 @@
 """Exercise repository – CRUD, search, and ownership checks."""
 
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
 
-from sqlalchemy import or_, select
+from sqlalchemy import and_, case, delete, exists, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from src.db.orm_models import Exercise
+from src.db.orm_models import Exercise, ExerciseEquipment, ExerciseNameToken
 from src.models.exercises import ExerciseCreate, ExerciseUpdate, MuscleGroup, DifficultyLevel
-from src.repositories.base import BaseRepository
+from src.repositories.base import AsyncBaseRepository, BaseRepository
+from src.repositories.exercise_catalog import exercise_catalog
+from src.repositories.exercise_equipment import canonical_equipment, parse_equipment_required
+from src.repositories.exercise_search import (
+    closest_tokens,
+    name_tokens,
+    normalize_name,
+    prefix_upper_bound,
+)
+
+
+# Case-insensitive name order with a stable tiebreak; the in-memory catalog
+# sorts on the same key.
+_NAME_ORDER = (Exercise.name_normalized, Exercise.name)
 
 
 class ExerciseRepository(BaseRepository[Exercise]):
@@ -22,42 +36,171 @@ class ExerciseRepository(BaseRepository[Exercise]):
         name: Optional[str] = None,
         muscle_group: Optional[MuscleGroup] = None,
         difficulty: Optional[DifficultyLevel] = None,
+        equipment: Optional[Iterable[str]] = None,
         offset: int = 0,
         limit: int = 50,
     ) -> List[Exercise]:
         """Search exercises with optional filters.
 
+        ``equipment`` is what the user has available: only exercises that
+        need nothing outside it (bodyweight ones included) are returned.
+
+        ``name`` is matched word by word against the name token index: every
+        query word must prefix a word of the name, so "bench pr" finds
+        "Barbell Bench Press". Results are ranked exact name, then name
+        prefix, then other word matches. Only if that finds nothing are
+        typos tolerated (see ``exercise_search.max_typos``), ranked by
+        closeness.
+
         All exercises are visible to all users regardless of creator.
         """
         stmt = select(Exercise)
         stmt = self._active_filter(stmt)
 
-        if name:
-            stmt = stmt.where(Exercise.name.ilike(f"%{name}%"))
         if muscle_group:
             stmt = stmt.where(Exercise.primary_muscle_group == muscle_group.value)
         if difficulty:
             stmt = stmt.where(Exercise.difficulty_level == difficulty.value)
+        if equipment is not None:
+            stmt = stmt.where(~exists().where(
+                ExerciseEquipment.exercise_id == Exercise.exercise_id,
+                ExerciseEquipment.equipment.not_in(canonical_equipment(equipment)),
+            ))
+
+        tokens = name_tokens(name) if name else []
+        if not tokens:
+            stmt = stmt.order_by(*_NAME_ORDER).offset(offset).limit(limit)
+            return list(self.db.execute(stmt).scalars().all())
+
+        matched = stmt
+        for token in tokens:
+            matched = matched.where(self._has_token(self._token_prefix(token)))
+        query = " ".join(tokens)
+        rank = case(
+            (Exercise.name_normalized == query, 0),
+            (Exercise.name_normalized.like(f"{query}%"), 1),
+            else_=2,
+        )
+        page = matched.order_by(rank, *_NAME_ORDER).offset(offset).limit(limit)
+        exercises = list(self.db.execute(page).scalars().all())
+        if exercises or (offset and self.db.execute(select(matched.exists())).scalar()):
+            return exercises
+        return self._search_with_typos(stmt, tokens, offset, limit)
+
+    def _search_with_typos(
+        self,
+        stmt: Any,
+        tokens: List[str],
+        offset: int,
+        limit: int,
+    ) -> List[Exercise]:
+        """Fallback for ``search``: match each query word within its typo budget.
+
+        Candidate words are read from the token index (those sharing the
+        query word's first letter) and compared in process; exercises having
+        a close word for every query word are ranked by total distance. The
+        distances go back into the query, so ranking and paging happen in
+        SQL over every match.
+        """
+        distances = []
+        for token in tokens:
+            vocabulary = self.db.execute(
+                select(ExerciseNameToken.token)
+                .where(self._token_prefix(token[0]))
+                .distinct()
+            ).scalars()
+            matches = closest_tokens(token, vocabulary)
+            if not matches:
+                return []
+            close = ExerciseNameToken.token.in_(list(matches))
+            stmt = stmt.where(self._has_token(close))
+            # Distance of the exercise's closest word to this query word
+            distances.append(
+                select(func.min(case(matches, value=ExerciseNameToken.token)))
+                .where(ExerciseNameToken.exercise_id == Exercise.exercise_id, close)
+                .scalar_subquery()
+            )
+
+        score = sum(distances[1:], distances[0])
+        page = stmt.order_by(score, *_NAME_ORDER).offset(offset).limit(limit)
+        return list(self.db.execute(page).scalars().all())
+
+    @staticmethod
+    def _token_prefix(prefix: str) -> Any:
+        return and_(
+            ExerciseNameToken.token >= prefix,
+            ExerciseNameToken.token < prefix_upper_bound(prefix),
+        )
 
-        stmt = stmt.order_by(Exercise.name).offset(offset).limit(limit)
-        return list(self.db.execute(stmt).scalars().all())
+    @staticmethod
+    def _has_token(condition: Any) -> Any:
+        return exists().where(
+            ExerciseNameToken.exercise_id == Exercise.exercise_id,
+            condition,
+        )
 
     def get_by_name(self, name: str) -> Optional[Exercise]:
-        """Exact (case-insensitive) name lookup."""
+        """Exact (case-insensitive) name lookup, seeking on ``NameNormalized``."""
         stmt = (
             select(Exercise)
-            .where(Exercise.name.ilike(name))
+            .where(
+                Exercise.name_normalized == normalize_name(name),
+                func.lower(Exercise.name) == name.lower(),
+            )
         )
         stmt = self._active_filter(stmt)
         return self.db.execute(stmt).scalars().first()
 
+    def get_many(self, exercise_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, Exercise]:
+        """Active exercises for ``exercise_ids`` in one ``IN`` query, keyed by ID.
+
+        IDs that do not exist (or are soft-deleted) are simply absent.
+        """
+        unique_ids = list(dict.fromkeys(exercise_ids))
+        if not unique_ids:
+            return {}
+        stmt = select(Exercise).where(Exercise.exercise_id.in_(unique_ids))
+        stmt = self._active_filter(stmt)
+        return {e.exercise_id: e for e in self.db.execute(stmt).scalars().all()}
+
     # -- create --------------------------------------------------------------
 
     def create_exercise(self, data: ExerciseCreate, creator_id: uuid.UUID) -> Exercise:
         """Create a new exercise owned by ``creator_id``."""
-        exercise = Exercise(
+        exercise = self.create(self._build_exercise(data, creator_id))
+        self._index_names([exercise])
+        self._index_equipment([exercise])
+        self._invalidate_after_commit(exercise_catalog)
+        return exercise
+
+    def create_exercises(
+        self,
+        items: List[ExerciseCreate],
+        creator_id: uuid.UUID,
+    ) -> List[Exercise]:
+        """Create several exercises with a single batched INSERT.
+
+        IDs and timestamps are assigned client-side so no refresh is needed.
+        """
+        now = datetime.utcnow()
+        exercises = [self._build_exercise(data, creator_id) for data in items]
+        for exercise in exercises:
+            exercise.exercise_id = uuid.uuid4()
+            exercise.created_at = now
+            exercise.updated_at = now
+        self.db.add_all(exercises)
+        self.db.flush()
+        self._index_names(exercises)
+        self._index_equipment(exercises)
+        self._invalidate_after_commit(exercise_catalog)
+        return exercises
+
+    @staticmethod
+    def _build_exercise(data: ExerciseCreate, creator_id: uuid.UUID) -> Exercise:
+        return Exercise(
             creator_id=creator_id,
             name=data.name,
+            name_normalized=normalize_name(data.name),
             description=data.description,
             equipment_required=(
                 ",".join(data.equipment_required)
@@ -72,7 +215,6 @@ class ExerciseRepository(BaseRepository[Exercise]):
             ),
             instructions=data.instructions,
         )
-        return self.create(exercise)
 
     # -- update --------------------------------------------------------------
 
@@ -90,11 +232,84 @@ class ExerciseRepository(BaseRepository[Exercise]):
                 value = value.value if isinstance(value, MuscleGroup) else value
             if field == "difficulty_level" and value is not None:
                 value = value.value if isinstance(value, DifficultyLevel) else value
-            setattr(exercise, field, value)
-        self.db.flush()
-        self.db.refresh(exercise)
+            update_data[field] = value
+        renamed = update_data.get("name") is not None
+        if renamed:
+            update_data["name_normalized"] = normalize_name(update_data["name"])
+        exercise = self.update_fields(exercise, update_data)
+        if renamed:
+            self._index_names([exercise], replace=True)
+        if "equipment_required" in update_data:
+            self._index_equipment([exercise], replace=True)
+        self._invalidate_after_commit(exercise_catalog)
         return exercise
 
+    # -- delete --------------------------------------------------------------
+
+    def delete(self, entity: Exercise) -> None:
+        """Soft-delete an exercise and drop it from the in-memory catalog."""
+        super().delete(entity)
+        self._invalidate_after_commit(exercise_catalog)
+
+    # -- name index ----------------------------------------------------------
+
+    def reindex_names(self, exercises: List[Exercise]) -> None:
+        """Recompute ``NameNormalized`` and the name tokens for ``exercises``.
+
+        Used by ``scripts.backfill_exercise_search`` for rows written before
+        the index existed (or after a change to ``normalize_name``).
+        """
+        if not exercises:
+            return
+        self.db.execute(
+            update(Exercise),
+            [
+                {"exercise_id": e.exercise_id, "name_normalized": normalize_name(e.name)}
+                for e in exercises
+            ],
+        )
+        self._index_names(exercises, replace=True)
+
+    def _index_names(self, exercises: List[Exercise], *, replace: bool = False) -> None:
+        """Write the ``ExerciseNameTokens`` rows for ``exercises`` in one INSERT."""
+        if replace:
+            self.db.execute(
+                delete(ExerciseNameToken)
+                .where(ExerciseNameToken.exercise_id.in_([e.exercise_id for e in exercises])),
+                execution_options={"synchronize_session": False},
+            )
+        rows = [
+            {"token": token, "exercise_id": exercise.exercise_id}
+            for exercise in exercises
+            for token in name_tokens(exercise.name)
+        ]
+        if rows:
+            self.db.execute(insert(ExerciseNameToken), rows)
+
+    # -- equipment index -----------------------------------------------------
+
+    def reindex_equipment(self, exercises: List[Exercise]) -> None:
+        """Rebuild the ``ExerciseEquipment`` rows for ``exercises`` from
+        ``EquipmentRequired`` (see ``scripts.backfill_exercise_equipment``)."""
+        if exercises:
+            self._index_equipment(exercises, replace=True)
+
+    def _index_equipment(self, exercises: List[Exercise], *, replace: bool = False) -> None:
+        """Write the ``ExerciseEquipment`` rows for ``exercises`` in one INSERT."""
+        if replace:
+            self.db.execute(
+                delete(ExerciseEquipment)
+                .where(ExerciseEquipment.exercise_id.in_([e.exercise_id for e in exercises])),
+                execution_options={"synchronize_session": False},
+            )
+        rows = [
+            {"exercise_id": exercise.exercise_id, "equipment": item}
+            for exercise in exercises
+            for item in parse_equipment_required(exercise.equipment_required)
+        ]
+        if rows:
+            self.db.execute(insert(ExerciseEquipment), rows)
+
     # -- ownership -----------------------------------------------------------
 
     def is_owner(self, exercise: Exercise, user_id: uuid.UUID) -> bool:
@@ -104,3 +319,9 @@ class ExerciseRepository(BaseRepository[Exercise]):
     def is_system_exercise(self, exercise: Exercise) -> bool:
         """System-seeded exercises have ``creator_id IS NULL``."""
         return exercise.creator_id is None
+
+
+class AsyncExerciseRepository(AsyncBaseRepository[Exercise]):
+    """Exercise reads over an ``AsyncSession`` (``DB_ASYNC_ENABLED``)."""
+
+    model = Exercise
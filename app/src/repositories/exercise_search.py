@@ -0,0 +1,97 @@
+"""Exercise name normalization, tokenization and typo matching.
+
+Names are indexed as a normalized form (``Exercises.NameNormalized``) plus
+one row per token (``ExerciseNameTokens``), so both whole-name and
+per-word prefix lookups are index seeks. Typo tolerance is applied in
+process on the (small) set of indexed tokens that share a query token's
+first letter.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+MAX_TOKEN_LENGTH = 64  # ExerciseNameTokens.Token is NVARCHAR(64)
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lower-case, strip accents and collapse punctuation/whitespace to single spaces.
+
+    ``"Pull-Up (Wide Grip)"`` -> ``"pull up wide grip"``
+    """
+    if not name.isascii():
+        decomposed = unicodedata.normalize("NFKD", name)
+        name = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", name.lower()).strip()
+
+
+def name_tokens(name: str) -> List[str]:
+    """Distinct tokens of ``name`` in order of first appearance."""
+    tokens = (token[:MAX_TOKEN_LENGTH] for token in normalize_name(name).split())
+    return list(dict.fromkeys(tokens))
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """Smallest string above every string starting with ``prefix``.
+
+    ``token >= prefix AND token < prefix_upper_bound(prefix)`` is a prefix
+    match that any index on ``token`` can seek, unlike ``LIKE 'prefix%'``
+    under a case-insensitive LIKE (SQLite).
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def max_typos(token: str) -> int:
+    """Edits tolerated for a query token: none below 3 chars, 2 from 8."""
+    if len(token) < 3:
+        return 0
+    return 1 if len(token) < 8 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """Optimal-string-alignment distance (adjacent swaps count once), or
+    None once it is certain to exceed ``limit``."""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return None
+        prev2, prev = prev, cur
+    return prev[-1] if prev[-1] <= limit else None
+
+
+def token_distance(query_token: str, token: str) -> Optional[int]:
+    """How far ``token`` is from ``query_token`` (None if too far).
+
+    A query token may be an unfinished word (search-as-you-type), so it is
+    also compared against the prefixes of ``token`` within the typo budget
+    of its length.
+    """
+    limit = max_typos(query_token)
+    best = edit_distance(query_token, token, limit)
+    lengths = range(max(1, len(query_token) - limit), min(len(token), len(query_token) + limit + 1))
+    for length in lengths:
+        distance = edit_distance(query_token, token[:length], limit)
+        if distance is not None and (best is None or distance < best):
+            best = distance
+    return best
+
+
+def closest_tokens(query_token: str, vocabulary: Iterable[str]) -> Dict[str, int]:
+    """``{token: distance}`` for every vocabulary token within the typo budget."""
+    matches = {}
+    for token in vocabulary:
+        distance = token_distance(query_token, token)
+        if distance is not None:
+            matches[token] = distance
+    return matches
@@ -0,0 +1,250 @@
+"""Log analytics – chart series computed over a user's whole step-log history.
+
+``LogAnalytics.history`` streams SetStepLogs ⋈ SetLogs ⋈ WorkoutLogs for
+one user, in workout order, into parallel NumPy arrays: one query, rows
+fetched in partitions and never turned into ORM objects. The module-level
+functions compute rolling volume, estimated-1RM trends and week-over-week
+changes from those arrays without a Python loop per step, so multi-year
+histories stay cheap. Reads use the same indexes as
+``LogRepository.exercise_performance``.
+"""
+
+import uuid
+from datetime import date, timedelta
+from typing import NamedTuple, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import Float, cast, select
+from sqlalchemy.orm import Session
+
+from src.db.date_buckets import DAY_NUMBER_EPOCH, day_number
+from src.db.orm_models import Exercise, SetLog, SetStepLog, WorkoutLog
+from src.models.logs import EstimatedOneRepMaxTrend, RollingVolumeSeries, WeeklyVolumeChange
+from src.repositories.personal_record_repository import E1RM_MAX_REPS
+
+# Rows fetched per round trip while streaming a history
+_PARTITION_ROWS = 10_000
+
+_EPOCH = np.datetime64(DAY_NUMBER_EPOCH, "D")
+_DAY = np.timedelta64(1, "D")
+_WEEK = np.timedelta64(7, "D")
+
+
+class StepHistory(NamedTuple):
+    """One entry per step log, oldest workout first."""
+
+    days: np.ndarray  # datetime64[D], the workout's start date
+    reps: np.ndarray  # int64
+    weights: np.ndarray  # float64, NaN where no weight was logged
+
+
+def estimated_1rm(reps: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Epley estimate per step (see ``personal_record_repository.estimated_1rm``);
+    NaN for unweighted steps and sets longer than ``E1RM_MAX_REPS``."""
+    usable = (reps >= 1) & (reps <= E1RM_MAX_REPS) & (weights > 0)
+    epley = np.where(reps == 1, weights, weights * (1 + reps / 30))
+    return np.where(usable, epley, np.nan)
+
+
+def daily_totals(history: StepHistory) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(training days, volume per day, best estimated 1RM per day or NaN)."""
+    if not len(history.days):
+        return history.days, np.zeros(0), np.zeros(0)
+    days, first, index = np.unique(history.days, return_index=True, return_inverse=True)
+    volume = np.bincount(
+        index, weights=np.nan_to_num(history.reps * history.weights), minlength=len(days)
+    )
+    # Steps are in day order, so each day is the run starting at ``first``
+    best = np.fmax.reduceat(estimated_1rm(history.reps, history.weights), first)
+    return days, volume, best
+
+
+def calendar(first: np.datetime64, last: np.datetime64, days: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """``values`` (one per entry of ``days``) spread over every day from
+    ``first`` to ``last``, zero where nothing was logged."""
+    dense = np.zeros((last - first) // _DAY + 1)
+    inside = (days >= first) & (days <= last)
+    dense[(days[inside] - first) // _DAY] = values[inside]
+    return dense
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing ``window``-entry sums (shorter at the start)."""
+    totals = np.cumsum(values)
+    totals[window:] -= totals[:-window].copy()
+    return totals
+
+
+def week_starts(days: np.ndarray) -> np.ndarray:
+    """Monday of the week containing each day."""
+    # 1970-01-01 was a Thursday
+    return days - (days.astype(np.int64) + 3) % 7 * _DAY
+
+
+def _rounded(values: np.ndarray) -> list:
+    return np.round(values, 2).tolist()
+
+
+def _date(day: Optional[date]) -> Optional[np.datetime64]:
+    return None if day is None else np.datetime64(day, "D")
+
+
+class LogAnalytics:
+    """Chart series for one user's logged history."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def history(
+        self,
+        user_id: uuid.UUID,
+        *,
+        exercise_id: Optional[uuid.UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> StepHistory:
+        """The user's step logs as columnar arrays, oldest workout first.
+
+        ``start_date``/``end_date`` are inclusive and apply to the workout's
+        start time. Days come back as integers and weights as floats, so
+        the arrays are filled without per-row date or Decimal objects.
+        """
+        stmt = (
+            select(
+                day_number(WorkoutLog.start_time),
+                SetStepLog.completed_reps,
+                cast(SetStepLog.completed_weight, Float),
+            )
+            .select_from(SetStepLog)
+            .join(SetLog, SetLog.set_log_id == SetStepLog.set_log_id)
+            .join(WorkoutLog, WorkoutLog.workout_log_id == SetLog.workout_log_id)
+            .where(WorkoutLog.user_id == user_id)
+            .order_by(WorkoutLog.start_time)
+            .execution_options(yield_per=_PARTITION_ROWS)
+        )
+        if exercise_id is not None:
+            stmt = stmt.where(SetLog.exercise_id == exercise_id)
+        if start_date is not None:
+            stmt = stmt.where(WorkoutLog.start_time >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(WorkoutLog.start_time < end_date + timedelta(days=1))
+
+        # Plain rows straight off the session's connection skip ORM result
+        # processing; flush first, as Session.execute would have
+        self.db.flush()
+        days, reps, weights = [np.zeros(0, np.int64)], [np.zeros(0, np.int64)], [np.zeros(0)]
+        for partition in self.db.connection().execute(stmt).partitions():
+            day_numbers, step_reps, step_weights = zip(*partition)
+            days.append(np.array(day_numbers, dtype=np.int64))
+            reps.append(np.array(step_reps, dtype=np.int64))
+            weights.append(np.array(step_weights, dtype=np.float64))  # None -> NaN
+        return StepHistory(
+            _EPOCH + np.concatenate(days) * _DAY, np.concatenate(reps), np.concatenate(weights)
+        )
+
+    def rolling_volume(
+        self,
+        user_id: uuid.UUID,
+        *,
+        window: int = 7,
+        exercise_id: Optional[uuid.UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> RollingVolumeSeries:
+        """Volume per day and over the trailing ``window`` days, for every
+        day in range (the logged range if no dates are given)."""
+        load_from = None if start_date is None else start_date - timedelta(days=window - 1)
+        days, volume, _ = daily_totals(self.history(
+            user_id, exercise_id=exercise_id, start_date=load_from, end_date=end_date
+        ))
+        series = RollingVolumeSeries(
+            window=window, start_date=start_date, end_date=end_date, exercise_id=exercise_id
+        )
+        first, last = _date(load_from), _date(end_date)
+        if not len(days) and (first is None or last is None):
+            return series
+        first = days[0] if first is None else first
+        last = days[-1] if last is None else last
+        dense = calendar(first, last, days, volume)
+        keep = slice(window - 1 if start_date is not None else 0, None)
+        series.dates = np.arange(first, last + _DAY)[keep].tolist()
+        series.volume = _rounded(dense[keep])
+        series.rolling_volume = _rounded(rolling_sum(dense, window)[keep])
+        return series
+
+    def e1rm_trend(
+        self,
+        user_id: uuid.UUID,
+        exercise_id: uuid.UUID,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Optional[EstimatedOneRepMaxTrend]:
+        """Best estimated 1RM on each day the exercise was trained, the best
+        so far, and a linear trend; None if the exercise does not exist.
+
+        ``best_to_date`` only counts the requested range.
+        """
+        exists = self.db.execute(
+            select(Exercise.exercise_id).where(Exercise.exercise_id == exercise_id)
+        ).first()
+        if exists is None:
+            return None
+        days, _, best = daily_totals(self.history(
+            user_id, exercise_id=exercise_id, start_date=start_date, end_date=end_date
+        ))
+        estimated = ~np.isnan(best)
+        days, best = days[estimated], best[estimated]
+        slope = None
+        if len(days) > 1:
+            elapsed_weeks = (days - days[0]) / _WEEK
+            slope = round(float(np.polyfit(elapsed_weeks, best, 1)[0]), 2)
+        return EstimatedOneRepMaxTrend(
+            exercise_id=exercise_id,
+            start_date=start_date,
+            end_date=end_date,
+            dates=days.tolist(),
+            estimated_1rm=_rounded(best),
+            best_to_date=_rounded(np.maximum.accumulate(best)),
+            slope_per_week=slope,
+        )
+
+    def weekly_volume(
+        self,
+        user_id: uuid.UUID,
+        *,
+        exercise_id: Optional[uuid.UUID] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> WeeklyVolumeChange:
+        """Volume and reps per week, with the change from the previous week,
+        for every week overlapping the range (the logged range if no dates
+        are given). Weeks start on Monday."""
+        first = None if start_date is None else week_starts(_date(start_date))
+        load_from = None if first is None else (first - _WEEK).tolist()
+        history = self.history(user_id, exercise_id=exercise_id, start_date=load_from, end_date=end_date)
+        series = WeeklyVolumeChange(start_date=start_date, end_date=end_date, exercise_id=exercise_id)
+        last = None if end_date is None else week_starts(_date(end_date))
+        if not len(history.days) and (first is None or last is None):
+            return series
+
+        weeks = week_starts(history.days)
+        # One week before the first so its change has something to compare with
+        origin = (weeks[0] if first is None else first) - _WEEK
+        last = weeks[-1] if last is None else last
+        index = (weeks - origin) // _WEEK
+        count = (last - origin) // _WEEK + 1
+        volume = np.bincount(
+            index, weights=np.nan_to_num(history.reps * history.weights), minlength=count
+        )[:count]
+        reps = np.bincount(index, weights=history.reps, minlength=count)[:count]
+        change = np.diff(volume)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = np.where(volume[:-1] > 0, change / volume[:-1] * 100, np.nan)
+
+        series.week_starts = np.arange(origin + _WEEK, last + _DAY, 7).tolist()
+        series.volume = _rounded(volume[1:])
+        series.reps = reps[1:].astype(np.int64).tolist()
+        series.volume_change = _rounded(change)
+        series.volume_change_pct = [None if np.isnan(p) else p for p in _rounded(pct)]
+        return series
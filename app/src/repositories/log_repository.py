@@ -1,18 +1,30 @@
 """Workout log repository – logging completed workouts with nested sets/steps."""
 
 import uuid
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
-from sqlalchemy import func, select
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import and_, delete, distinct, func, insert, null, or_, select, update
 from sqlalchemy.orm import Session, selectinload, joinedload
 
+from src.db.date_buckets import BUCKET_START
 from src.db.orm_models import (
+    Exercise,
     SetLog,
     SetStepLog,
     WorkoutLog,
 )
 from src.models.logs import (
+    ExercisePerformanceHistory,
+    ExercisePerformancePeriod,
+    LogBatchAction,
+    LogBatchItemResult,
+    LogBatchItemStatus,
+    LogBatchOperation,
+    LogBatchTarget,
+    PerformanceBucket,
     WorkoutLogCreate,
     WorkoutLogUpdate,
     SetLogCreate,
@@ -21,11 +33,123 @@ from src.models.logs import (
     SetStepLogUpdate,
 )
 from src.repositories.base import BaseRepository
+from src.repositories.exercise_repository import ExerciseRepository
+from src.repositories.pagination import paginate_desc
+from src.repositories.personal_record_repository import PersonalRecordRepository, StepResult
+from src.repositories.training_volume_repository import TrainingVolumeRepository
+from src.repositories.workout_stats_repository import WorkoutStatsRepository
+
+
+def _set_log_row(
+    set_log_id: uuid.UUID,
+    workout_log_id: uuid.UUID,
+    data: SetLogCreate,
+    now: datetime,
+) -> Dict[str, Any]:
+    """Attribute mapping for a bulk ``insert(SetLog)`` or a ``SetLog(**row)``."""
+    return {
+        "set_log_id": set_log_id,
+        "workout_log_id": workout_log_id,
+        "original_set_id": data.original_set_id,
+        "set_order": data.set_order,
+        "exercise_id": data.exercise_id,
+        "set_number": data.set_number,
+        "created_at": now,
+    }
+
+
+def _step_log_row(
+    set_step_log_id: uuid.UUID,
+    set_log_id: uuid.UUID,
+    data: SetStepLogCreate,
+    now: datetime,
+) -> Dict[str, Any]:
+    """Attribute mapping for a bulk ``insert(SetStepLog)`` or a ``SetStepLog(**row)``."""
+    return {
+        "set_step_log_id": set_step_log_id,
+        "set_log_id": set_log_id,
+        "original_set_step_id": data.original_set_step_id,
+        "step_order": data.step_order,
+        "completed_reps": data.completed_reps,
+        "completed_weight": data.completed_weight,
+        "completed_time_seconds": data.completed_time_seconds,
+        "rest_time_after_seconds": data.rest_time_after_seconds,
+        "notes": data.notes,
+        "created_at": now,
+    }
+
+
+def _step_results(set_logs: Iterable[SetLog]) -> List[StepResult]:
+    """Record candidates from set logs built in memory."""
+    return [
+        StepResult(sl.exercise_id, st.set_step_log_id, st.completed_reps, st.completed_weight)
+        for sl in set_logs
+        for st in sl.step_logs
+    ]
+
+
+class LogAccess(NamedTuple):
+    """Result of ``LogRepository.check_access`` — which levels matched."""
+
+    log: bool
+    set_log: bool
+    step_log: bool
+
+
+class _LogOwner(NamedTuple):
+    """Who a set/step-log write belongs to, for the rollups it affects."""
+
+    user_id: uuid.UUID
+    start_time: datetime
+    exercise_id: Optional[uuid.UUID]  # only when looked up by set log
 
 
 class LogRepository(BaseRepository[WorkoutLog]):
     model = WorkoutLog
 
+    # -- ownership -----------------------------------------------------------
+
+    def check_access(
+        self,
+        workout_log_id: uuid.UUID,
+        user_id: uuid.UUID,
+        set_log_id: Optional[uuid.UUID] = None,
+        step_log_id: Optional[uuid.UUID] = None,
+    ) -> LogAccess:
+        """Verify ownership and parent/child linkage in one indexed query.
+
+        ``log`` is True if the workout log exists and belongs to ``user_id``;
+        ``set_log`` if ``set_log_id`` belongs to that log; ``step_log`` if
+        ``step_log_id`` belongs to that set log. Levels that were not asked
+        for are reported as False. Nothing but keys is read.
+        """
+        stmt = (
+            select(WorkoutLog.workout_log_id, SetLog.set_log_id, SetStepLog.set_step_log_id)
+            .select_from(WorkoutLog)
+            .outerjoin(
+                SetLog,
+                and_(
+                    SetLog.workout_log_id == WorkoutLog.workout_log_id,
+                    SetLog.set_log_id == set_log_id,
+                ),
+            )
+            .outerjoin(
+                SetStepLog,
+                and_(
+                    SetStepLog.set_log_id == SetLog.set_log_id,
+                    SetStepLog.set_step_log_id == step_log_id,
+                ),
+            )
+            .where(
+                WorkoutLog.workout_log_id == workout_log_id,
+                WorkoutLog.user_id == user_id,
+            )
+        )
+        row = self.db.execute(stmt).first()
+        if row is None:
+            return LogAccess(log=False, set_log=False, step_log=False)
+        return LogAccess(log=True, set_log=row[1] is not None, step_log=row[2] is not None)
+
     # -- read ----------------------------------------------------------------
 
     def get_with_tree(self, workout_log_id: uuid.UUID) -> Optional[WorkoutLog]:
@@ -48,14 +172,17 @@ class LogRepository(BaseRepository[WorkoutLog]):
         *,
         offset: int = 0,
         limit: int = 50,
+        cursor: Optional[str] = None,
     ) -> List[WorkoutLog]:
-        """Recent workout logs for a user (summaries, no nested tree)."""
-        stmt = (
-            select(WorkoutLog)
-            .where(WorkoutLog.user_id == user_id)
-            .order_by(WorkoutLog.start_time.desc())
-            .offset(offset)
-            .limit(limit)
+        """Recent workout logs for a user (summaries, no nested tree).
+
+        Pass ``cursor`` (from ``next_cursor``) instead of ``offset`` to page
+        by ``(start_time, workout_log_id)`` without scanning skipped rows.
+        """
+        stmt = select(WorkoutLog).where(WorkoutLog.user_id == user_id)
+        stmt = paginate_desc(
+            stmt, WorkoutLog.start_time, WorkoutLog.workout_log_id,
+            cursor=cursor, offset=offset, limit=limit,
         )
         return list(self.db.execute(stmt).scalars().all())
 
@@ -69,25 +196,45 @@ class LogRepository(BaseRepository[WorkoutLog]):
     ) -> WorkoutLog:
         """Create a workout log, optionally with nested set/step logs.
 
-        The caller can also add set logs later via ``add_set_log``.
+        ``set_logs`` defaults to ``data.set_logs``; the caller can also add
+        set logs later via ``add_set_log``. IDs and timestamps are assigned
+        up front and the whole session is flushed once (one batched INSERT
+        per table); the returned log has ``set_logs``, ``step_logs`` and
+        ``exercise`` populated in memory, so no re-read is needed.
+
+        Raises:
+            ValueError: If an exercise is missing/deleted or a set log repeats a step_order
         """
+        if set_logs is None:
+            set_logs = data.set_logs
+        now = datetime.utcnow()
+        # Resolve exercises before building the tree so the lookup never autoflushes it
+        exercises = self._resolve_exercises(set_logs)
+
         log = WorkoutLog(
+            workout_log_id=uuid.uuid4(),
             user_id=user_id,
             original_workout_id=data.original_workout_id,
             program_id=data.program_id,
             start_time=data.start_time,
             end_time=data.end_time,
             notes=data.notes,
+            created_at=now,
         )
+        log.set_logs = [
+            self._build_set_log(log.workout_log_id, sl_data, exercises, now)
+            for sl_data in sorted(set_logs, key=lambda sl: sl.set_order)
+        ]
         self.db.add(log)
         self.db.flush()
-
-        if set_logs:
-            for sl_data in set_logs:
-                self._add_set_log(log.workout_log_id, sl_data)
-
-        self.db.flush()
-        return self.get_with_tree(log.workout_log_id)  # type: ignore[return-value]
+        if log.end_time is not None:
+            WorkoutStatsRepository(self.db).record_finish(user_id, log.start_time, None, log.end_time)
+        if log.set_logs:
+            TrainingVolumeRepository(self.db).refresh_day(user_id, log.start_time.date())
+            PersonalRecordRepository(self.db).record_steps(
+                user_id, log.start_time, _step_results(log.set_logs)
+            )
+        return log
 
     # -- update --------------------------------------------------------------
 
@@ -96,14 +243,28 @@ class LogRepository(BaseRepository[WorkoutLog]):
         log: WorkoutLog,
         data: WorkoutLogUpdate,
     ) -> WorkoutLog:
-        """Mark a workout log as finished (set end_time, notes)."""
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(log, field, value)
-        self.db.flush()
-        self.db.refresh(log)
+        """Mark a workout log as finished (set end_time, notes).
+
+        The user's stats rollup is adjusted by the change in end time.
+        """
+        previous_end = log.end_time
+        self.update_fields(log, data.model_dump(exclude_unset=True))
+        WorkoutStatsRepository(self.db).record_finish(log.user_id, log.start_time, previous_end, log.end_time)
         return log
 
+    # -- delete --------------------------------------------------------------
+
+    def delete(self, log: WorkoutLog) -> None:
+        """Delete a workout log with its set/step logs and take it out of the
+        user's stats rollup, daily volume and personal records."""
+        user_id, start_time, end_time = log.user_id, log.start_time, log.end_time
+        records = PersonalRecordRepository(self.db)
+        held = records.held_by(user_id, self._step_ids(SetLog.workout_log_id == log.workout_log_id))
+        super().delete(log)
+        WorkoutStatsRepository(self.db).record_finish(user_id, start_time, end_time, None)
+        TrainingVolumeRepository(self.db).refresh_day(user_id, start_time.date())
+        records.recompute(user_id, held)
+
     # -- add set log to existing workout log ---------------------------------
 
     def add_set_log(
@@ -111,8 +272,143 @@ class LogRepository(BaseRepository[WorkoutLog]):
         workout_log_id: uuid.UUID,
         data: SetLogCreate,
     ) -> SetLog:
-        """Append a set log (with step logs) to an existing workout log."""
-        return self._add_set_log(workout_log_id, data)
+        """Append a set log (with step logs) to an existing workout log.
+
+        Raises:
+            ValueError: If the exercise is missing/deleted or a step_order repeats
+        """
+        set_log = self._add_set_log(workout_log_id, data)
+        owner = self._owner(workout_log_id=workout_log_id)
+        self._refresh_volume(owner)
+        PersonalRecordRepository(self.db).record_steps(
+            owner.user_id, owner.start_time, _step_results([set_log])
+        )
+        return set_log
+
+    # -- batch ingestion -----------------------------------------------------
+
+    def apply_batch(
+        self,
+        workout_log_id: uuid.UUID,
+        operations: List[LogBatchOperation],
+    ) -> List[LogBatchItemResult]:
+        """Apply an ordered batch of set-log / step-log changes to one log.
+
+        Operations are checked in order against an in-memory copy of the
+        log's keys (one SELECT) plus one ``IN`` query for referenced
+        exercises, so each gets its own result and invalid ones are skipped.
+        The surviving changes are then written with at most one statement
+        per table and kind — bulk DELETEs, bulk UPDATEs by primary key, and
+        executemany INSERTs — inside the caller's transaction, followed by
+        one refresh of the log's daily volume and personal records.
+        """
+        payloads: List[Optional[BaseModel]] = []
+        errors: Dict[int, str] = {}
+        for index, op in enumerate(operations):
+            try:
+                payloads.append(_parse_batch_payload(op))
+            except (ValidationError, _BatchItemError) as e:
+                payloads.append(None)
+                errors[index] = _describe_error(e)
+
+        exercise_ids = {
+            p.exercise_id for p in payloads
+            if isinstance(p, (SetLogCreate, SetLogUpdate)) and p.exercise_id is not None
+        }
+        known_exercises = set(ExerciseRepository(self.db).get_many(exercise_ids))
+        batch = _LogBatch(workout_log_id, self._load_batch_keys(workout_log_id), known_exercises)
+
+        results: List[LogBatchItemResult] = []
+        for index, (op, payload) in enumerate(zip(operations, payloads)):
+            if index in errors:
+                status_, entity_id, error = LogBatchItemStatus.FAILED, None, errors[index]
+            else:
+                try:
+                    status_, entity_id = batch.apply(op, payload)
+                    error = None
+                except _BatchItemError as e:
+                    status_, entity_id, error = LogBatchItemStatus.FAILED, None, str(e)
+            results.append(
+                LogBatchItemResult(
+                    index=index,
+                    client_ref=op.client_ref,
+                    status=status_,
+                    id=entity_id,
+                    error=error,
+                )
+            )
+
+        owner = self._owner(workout_log_id=workout_log_id)
+        records = PersonalRecordRepository(self.db)
+        # Steps whose result changed or went away, and sets moved off their exercise
+        changed_steps = batch.deleted_steps | {
+            k for k, v in batch.step_updates.items() if v.keys() & _VOLUME_FIELDS
+        }
+        moved_sets = batch.deleted_sets | {
+            k for k, v in batch.set_updates.items() if "exercise_id" in v
+        }
+        held = set()
+        if changed_steps or moved_sets:
+            held = records.held_by(owner.user_id, self._step_ids(or_(
+                SetStepLog.set_step_log_id.in_(changed_steps),
+                SetStepLog.set_log_id.in_(moved_sets),
+            )))
+        if self._write_batch(batch):
+            self._refresh_volume(owner)
+            records.recompute(owner.user_id, held)
+            new_steps = {k for k, v in batch.new_steps.items() if v["completed_weight"]}
+            candidates = (changed_steps - batch.deleted_steps) | new_steps
+            moved_sets -= batch.deleted_sets
+            if candidates or moved_sets:
+                records.record_steps(owner.user_id, owner.start_time, self._step_results(or_(
+                    SetStepLog.set_step_log_id.in_(candidates),
+                    SetStepLog.set_log_id.in_(moved_sets),
+                )))
+        return results
+
+    def _load_batch_keys(
+        self, workout_log_id: uuid.UUID
+    ) -> List[Tuple[uuid.UUID, Optional[uuid.UUID], Optional[int]]]:
+        """(set_log_id, step_log_id, step_order) for every row under the log."""
+        stmt = (
+            select(SetLog.set_log_id, SetStepLog.set_step_log_id, SetStepLog.step_order)
+            .outerjoin(SetStepLog, SetStepLog.set_log_id == SetLog.set_log_id)
+            .where(SetLog.workout_log_id == workout_log_id)
+        )
+        return [tuple(row) for row in self.db.execute(stmt).all()]
+
+    def _write_batch(self, batch: "_LogBatch") -> bool:
+        """Write the batch's surviving changes; False if there were none."""
+        # Deletes and updates first so freed step orders can be reused by inserts
+        no_sync = {"synchronize_session": False}
+        if batch.deleted_steps:
+            self.db.execute(
+                delete(SetStepLog).where(SetStepLog.set_step_log_id.in_(batch.deleted_steps)),
+                execution_options=no_sync,
+            )
+        if batch.deleted_sets:
+            self.db.execute(
+                delete(SetStepLog).where(SetStepLog.set_log_id.in_(batch.deleted_sets)),
+                execution_options=no_sync,
+            )
+            self.db.execute(
+                delete(SetLog).where(SetLog.set_log_id.in_(batch.deleted_sets)),
+                execution_options=no_sync,
+            )
+        set_updates = [{"set_log_id": k, **v} for k, v in batch.set_updates.items() if v]
+        if set_updates:
+            self.db.execute(update(SetLog), set_updates)
+        step_updates = [{"set_step_log_id": k, **v} for k, v in batch.step_updates.items() if v]
+        if step_updates:
+            self.db.execute(update(SetStepLog), step_updates)
+        if batch.new_sets:
+            self.db.execute(insert(SetLog), list(batch.new_sets.values()))
+        if batch.new_steps:
+            self.db.execute(insert(SetStepLog), list(batch.new_steps.values()))
+        return bool(
+            batch.deleted_steps or batch.deleted_sets or set_updates or step_updates
+            or batch.new_sets or batch.new_steps
+        )
 
     # -- private helpers -----------------------------------------------------
 
@@ -121,32 +417,91 @@ class LogRepository(BaseRepository[WorkoutLog]):
         workout_log_id: uuid.UUID,
         data: SetLogCreate,
     ) -> SetLog:
-        set_log = SetLog(
-            workout_log_id=workout_log_id,
-            original_set_id=data.original_set_id,
-            set_order=data.set_order,
-            exercise_id=data.exercise_id,
-            set_number=data.set_number,
-        )
+        exercises = self._resolve_exercises([data])
+        set_log = self._build_set_log(workout_log_id, data, exercises, datetime.utcnow())
         self.db.add(set_log)
         self.db.flush()
+        return set_log
 
-        for step_data in data.steps:
-            step_log = SetStepLog(
-                set_log_id=set_log.set_log_id,
-                original_set_step_id=step_data.original_set_step_id,
-                step_order=step_data.step_order,
-                completed_reps=step_data.completed_reps,
-                completed_weight=step_data.completed_weight,
-                completed_time_seconds=step_data.completed_time_seconds,
-                rest_time_after_seconds=step_data.rest_time_after_seconds,
-                notes=step_data.notes,
+    def _owner(
+        self,
+        *,
+        workout_log_id: Optional[uuid.UUID] = None,
+        set_log_id: Optional[uuid.UUID] = None,
+    ) -> _LogOwner:
+        """User and start time of a workout log, or of the log owning
+        ``set_log_id`` together with that set's exercise."""
+        if set_log_id is not None:
+            stmt = (
+                select(WorkoutLog.user_id, WorkoutLog.start_time, SetLog.exercise_id)
+                .join(SetLog, SetLog.workout_log_id == WorkoutLog.workout_log_id)
+                .where(SetLog.set_log_id == set_log_id)
+            )
+        else:
+            stmt = select(WorkoutLog.user_id, WorkoutLog.start_time, null()).where(
+                WorkoutLog.workout_log_id == workout_log_id
             )
-            self.db.add(step_log)
+        return _LogOwner(*self.db.execute(stmt).one())
 
-        self.db.flush()
-        self.db.refresh(set_log)
-        return set_log
+    def _refresh_volume(self, owner: _LogOwner) -> None:
+        """Re-materialize the daily volume of the day the owner's log started on."""
+        TrainingVolumeRepository(self.db).refresh_day(owner.user_id, owner.start_time.date())
+
+    @staticmethod
+    def _step_ids(*criteria) -> Any:
+        """Subquery of the IDs of step logs (joined to their set log) matching ``criteria``."""
+        return (
+            select(SetStepLog.set_step_log_id)
+            .join(SetLog, SetLog.set_log_id == SetStepLog.set_log_id)
+            .where(*criteria)
+        )
+
+    def _step_results(self, *criteria) -> List[StepResult]:
+        """Record candidates for the step logs (joined to their set log) matching ``criteria``."""
+        stmt = (
+            select(
+                SetLog.exercise_id,
+                SetStepLog.set_step_log_id,
+                SetStepLog.completed_reps,
+                SetStepLog.completed_weight,
+            )
+            .join(SetLog, SetLog.set_log_id == SetStepLog.set_log_id)
+            .where(*criteria)
+        )
+        return [StepResult(*row) for row in self.db.execute(stmt).all()]
+
+    def _resolve_exercises(
+        self, set_logs: List[SetLogCreate]
+    ) -> Dict[uuid.UUID, Exercise]:
+        """Active exercises referenced by ``set_logs``, fetched in one query."""
+        exercises = ExerciseRepository(self.db).get_many(sl.exercise_id for sl in set_logs)
+        missing = list(dict.fromkeys(
+            str(sl.exercise_id) for sl in set_logs if sl.exercise_id not in exercises
+        ))
+        if missing:
+            raise ValueError(f"Exercise(s) not found or deleted: {', '.join(missing)}")
+        return exercises
+
+    @staticmethod
+    def _build_set_log(
+        workout_log_id: uuid.UUID,
+        data: SetLogCreate,
+        exercises: Dict[uuid.UUID, Exercise],
+        now: datetime,
+    ) -> SetLog:
+        """Build a set log and its step logs in memory with client-side IDs."""
+        orders = [step.step_order for step in data.steps]
+        if len(set(orders)) != len(orders):
+            raise ValueError(f"Duplicate step_order in set log {data.set_order}")
+        set_log_id = uuid.uuid4()
+        return SetLog(
+            **_set_log_row(set_log_id, workout_log_id, data, now),
+            exercise=exercises[data.exercise_id],
+            step_logs=[
+                SetStepLog(**_step_log_row(uuid.uuid4(), set_log_id, step_data, now))
+                for step_data in sorted(data.steps, key=lambda st: st.step_order)
+            ],
+        )
 
     # -- set log CRUD -------------------------------------------------------
 
@@ -160,18 +515,35 @@ class LogRepository(BaseRepository[WorkoutLog]):
         return self.db.execute(stmt).scalars().first()
 
     def update_set_log(self, set_log: SetLog, data) -> SetLog:
-        """Update set log fields."""
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(set_log, field, value)
-        self.db.flush()
-        self.db.refresh(set_log)
+        """Update set log fields.
+
+        Moving the set to another exercise recomputes the records it held on
+        the old one and offers its steps as records on the new one.
+        """
+        values = data.model_dump(exclude_unset=True)
+        moved = "exercise_id" in values and values["exercise_id"] != set_log.exercise_id
+        if moved:
+            owner = self._owner(workout_log_id=set_log.workout_log_id)
+            records = PersonalRecordRepository(self.db)
+            held = records.held_by(owner.user_id, self._step_ids(SetLog.set_log_id == set_log.set_log_id))
+        self.update_fields(set_log, values)
+        if moved:
+            self._refresh_volume(owner)
+            records.recompute(owner.user_id, held)
+            records.record_steps(owner.user_id, owner.start_time, self._step_results(
+                SetLog.set_log_id == set_log.set_log_id
+            ))
         return set_log
 
     def delete_set_log(self, set_log: SetLog) -> None:
         """Delete a set log (and cascade to step logs)."""
+        owner = self._owner(workout_log_id=set_log.workout_log_id)
+        records = PersonalRecordRepository(self.db)
+        held = records.held_by(owner.user_id, self._step_ids(SetLog.set_log_id == set_log.set_log_id))
         self.db.delete(set_log)
         self.db.flush()
+        self._refresh_volume(owner)
+        records.recompute(owner.user_id, held)
 
     # -- step log CRUD ------------------------------------------------------
 
@@ -181,18 +553,36 @@ class LogRepository(BaseRepository[WorkoutLog]):
         return self.db.execute(stmt).scalars().first()
 
     def update_step_log(self, step_log: SetStepLog, data) -> SetStepLog:
-        """Update step log fields."""
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(step_log, field, value)
-        self.db.flush()
-        self.db.refresh(step_log)
+        """Update step log fields.
+
+        A changed result is offered as a record; if the step already held
+        one, its exercise is recomputed instead (the new result may be lower).
+        """
+        values = data.model_dump(exclude_unset=True)
+        self.update_fields(step_log, values)
+        if values.keys() & _VOLUME_FIELDS:
+            owner = self._owner(set_log_id=step_log.set_log_id)
+            self._refresh_volume(owner)
+            records = PersonalRecordRepository(self.db)
+            if records.held_by(owner.user_id, [step_log.set_step_log_id]):
+                records.recompute(owner.user_id, [owner.exercise_id])
+            else:
+                records.record_steps(owner.user_id, owner.start_time, [StepResult(
+                    owner.exercise_id, step_log.set_step_log_id,
+                    step_log.completed_reps, step_log.completed_weight,
+                )])
         return step_log
 
     def delete_step_log(self, step_log: SetStepLog) -> None:
-        """Delete a step log."""
+        """Delete a step log, recomputing any record it held."""
+        owner = self._owner(set_log_id=step_log.set_log_id)
+        records = PersonalRecordRepository(self.db)
+        held = records.held_by(owner.user_id, [step_log.set_step_log_id])
         self.db.delete(step_log)
         self.db.flush()
+        self._refresh_volume(owner)
+        records.recompute(owner.user_id, held)
+
     def create_step_log(self, set_log_id: uuid.UUID, data: SetStepLogCreate) -> SetStepLog:
         """Create a new step log for an existing set log."""
         step_log = SetStepLog(
@@ -208,4 +598,336 @@ class LogRepository(BaseRepository[WorkoutLog]):
         self.db.add(step_log)
         self.db.flush()
         self.db.refresh(step_log)
-        return step_log
\ No newline at end of file
+        owner = self._owner(set_log_id=set_log_id)
+        self._refresh_volume(owner)
+        PersonalRecordRepository(self.db).record_steps(owner.user_id, owner.start_time, [StepResult(
+            owner.exercise_id, step_log.set_step_log_id,
+            step_log.completed_reps, step_log.completed_weight,
+        )])
+        return step_log
+
+    # -- analytics -----------------------------------------------------------
+
+    def exercise_performance(
+        self,
+        user_id: uuid.UUID,
+        exercise_id: uuid.UUID,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        bucket: Optional[PerformanceBucket] = None,
+    ) -> Optional[ExercisePerformanceHistory]:
+        """Sets, reps and weight for one exercise across a user's workout logs.
+
+        A single grouped aggregate over SetLogs ⋈ WorkoutLogs ⋈ SetStepLogs:
+        SetLogs are sought on ``(ExerciseId, WorkoutLogId)`` and step figures
+        read from the covering ``IX_SetStepLogs_SetLogId_Performance``, so
+        no ORM rows are loaded. ``start_date``/``end_date`` are inclusive and
+        apply to the workout's start time; ``bucket`` also splits the totals
+        per day, week or month (periods without sets are omitted).
+
+        Returns None if the exercise does not exist.
+        """
+        name = self.db.execute(
+            select(Exercise.name).where(Exercise.exercise_id == exercise_id)
+        ).scalar_one_or_none()
+        if name is None:
+            return None
+
+        figures = (
+            func.count(distinct(SetLog.set_log_id)),
+            func.sum(SetStepLog.completed_reps),
+            func.max(SetStepLog.completed_weight),
+            func.sum(SetStepLog.completed_weight),
+            func.count(SetStepLog.completed_weight),
+        )
+        if bucket is None:
+            stmt = select(*figures)
+        else:
+            period = BUCKET_START[bucket.value](WorkoutLog.start_time)
+            stmt = select(period, *figures).group_by(period).order_by(period)
+        stmt = (
+            stmt.select_from(SetLog)
+            .join(WorkoutLog, WorkoutLog.workout_log_id == SetLog.workout_log_id)
+            .join(SetStepLog, SetStepLog.set_log_id == SetLog.set_log_id)
+            .where(SetLog.exercise_id == exercise_id, WorkoutLog.user_id == user_id)
+        )
+        if start_date is not None:
+            stmt = stmt.where(WorkoutLog.start_time >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(WorkoutLog.start_time < end_date + timedelta(days=1))
+        rows = self.db.execute(stmt).all()
+
+        periods = []
+        if bucket is not None:
+            periods = [
+                ExercisePerformancePeriod(period_start=row[0], **_performance_figures(*row[1:]))
+                for row in rows
+            ]
+            rows = [(
+                sum(row[1] for row in rows),
+                sum(row[2] for row in rows),
+                max((row[3] for row in rows if row[3] is not None), default=None),
+                sum((row[4] for row in rows if row[4] is not None), Decimal(0)),
+                sum(row[5] for row in rows),
+            )]
+        return ExercisePerformanceHistory(
+            exercise_id=exercise_id,
+            exercise_name=name,
+            start_date=start_date,
+            end_date=end_date,
+            bucket=bucket,
+            periods=periods,
+            **_performance_figures(*rows[0]),
+        )
+
+
+_WEIGHT_PLACES = Decimal("0.01")
+
+# Step-log fields that feed DailyExerciseVolume and PersonalRecords
+_VOLUME_FIELDS = {"completed_reps", "completed_weight"}
+
+
+def _performance_figures(sets, reps, max_weight, weight_sum, weighted_steps) -> Dict[str, Any]:
+    """ExercisePerformance fields from one aggregate row; the average weight
+    is over steps that recorded one."""
+    avg_weight = None
+    if weighted_steps:
+        avg_weight = (Decimal(weight_sum) / weighted_steps).quantize(_WEIGHT_PLACES)
+    return {
+        "total_sets": sets,
+        "total_reps": reps or 0,
+        "max_weight": max_weight,
+        "avg_weight": avg_weight,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Batch ingestion internals
+# ---------------------------------------------------------------------------
+
+class _BatchItemError(ValueError):
+    """A batch operation that cannot be applied (reported per item)."""
+
+
+_BATCH_PAYLOAD_MODELS = {
+    (LogBatchAction.CREATE, LogBatchTarget.SET_LOG): SetLogCreate,
+    (LogBatchAction.UPDATE, LogBatchTarget.SET_LOG): SetLogUpdate,
+    (LogBatchAction.CREATE, LogBatchTarget.STEP_LOG): SetStepLogCreate,
+    (LogBatchAction.UPDATE, LogBatchTarget.STEP_LOG): SetStepLogUpdate,
+}
+
+
+def _parse_batch_payload(op: LogBatchOperation) -> Optional[BaseModel]:
+    model = _BATCH_PAYLOAD_MODELS.get((op.action, op.target))
+    if model is None:
+        return None  # deletes carry no payload
+    if op.data is None:
+        raise _BatchItemError("data is required")
+    return model.model_validate(op.data)
+
+
+def _describe_error(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+            for err in e.errors()
+        )
+    return str(e)
+
+
+class _LogBatch:
+    """In-memory view of one workout log's set/step logs while a batch is checked.
+
+    Every operation is validated before it mutates this state, so a failed
+    operation leaves no trace. Pending writes accumulate in ``new_*``,
+    ``*_updates`` and ``deleted_*``; changes to rows created earlier in the
+    same batch are folded into their insert rows.
+    """
+
+    def __init__(
+        self,
+        workout_log_id: uuid.UUID,
+        keys: Iterable[Tuple[uuid.UUID, Optional[uuid.UUID], Optional[int]]],
+        known_exercises: Set[uuid.UUID],
+    ):
+        self.workout_log_id = workout_log_id
+        self.known_exercises = known_exercises
+        self.now = datetime.utcnow()
+        self.set_ids: Set[uuid.UUID] = set()
+        self.step_parent: Dict[uuid.UUID, uuid.UUID] = {}
+        self.step_order_of: Dict[uuid.UUID, int] = {}
+        self.step_orders: Dict[uuid.UUID, Dict[int, uuid.UUID]] = {}
+        for set_log_id, step_log_id, step_order in keys:
+            self.set_ids.add(set_log_id)
+            self.step_orders.setdefault(set_log_id, {})
+            if step_log_id is not None:
+                self.step_parent[step_log_id] = set_log_id
+                self.step_order_of[step_log_id] = step_order
+                self.step_orders[set_log_id][step_order] = step_log_id
+
+        self.refs: Dict[str, uuid.UUID] = {}
+        self.new_sets: Dict[uuid.UUID, Dict[str, Any]] = {}
+        self.new_steps: Dict[uuid.UUID, Dict[str, Any]] = {}
+        self.set_updates: Dict[uuid.UUID, Dict[str, Any]] = {}
+        self.step_updates: Dict[uuid.UUID, Dict[str, Any]] = {}
+        self.deleted_sets: Set[uuid.UUID] = set()
+        self.deleted_steps: Set[uuid.UUID] = set()
+
+    def apply(
+        self, op: LogBatchOperation, payload: Optional[BaseModel]
+    ) -> Tuple[LogBatchItemStatus, uuid.UUID]:
+        if op.target == LogBatchTarget.SET_LOG:
+            if op.action == LogBatchAction.CREATE:
+                return self._create_set_log(op, payload)
+            if op.action == LogBatchAction.UPDATE:
+                return self._update_set_log(op, payload)
+            return self._delete_set_log(op)
+        if op.action == LogBatchAction.CREATE:
+            return self._create_step_log(op, payload)
+        if op.action == LogBatchAction.UPDATE:
+            return self._update_step_log(op, payload)
+        return self._delete_step_log(op)
+
+    # -- checks --------------------------------------------------------------
+
+    def _check_exercise(self, exercise_id: uuid.UUID) -> None:
+        if exercise_id not in self.known_exercises:
+            raise _BatchItemError(f"Exercise {exercise_id} not found or has been deleted")
+
+    def _check_step_order(
+        self, set_log_id: uuid.UUID, step_order: int, step_log_id: Optional[uuid.UUID] = None
+    ) -> None:
+        holder = self.step_orders[set_log_id].get(step_order)
+        if holder is not None and holder != step_log_id:
+            raise _BatchItemError(f"step_order {step_order} is already used in set log {set_log_id}")
+
+    def _require_set_log(self, set_log_id: Optional[uuid.UUID]) -> uuid.UUID:
+        if set_log_id is None:
+            raise _BatchItemError("set_log_id is required")
+        if set_log_id not in self.set_ids:
+            raise _BatchItemError(f"Set log {set_log_id} not found in this workout log")
+        return set_log_id
+
+    def _require_step_log(self, op: LogBatchOperation) -> uuid.UUID:
+        if op.step_log_id is None:
+            raise _BatchItemError("step_log_id is required")
+        parent = self.step_parent.get(op.step_log_id)
+        if parent is None or (op.set_log_id is not None and op.set_log_id != parent):
+            raise _BatchItemError(f"Step log {op.step_log_id} not found in this workout log")
+        return op.step_log_id
+
+    # -- set logs ------------------------------------------------------------
+
+    def _create_set_log(self, op, data: SetLogCreate):
+        set_log_id = op.set_log_id or uuid.uuid4()
+        if set_log_id in self.set_ids:
+            self._remember_ref(op, set_log_id)
+            return LogBatchItemStatus.UNCHANGED, set_log_id
+        self._check_exercise(data.exercise_id)
+        orders = [step.step_order for step in data.steps]
+        if len(set(orders)) != len(orders):
+            raise _BatchItemError("Duplicate step_order within set log")
+
+        self.set_ids.add(set_log_id)
+        self.step_orders[set_log_id] = {}
+        self.new_sets[set_log_id] = _set_log_row(set_log_id, self.workout_log_id, data, self.now)
+        for step in data.steps:
+            self._add_step(set_log_id, uuid.uuid4(), step)
+        self._remember_ref(op, set_log_id)
+        return LogBatchItemStatus.CREATED, set_log_id
+
+    def _update_set_log(self, op, data: SetLogUpdate):
+        set_log_id = self._require_set_log(op.set_log_id)
+        # Every SetLog column is NOT NULL, so explicit nulls are ignored
+        fields = {k: v for k, v in data.model_dump(exclude_unset=True).items() if v is not None}
+        if "exercise_id" in fields:
+            self._check_exercise(fields["exercise_id"])
+        if set_log_id in self.new_sets:
+            self.new_sets[set_log_id].update(fields)
+        else:
+            self.set_updates.setdefault(set_log_id, {}).update(fields)
+        return LogBatchItemStatus.UPDATED, set_log_id
+
+    def _delete_set_log(self, op):
+        if op.set_log_id is None:
+            raise _BatchItemError("set_log_id is required")
+        set_log_id = op.set_log_id
+        if set_log_id not in self.set_ids:
+            return LogBatchItemStatus.UNCHANGED, set_log_id
+
+        for step_log_id in list(self.step_orders[set_log_id].values()):
+            self._forget_step(step_log_id)  # removed with the set log
+        del self.step_orders[set_log_id]
+        self.set_ids.discard(set_log_id)
+        self.set_updates.pop(set_log_id, None)
+        if self.new_sets.pop(set_log_id, None) is None:
+            self.deleted_sets.add(set_log_id)
+        return LogBatchItemStatus.DELETED, set_log_id
+
+    def _remember_ref(self, op, set_log_id: uuid.UUID) -> None:
+        if op.client_ref:
+            self.refs[op.client_ref] = set_log_id
+
+    # -- step logs -----------------------------------------------------------
+
+    def _create_step_log(self, op, data: SetStepLogCreate):
+        parent = op.set_log_id
+        if parent is None and op.set_log_ref is not None:
+            parent = self.refs.get(op.set_log_ref)
+            if parent is None:
+                raise _BatchItemError(f"Unknown set_log_ref '{op.set_log_ref}'")
+        parent = self._require_set_log(parent)
+
+        step_log_id = op.step_log_id or uuid.uuid4()
+        if step_log_id in self.step_parent:
+            return LogBatchItemStatus.UNCHANGED, step_log_id
+        self._add_step(parent, step_log_id, data)
+        return LogBatchItemStatus.CREATED, step_log_id
+
+    def _update_step_log(self, op, data: SetStepLogUpdate):
+        step_log_id = self._require_step_log(op)
+        parent = self.step_parent[step_log_id]
+        fields = data.model_dump(exclude_unset=True)
+        for required in ("step_order", "completed_reps"):
+            if fields.get(required, 0) is None:
+                del fields[required]
+
+        new_order = fields.get("step_order")
+        if new_order is not None and new_order != self.step_order_of[step_log_id]:
+            self._check_step_order(parent, new_order, step_log_id)
+            del self.step_orders[parent][self.step_order_of[step_log_id]]
+            self.step_orders[parent][new_order] = step_log_id
+            self.step_order_of[step_log_id] = new_order
+
+        if step_log_id in self.new_steps:
+            self.new_steps[step_log_id].update(fields)
+        else:
+            self.step_updates.setdefault(step_log_id, {}).update(fields)
+        return LogBatchItemStatus.UPDATED, step_log_id
+
+    def _delete_step_log(self, op):
+        if op.step_log_id is None:
+            raise _BatchItemError("step_log_id is required")
+        if op.step_log_id not in self.step_parent:
+            return LogBatchItemStatus.UNCHANGED, op.step_log_id
+        step_log_id = self._require_step_log(op)
+        if not self._forget_step(step_log_id):
+            self.deleted_steps.add(step_log_id)
+        return LogBatchItemStatus.DELETED, step_log_id
+
+    def _add_step(self, set_log_id: uuid.UUID, step_log_id: uuid.UUID, data: SetStepLogCreate) -> None:
+        self._check_step_order(set_log_id, data.step_order)
+        self.step_parent[step_log_id] = set_log_id
+        self.step_order_of[step_log_id] = data.step_order
+        self.step_orders[set_log_id][data.step_order] = step_log_id
+        self.new_steps[step_log_id] = _step_log_row(step_log_id, set_log_id, data, self.now)
+
+    def _forget_step(self, step_log_id: uuid.UUID) -> bool:
+        """Drop a step from the view; True if it was only a pending insert."""
+        parent = self.step_parent.pop(step_log_id)
+        order = self.step_order_of.pop(step_log_id)
+        if self.step_orders.get(parent, {}).get(order) == step_log_id:
+            del self.step_orders[parent][order]
+        self.step_updates.pop(step_log_id, None)
+        return self.new_steps.pop(step_log_id, None) is not None
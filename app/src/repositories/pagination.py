@@ -0,0 +1,77 @@
+"""Keyset (cursor) pagination helpers.
+
+List endpoints order newest-first on ``(timestamp, id)``. A cursor is the
+opaque, URL-safe encoding of the last row's pair; the next page is every row
+strictly "before" it, which the ``(owner, timestamp DESC, id DESC)`` indexes
+answer with a seek instead of reading and discarding ``OFFSET`` rows.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(sort_value: datetime, entity_id: uuid.UUID) -> str:
+    """Encode a ``(timestamp, id)`` position as an opaque cursor string."""
+    raw = json.dumps([sort_value.isoformat(), str(entity_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, entity_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), uuid.UUID(entity_id)
+    except Exception as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def paginate_desc(
+    stmt: Any,
+    sort_col: Any,
+    id_col: Any,
+    *,
+    cursor: Optional[str],
+    offset: int,
+    limit: int,
+) -> Any:
+    """Order ``stmt`` newest-first and apply a cursor (or, without one, an offset).
+
+    ``offset`` is only honoured when no cursor is given.
+    """
+    if cursor is not None:
+        sort_value, entity_id = decode_cursor(cursor)
+        # The leading ``<=`` gives the optimizer a seekable range on the index;
+        # the OR only disambiguates rows that share the cursor's timestamp.
+        stmt = stmt.where(
+            sort_col <= sort_value,
+            or_(
+                sort_col < sort_value,
+                and_(sort_col == sort_value, id_col < entity_id),
+            ),
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
+    return stmt.order_by(sort_col.desc(), id_col.desc()).limit(limit)
+
+
+def next_cursor(
+    items: Sequence[Any],
+    limit: int,
+    sort_attr: str,
+    id_attr: str,
+) -> Optional[str]:
+    """Cursor for the page after ``items``, or None if this page was the last."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
@@ -0,0 +1,236 @@
+"""Personal record repository – per-user, per-exercise bests.
+
+``PersonalRecords`` holds one row per (user, exercise, rep count) with the
+heaviest weight logged for exactly that many reps and the step log that
+set it. Max weight and estimated 1RM are derived from those rows, so every
+record of an exercise is one primary-key range read. ``LogRepository``
+applies newly logged steps incrementally; editing or deleting a step that
+holds a record recomputes that exercise from the user's history, and
+``scripts.rebuild_personal_records`` recomputes everything.
+"""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from sqlalchemy import Select, delete, distinct, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from src.db.orm_models import Exercise, PersonalRecord, SetLog, SetStepLog, WorkoutLog
+from src.models.logs import EstimatedOneRepMax, ExerciseRecords, RepMax
+from src.repositories.base import BaseRepository
+
+# Epley overestimates badly past this many reps, so longer sets are ignored
+E1RM_MAX_REPS = 12
+
+_WEIGHT_PLACES = Decimal("0.01")
+
+
+def estimated_1rm(weight: Decimal, reps: int) -> Decimal:
+    """Epley estimate ``weight × (1 + reps / 30)``; a single is its own 1RM."""
+    if reps == 1:
+        return weight
+    return (weight * (1 + Decimal(reps) / 30)).quantize(_WEIGHT_PLACES)
+
+
+class StepResult(NamedTuple):
+    """A logged step as a record candidate."""
+
+    exercise_id: uuid.UUID
+    set_step_log_id: uuid.UUID
+    reps: Optional[int]
+    weight: Optional[Decimal]
+
+
+def _counts(reps: Optional[int], weight: Optional[Decimal]) -> bool:
+    """Only weighted steps with at least one rep can set a record."""
+    return bool(reps and reps >= 1 and weight is not None and weight > 0)
+
+
+class PersonalRecordRepository(BaseRepository[PersonalRecord]):
+    model = PersonalRecord
+
+    # -- maintenance ---------------------------------------------------------
+
+    def record_steps(
+        self,
+        user_id: uuid.UUID,
+        achieved_at: datetime,
+        steps: Iterable[StepResult],
+    ) -> List[Tuple[uuid.UUID, int]]:
+        """Apply steps newly logged in a workout started at ``achieved_at``.
+
+        Reads the current records of the exercises involved in one query and
+        writes only the (exercise, reps) pairs that were beaten — by a heavier
+        weight, or the same weight in an earlier workout. Returns those pairs.
+
+        New pairs are inserted in a savepoint: if a concurrent write inserted
+        one of them first, their exercises are recomputed instead.
+        """
+        best = {}
+        for step in steps:
+            if not _counts(step.reps, step.weight):
+                continue
+            key = (step.exercise_id, step.reps)
+            if key not in best or step.weight > best[key].weight:
+                best[key] = step
+        if not best:
+            return []
+
+        current = self._current(user_id, {exercise_id for exercise_id, _ in best})
+        inserts, updates = [], []
+        for key, step in best.items():
+            row = {
+                "user_id": user_id,
+                "exercise_id": step.exercise_id,
+                "reps": step.reps,
+                "weight": step.weight,
+                "set_step_log_id": step.set_step_log_id,
+                "achieved_at": achieved_at,
+            }
+            held = current.get(key)
+            if held is None:
+                inserts.append(row)
+            elif step.weight > held.weight or (step.weight == held.weight and achieved_at < held.achieved_at):
+                updates.append(row)
+        if updates:
+            self.db.execute(update(PersonalRecord), updates)
+        if inserts:
+            try:
+                with self.db.begin_nested():
+                    self.db.execute(insert(PersonalRecord), inserts)
+            except IntegrityError:
+                self.recompute(user_id, {row["exercise_id"] for row in inserts})
+        return [(row["exercise_id"], row["reps"]) for row in inserts + updates]
+
+    def _current(self, user_id: uuid.UUID, exercise_ids: Set[uuid.UUID]) -> Dict[Tuple[uuid.UUID, int], Any]:
+        """The user's records for ``exercise_ids``, keyed by (exercise, reps)."""
+        rows = self.db.execute(
+            select(
+                PersonalRecord.exercise_id,
+                PersonalRecord.reps,
+                PersonalRecord.weight,
+                PersonalRecord.achieved_at,
+            ).where(
+                PersonalRecord.user_id == user_id,
+                PersonalRecord.exercise_id.in_(exercise_ids),
+            )
+        ).all()
+        return {(row.exercise_id, row.reps): row for row in rows}
+
+    def held_by(
+        self,
+        user_id: uuid.UUID,
+        step_log_ids: Union[Iterable[uuid.UUID], Select],
+    ) -> Set[uuid.UUID]:
+        """Exercises with a record set by one of ``step_log_ids`` (a list or a
+        subquery), i.e. those to recompute when the steps change or go away."""
+        if not isinstance(step_log_ids, Select):
+            step_log_ids = list(step_log_ids)
+            if not step_log_ids:
+                return set()
+        stmt = select(distinct(PersonalRecord.exercise_id)).where(
+            PersonalRecord.user_id == user_id,
+            PersonalRecord.set_step_log_id.in_(step_log_ids),
+        )
+        return set(self.db.execute(stmt).scalars().all())
+
+    def recompute(
+        self,
+        user_id: uuid.UUID,
+        exercise_ids: Optional[Iterable[uuid.UUID]] = None,
+    ) -> None:
+        """Rebuild the user's records for ``exercise_ids`` (all if None) from
+        their step logs.
+
+        One DELETE and one INSERT ... SELECT keeping, per (exercise, reps),
+        the heaviest step; on a tie the first logged (earliest workout, then
+        set and step order), as ``record_steps`` would have kept it.
+        """
+        if exercise_ids is not None:
+            exercise_ids = list(exercise_ids)
+            if not exercise_ids:
+                return
+        rank = func.row_number().over(
+            partition_by=(SetLog.exercise_id, SetStepLog.completed_reps),
+            order_by=(
+                SetStepLog.completed_weight.desc(),
+                WorkoutLog.start_time,
+                SetLog.set_order,
+                SetStepLog.step_order,
+            ),
+        )
+        ranked = (
+            select(
+                WorkoutLog.user_id,
+                SetLog.exercise_id,
+                SetStepLog.completed_reps,
+                SetStepLog.completed_weight,
+                SetStepLog.set_step_log_id,
+                WorkoutLog.start_time,
+                rank.label("row_rank"),
+            )
+            .select_from(SetStepLog)
+            .join(SetLog, SetLog.set_log_id == SetStepLog.set_log_id)
+            .join(WorkoutLog, WorkoutLog.workout_log_id == SetLog.workout_log_id)
+            .where(
+                WorkoutLog.user_id == user_id,
+                SetStepLog.completed_reps >= 1,
+                SetStepLog.completed_weight > 0,
+            )
+        )
+        stale = delete(PersonalRecord).where(PersonalRecord.user_id == user_id)
+        if exercise_ids is not None:
+            ranked = ranked.where(SetLog.exercise_id.in_(exercise_ids))
+            stale = stale.where(PersonalRecord.exercise_id.in_(exercise_ids))
+        ranked = ranked.subquery()
+        self.db.execute(stale, execution_options={"synchronize_session": False})
+        self.db.execute(insert(PersonalRecord).from_select(
+            [
+                PersonalRecord.user_id,
+                PersonalRecord.exercise_id,
+                PersonalRecord.reps,
+                PersonalRecord.weight,
+                PersonalRecord.set_step_log_id,
+                PersonalRecord.achieved_at,
+            ],
+            select(*(c for c in ranked.c if c.name != "row_rank")).where(ranked.c.row_rank == 1),
+        ))
+
+    # -- read ----------------------------------------------------------------
+
+    def get_records(self, user_id: uuid.UUID, exercise_id: uuid.UUID) -> Optional[ExerciseRecords]:
+        """The user's records for one exercise; None if the exercise does not exist.
+
+        The exercise is only looked up when the user holds no records for it.
+        """
+        rows = self.db.execute(
+            select(
+                PersonalRecord.reps,
+                PersonalRecord.weight,
+                PersonalRecord.set_step_log_id,
+                PersonalRecord.achieved_at,
+            )
+            .where(PersonalRecord.user_id == user_id, PersonalRecord.exercise_id == exercise_id)
+            .order_by(PersonalRecord.reps)
+        ).all()
+        if not rows:
+            exists = self.db.execute(
+                select(Exercise.exercise_id).where(Exercise.exercise_id == exercise_id)
+            ).first()
+            return ExerciseRecords(exercise_id=exercise_id) if exists else None
+
+        rep_maxes = [RepMax(**row._mapping) for row in rows]
+        # Heaviest weight; on a tie, the one lifted for more reps
+        max_weight = max(rep_maxes, key=lambda rm: (rm.weight, rm.reps))
+        estimates = [
+            EstimatedOneRepMax(**rm.model_dump(), estimated_1rm=estimated_1rm(rm.weight, rm.reps))
+            for rm in rep_maxes if rm.reps <= E1RM_MAX_REPS
+        ]
+        return ExerciseRecords(
+            exercise_id=exercise_id,
+            max_weight=max_weight,
+            estimated_1rm=max(estimates, key=lambda e: e.estimated_1rm, default=None),
+            rep_maxes=rep_maxes,
+        )
@@ -2,11 +2,14 @@
 
 import uuid
 from datetime import date, datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session, selectinload
 
+from src.cache import CatalogCache, ResponseCache
+from src.config import settings
 from src.db.orm_models import (
     Program,
     ProgramWorkout,
@@ -14,7 +17,7 @@ from src.db.orm_models import (
     UserProgramAssignment,
     Workout,
 )
-from src.models.programs import ProgramCreate, ProgramUpdate
+from src.models.programs import ProgramCreate, ProgramSummary, ProgramUpdate
 from src.models.program_assignments import (
     AssignmentStatus,
     ProgramWorkoutLogCreate,
@@ -24,6 +27,24 @@ from src.models.program_assignments import (
     WorkoutLogStatus,
 )
 from src.repositories.base import BaseRepository
+from src.repositories.pagination import paginate_desc
+
+# Serialized GET /programs/{id} bodies, keyed by program_id and tagged with
+# the ``get_version`` stamp they were built from.
+program_response_cache = ResponseCache(
+    max_size=settings.TREE_CACHE_MAX_SIZE,
+    ttl=settings.TREE_CACHE_TTL_SECONDS,
+)
+
+# Pages of the shared catalog (``list_shared``), identical for every user.
+# Retired whenever a shared program is created, edited or deleted, or
+# ``is_shared`` flips.
+shared_programs_cache = CatalogCache(
+    "catalog:programs",
+    max_size=settings.CATALOG_CACHE_MAX_SIZE,
+    ttl=settings.CATALOG_CACHE_TTL_SECONDS,
+)
+_summary_list = TypeAdapter(List[ProgramSummary])
 
 
 # ============================================================================
@@ -48,29 +69,80 @@ class ProgramRepository(BaseRepository[Program]):
         stmt = self._active_filter(stmt)
         return self.db.execute(stmt).scalars().first()
 
+    def get_version(
+        self, program_id: uuid.UUID
+    ) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        """Version stamp of a program's schedule, or None if it doesn't exist.
+
+        ``(program.updated_at, newest updated_at of its scheduled workouts)``
+        — the response embeds workout summaries, so their edits count too.
+        Reads only keys and timestamps, never the schedule itself.
+        """
+        stmt = (
+            select(Program.updated_at, func.max(Workout.updated_at))
+            .outerjoin(ProgramWorkout, ProgramWorkout.program_id == Program.program_id)
+            .outerjoin(Workout, Workout.workout_id == ProgramWorkout.workout_id)
+            .where(Program.program_id == program_id)
+            .group_by(Program.updated_at)
+        )
+        stmt = self._active_filter(stmt)
+        row = self.db.execute(stmt).first()
+        return tuple(row) if row is not None else None
+
     def list_by_creator(
         self,
         creator_id: uuid.UUID,
         *,
         offset: int = 0,
         limit: int = 50,
+        cursor: Optional[str] = None,
     ) -> List[Program]:
         stmt = (
             select(Program)
             .where(Program.creator_id == creator_id)
         )
         stmt = self._active_filter(stmt)
-        stmt = stmt.order_by(Program.created_at.desc()).offset(offset).limit(limit)
+        stmt = paginate_desc(
+            stmt, Program.created_at, Program.program_id,
+            cursor=cursor, offset=offset, limit=limit,
+        )
         return list(self.db.execute(stmt).scalars().all())
 
-    def list_shared(self, *, offset: int = 0, limit: int = 50) -> List[Program]:
+    def list_shared(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> List[ProgramSummary]:
+        """Publicly shared programs, as summaries.
+
+        Pages are served from ``shared_programs_cache``; only the summary
+        columns are read on a miss.
+        """
+        page_key = (cursor, 0 if cursor else offset, limit)
+        cached = shared_programs_cache.get(page_key)
+        if cached is not None:
+            return _summary_list.validate_json(cached)
+
         stmt = (
-            select(Program)
+            select(
+                Program.program_id,
+                Program.name,
+                Program.duration_weeks,
+                Program.is_shared,
+                Program.created_at,
+            )
             .where(Program.is_shared == True)
         )
         stmt = self._active_filter(stmt)
-        stmt = stmt.order_by(Program.created_at.desc()).offset(offset).limit(limit)
-        return list(self.db.execute(stmt).scalars().all())
+        stmt = paginate_desc(
+            stmt, Program.created_at, Program.program_id,
+            cursor=cursor, offset=offset, limit=limit,
+        )
+        summaries = [ProgramSummary.model_validate(row) for row in self.db.execute(stmt).all()]
+        shared_programs_cache.set(page_key, _summary_list.dump_json(summaries))
+        return summaries
 
     # -- create (with schedule) ----------------------------------------------
 
@@ -100,17 +172,25 @@ class ProgramRepository(BaseRepository[Program]):
             self.db.add(pw)
 
         self.db.flush()
+        if program.is_shared:
+            self._invalidate_after_commit(shared_programs_cache)
         return self.get_with_schedule(program.program_id)  # type: ignore[return-value]
 
     # -- update --------------------------------------------------------------
 
     def update_program(self, program: Program, data: ProgramUpdate) -> Program:
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(program, field, value)
-        self.db.flush()
-        self.db.refresh(program)
-        return program
+        program_response_cache.invalidate(program.program_id)
+        if program.is_shared or update_data.get("is_shared"):
+            self._invalidate_after_commit(shared_programs_cache)
+        return self.update_fields(program, update_data)
+
+    def delete(self, entity: Program) -> None:
+        """Soft-delete a program and drop its cached schedule and catalog pages."""
+        program_response_cache.invalidate(entity.program_id)
+        super().delete(entity)
+        if entity.is_shared:
+            self._invalidate_after_commit(shared_programs_cache)
 
 
 # ============================================================================
@@ -205,15 +285,12 @@ class ProgramAssignmentRepository(BaseRepository[UserProgramAssignment]):
         data: UserProgramAssignmentUpdate,
     ) -> UserProgramAssignment:
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if field == "status" and value is not None:
-                value = value.value if isinstance(value, AssignmentStatus) else value
-            setattr(assignment, field, value)
-        if assignment.status == AssignmentStatus.COMPLETED.value:
-            assignment.completed_at = datetime.utcnow()
-        self.db.flush()
-        self.db.refresh(assignment)
-        return assignment
+        if update_data.get("status") is not None:
+            status = update_data["status"]
+            update_data["status"] = status.value if isinstance(status, AssignmentStatus) else status
+        if update_data.get("status", assignment.status) == AssignmentStatus.COMPLETED.value:
+            update_data["completed_at"] = datetime.utcnow()
+        return self.update_fields(assignment, update_data)
 
     # -- workout log updates -------------------------------------------------
 
@@ -223,15 +300,12 @@ class ProgramAssignmentRepository(BaseRepository[UserProgramAssignment]):
         data: ProgramWorkoutLogUpdate,
     ) -> ProgramWorkoutLog:
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            if field == "status" and value is not None:
-                value = value.value if isinstance(value, WorkoutLogStatus) else value
-            setattr(log, field, value)
-        if log.status == WorkoutLogStatus.COMPLETED.value:
-            log.completed_at = datetime.utcnow()
-        self.db.flush()
-        self.db.refresh(log)
-        return log
+        if update_data.get("status") is not None:
+            status = update_data["status"]
+            update_data["status"] = status.value if isinstance(status, WorkoutLogStatus) else status
+        if update_data.get("status", log.status) == WorkoutLogStatus.COMPLETED.value:
+            update_data["completed_at"] = datetime.utcnow()
+        return self.update_fields(log, update_data)
 
     def get_workout_log(
         self,
@@ -287,9 +361,4 @@ class ProgramAssignmentRepository(BaseRepository[UserProgramAssignment]):
         log = self.get_program_workout_log(log_id)
         if log is None:
             return None
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(log, field, value)
-        self.db.flush()
-        self.db.refresh(log)
-        return log
+        return self.update_fields(log, data.model_dump(exclude_unset=True))
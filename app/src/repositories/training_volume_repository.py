@@ -0,0 +1,142 @@
+"""Training volume repository – materialized daily totals for charts.
+
+``DailyExerciseVolume`` holds one row per (user, exercise, day) with the
+sets, reps and volume (reps × weight) logged that day, so a range query
+reads a few rows per day instead of every step log the user has written.
+``LogRepository`` re-materializes the affected user/day in the same
+transaction as each set/step-log write; ``scripts.backfill_training_volume``
+builds rows for existing history.
+"""
+
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, distinct, func, insert, select
+
+from src.db.date_buckets import BUCKET_START, day_start
+from src.db.orm_models import DailyExerciseVolume, Exercise, SetLog, SetStepLog, WorkoutLog
+from src.models.exercises import MuscleGroup
+from src.models.logs import PerformanceBucket, TrainingVolumeSeries
+from src.repositories.base import BaseRepository
+
+_COLUMNS = [
+    DailyExerciseVolume.user_id,
+    DailyExerciseVolume.exercise_id,
+    DailyExerciseVolume.day,
+    DailyExerciseVolume.sets,
+    DailyExerciseVolume.reps,
+    DailyExerciseVolume.volume,
+]
+
+
+def _daily_totals():
+    """(user, exercise, day, sets, reps, volume) aggregate over the logs."""
+    day = day_start(WorkoutLog.start_time)
+    return (
+        select(
+            WorkoutLog.user_id,
+            SetLog.exercise_id,
+            day,
+            func.count(distinct(SetLog.set_log_id)),
+            func.coalesce(func.sum(SetStepLog.completed_reps), 0),
+            func.coalesce(func.sum(SetStepLog.completed_reps * SetStepLog.completed_weight), 0),
+        )
+        .select_from(SetLog)
+        .join(WorkoutLog, WorkoutLog.workout_log_id == SetLog.workout_log_id)
+        .outerjoin(SetStepLog, SetStepLog.set_log_id == SetLog.set_log_id)
+        .group_by(WorkoutLog.user_id, SetLog.exercise_id, day)
+    )
+
+
+class TrainingVolumeRepository(BaseRepository[DailyExerciseVolume]):
+    model = DailyExerciseVolume
+
+    # -- maintenance ---------------------------------------------------------
+
+    def refresh_day(self, user_id: uuid.UUID, day: date) -> None:
+        """Recompute the user's rows for ``day`` from their set/step logs.
+
+        One DELETE and one INSERT ... SELECT over that day's logs, so every
+        kind of write (including a set moved to another exercise) is
+        covered without tracking deltas.
+        """
+        first = datetime.combine(day, time.min)
+        totals = _daily_totals().where(
+            WorkoutLog.user_id == user_id,
+            WorkoutLog.start_time >= first,
+            WorkoutLog.start_time < first + timedelta(days=1),
+        )
+        self.db.execute(
+            delete(DailyExerciseVolume).where(
+                DailyExerciseVolume.user_id == user_id,
+                DailyExerciseVolume.day == day,
+            ),
+            execution_options={"synchronize_session": False},
+        )
+        self.db.execute(insert(DailyExerciseVolume).from_select(_COLUMNS, totals))
+
+    def rebuild(self, user_ids: Iterable[uuid.UUID]) -> None:
+        """Recompute every row of ``user_ids`` from their whole history."""
+        user_ids = list(user_ids)
+        self.db.execute(
+            delete(DailyExerciseVolume).where(DailyExerciseVolume.user_id.in_(user_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        totals = _daily_totals().where(WorkoutLog.user_id.in_(user_ids))
+        self.db.execute(insert(DailyExerciseVolume).from_select(_COLUMNS, totals))
+
+    # -- read ----------------------------------------------------------------
+
+    def series(
+        self,
+        user_id: uuid.UUID,
+        *,
+        bucket: PerformanceBucket = PerformanceBucket.DAY,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        exercise_id: Optional[uuid.UUID] = None,
+        muscle_group: Optional[MuscleGroup] = None,
+    ) -> TrainingVolumeSeries:
+        """The user's volume per day/week/month as parallel arrays.
+
+        Narrowed to one exercise or to exercises whose primary muscle group
+        is ``muscle_group``; ``start_date``/``end_date`` are inclusive.
+        Periods without logged sets are omitted.
+        """
+        period = DailyExerciseVolume.day
+        if bucket is not PerformanceBucket.DAY:
+            period = BUCKET_START[bucket.value](period)
+        stmt = (
+            select(
+                period,
+                func.sum(DailyExerciseVolume.volume),
+                func.sum(DailyExerciseVolume.sets),
+                func.sum(DailyExerciseVolume.reps),
+            )
+            .where(DailyExerciseVolume.user_id == user_id)
+            .group_by(period)
+            .order_by(period)
+        )
+        if start_date is not None:
+            stmt = stmt.where(DailyExerciseVolume.day >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(DailyExerciseVolume.day <= end_date)
+        if exercise_id is not None:
+            stmt = stmt.where(DailyExerciseVolume.exercise_id == exercise_id)
+        if muscle_group is not None:
+            stmt = stmt.join(Exercise, Exercise.exercise_id == DailyExerciseVolume.exercise_id).where(
+                Exercise.primary_muscle_group == muscle_group.value
+            )
+        rows = self.db.execute(stmt).all()
+        return TrainingVolumeSeries(
+            bucket=bucket,
+            start_date=start_date,
+            end_date=end_date,
+            exercise_id=exercise_id,
+            muscle_group=muscle_group,
+            dates=[row[0] for row in rows],
+            volume=[float(row[1]) for row in rows],
+            sets=[row[2] for row in rows],
+            reps=[row[3] for row in rows],
+        )
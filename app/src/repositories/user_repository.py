@@ -6,10 +6,19 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.cache import TTLCache
+from src.config import settings
 from src.db.orm_models import User
 from src.models.users import UserCreate, UserUpdate
 from src.repositories.base import BaseRepository
 
+# Process-wide auth0_sub -> user_id map. Filled on sync and lookup, cleared
+# on delete; other workers converge within the TTL.
+user_id_cache: TTLCache[uuid.UUID] = TTLCache(
+    max_size=settings.USER_ID_CACHE_MAX_SIZE,
+    ttl=settings.USER_ID_CACHE_TTL_SECONDS,
+)
+
 
 class UserRepository(BaseRepository[User]):
     model = User
@@ -21,6 +30,17 @@ class UserRepository(BaseRepository[User]):
         stmt = select(User).where(User.auth0_sub == auth0_sub)
         return self.db.execute(stmt).scalars().first()
 
+    def resolve_user_id(self, auth0_sub: str) -> Optional[uuid.UUID]:
+        """Return the internal user_id for an Auth0 subject, cached per process."""
+        user_id = user_id_cache.get(auth0_sub)
+        if user_id is not None:
+            return user_id
+        stmt = select(User.user_id).where(User.auth0_sub == auth0_sub)
+        user_id = self.db.execute(stmt).scalar_one_or_none()
+        if user_id is not None:
+            user_id_cache.set(auth0_sub, user_id)
+        return user_id
+
     def get_by_email(self, email: str) -> Optional[User]:
         stmt = select(User).where(User.email == email)
         return self.db.execute(stmt).scalars().first()
@@ -35,13 +55,13 @@ class UserRepository(BaseRepository[User]):
         """
         existing = self.get_by_auth0_sub(data.auth0_sub)
         if existing is not None:
-            existing.email = data.email
+            changes = {"email": data.email}
             if data.first_name is not None:
-                existing.first_name = data.first_name
+                changes["first_name"] = data.first_name
             if data.last_name is not None:
-                existing.last_name = data.last_name
-            self.db.flush()
-            self.db.refresh(existing)
+                changes["last_name"] = data.last_name
+            self.update_fields(existing, changes)
+            user_id_cache.set(existing.auth0_sub, existing.user_id)
             return existing
 
         user = User(
@@ -50,14 +70,16 @@ class UserRepository(BaseRepository[User]):
             first_name=data.first_name,
             last_name=data.last_name,
         )
-        return self.create(user)
+        user = self.create(user)
+        user_id_cache.set(user.auth0_sub, user.user_id)
+        return user
+
+    def delete(self, entity: User) -> None:
+        """Delete a user and drop its cached user_id mapping."""
+        user_id_cache.delete(entity.auth0_sub)
+        super().delete(entity)
 
     # -- profile update ------------------------------------------------------
 
     def update_profile(self, user: User, data: UserUpdate) -> User:
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user, field, value)
-        self.db.flush()
-        self.db.refresh(user)
-        return user
+        return self.update_fields(user, data.model_dump(exclude_unset=True))
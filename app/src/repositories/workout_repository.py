@@ -3,21 +3,59 @@
 Supports the inline-exercise creation flow: when a set's ``new_exercise``
 field is populated instead of ``exercise_id``, the exercise is created first
 and the generated ID is wired in — all within a single transaction.
+
+``create_workout`` assigns every primary key client-side and flushes the
+tree once, so the unit of work writes each table with a single batched
+(executemany) INSERT and the response is built from the in-memory objects.
+
+Set and step writes bump the parent workout's ``updated_at``, which (with
+the referenced exercises' ``updated_at``) is the version stamp that keys
+``workout_response_cache``.
 """
 
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session, joinedload, selectinload
 
+from src.cache import CatalogCache, ResponseCache
+from src.config import settings
 from src.db.orm_models import Exercise, Set, SetStep, Workout
 from src.models.exercises import ExerciseCreate
-from src.models.workouts import WorkoutCreate, WorkoutUpdate, SetCreate, SetUpdate, SetStepUpdate
+from src.models.workouts import (
+    WorkoutCreate,
+    WorkoutSummary,
+    WorkoutUpdate,
+    SetCreate,
+    SetUpdate,
+    SetStepUpdate,
+)
 from src.repositories.base import BaseRepository
+from src.repositories.pagination import paginate_desc
 from src.repositories.exercise_repository import ExerciseRepository
 
 
+# Serialized GET /workouts/{id} bodies, keyed by workout_id and tagged with
+# the ``get_version`` stamp they were built from.
+workout_response_cache = ResponseCache(
+    max_size=settings.TREE_CACHE_MAX_SIZE,
+    ttl=settings.TREE_CACHE_TTL_SECONDS,
+)
+
+# Pages of the shared catalog (``list_shared``), identical for every user.
+# Retired whenever a shared workout is created, edited or deleted, or
+# ``is_shared`` flips.
+shared_workouts_cache = CatalogCache(
+    "catalog:workouts",
+    max_size=settings.CATALOG_CACHE_MAX_SIZE,
+    ttl=settings.CATALOG_CACHE_TTL_SECONDS,
+)
+_summary_list = TypeAdapter(List[WorkoutSummary])
+
+
 class WorkoutRepository(BaseRepository[Workout]):
     model = Workout
 
@@ -42,12 +80,33 @@ class WorkoutRepository(BaseRepository[Workout]):
         stmt = self._active_filter(stmt)
         return self.db.execute(stmt).scalars().first()
 
+    def get_version(
+        self, workout_id: uuid.UUID
+    ) -> Optional[Tuple[datetime, Optional[datetime]]]:
+        """Version stamp of a workout's tree, or None if it doesn't exist.
+
+        ``(workout.updated_at, newest updated_at of its exercises)`` — child
+        writes bump the former, exercise edits the latter. Reads only keys
+        and timestamps (``IX_Sets_WorkoutId``), never the tree itself.
+        """
+        stmt = (
+            select(Workout.updated_at, func.max(Exercise.updated_at))
+            .outerjoin(Set, Set.workout_id == Workout.workout_id)
+            .outerjoin(Exercise, Exercise.exercise_id == Set.exercise_id)
+            .where(Workout.workout_id == workout_id)
+            .group_by(Workout.updated_at)
+        )
+        stmt = self._active_filter(stmt)
+        row = self.db.execute(stmt).first()
+        return tuple(row) if row is not None else None
+
     def list_by_creator(
         self,
         creator_id: uuid.UUID,
         *,
         offset: int = 0,
         limit: int = 50,
+        cursor: Optional[str] = None,
     ) -> List[Workout]:
         """Workouts owned by a user (summary — no nested tree)."""
         stmt = (
@@ -55,18 +114,41 @@ class WorkoutRepository(BaseRepository[Workout]):
             .where(Workout.creator_id == creator_id)
         )
         stmt = self._active_filter(stmt)
-        stmt = stmt.order_by(Workout.created_at.desc()).offset(offset).limit(limit)
+        stmt = paginate_desc(
+            stmt, Workout.created_at, Workout.workout_id,
+            cursor=cursor, offset=offset, limit=limit,
+        )
         return list(self.db.execute(stmt).scalars().all())
 
-    def list_shared(self, *, offset: int = 0, limit: int = 50) -> List[Workout]:
-        """Publicly shared workouts."""
+    def list_shared(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> List[WorkoutSummary]:
+        """Publicly shared workouts, as summaries.
+
+        Pages are served from ``shared_workouts_cache``; only the summary
+        columns are read on a miss.
+        """
+        page_key = (cursor, 0 if cursor else offset, limit)
+        cached = shared_workouts_cache.get(page_key)
+        if cached is not None:
+            return _summary_list.validate_json(cached)
+
         stmt = (
-            select(Workout)
+            select(Workout.workout_id, Workout.name, Workout.is_shared, Workout.created_at)
             .where(Workout.is_shared == True)
         )
         stmt = self._active_filter(stmt)
-        stmt = stmt.order_by(Workout.created_at.desc()).offset(offset).limit(limit)
-        return list(self.db.execute(stmt).scalars().all())
+        stmt = paginate_desc(
+            stmt, Workout.created_at, Workout.workout_id,
+            cursor=cursor, offset=offset, limit=limit,
+        )
+        summaries = [WorkoutSummary.model_validate(row) for row in self.db.execute(stmt).all()]
+        shared_workouts_cache.set(page_key, _summary_list.dump_json(summaries))
+        return summaries
 
     # -- create (full tree) --------------------------------------------------
 
@@ -81,52 +163,103 @@ class WorkoutRepository(BaseRepository[Workout]):
         - If ``exercise_id`` is given, validate it exists.
         - If ``new_exercise`` is given, create the exercise first.
         Everything happens in the caller's session (single transaction).
+
+        IDs and timestamps are assigned up front and the whole tree is
+        flushed once; the returned workout has ``sets``, ``steps`` and
+        ``exercise`` populated in memory, so no re-read is needed.
         """
+        now = datetime.utcnow()
         workout = Workout(
+            workout_id=uuid.uuid4(),
             creator_id=creator_id,
             name=data.name,
             description=data.description,
             is_shared=data.is_shared,
+            created_at=now,
+            updated_at=now,
         )
-        self.db.add(workout)
-        self.db.flush()  # gives us workout.workout_id
-
-        for set_data in data.sets:
-            exercise_id = self._resolve_exercise(set_data, creator_id)
-            db_set = Set(
-                workout_id=workout.workout_id,
-                set_order=set_data.set_order,
-                exercise_id=exercise_id,
-                num_sets=set_data.num_sets,
-                rest_seconds=set_data.rest_seconds,
-                notes=set_data.notes,
-            )
-            self.db.add(db_set)
-            self.db.flush()
-
-            for step_data in set_data.steps:
-                db_step = SetStep(
-                    set_id=db_set.set_id,
-                    step_order=step_data.step_order,
-                    planned_reps=step_data.planned_reps,
-                    planned_weight=step_data.planned_weight,
+
+        ordered = sorted(data.sets, key=lambda s: s.set_order)
+        # Resolve exercises before building the tree so lookups never autoflush it
+        exercises = self._resolve_exercises(ordered, creator_id)
+
+        sets = []
+        for index, set_data in enumerate(ordered):
+            exercise = exercises[index]
+            set_id = uuid.uuid4()
+            sets.append(
+                Set(
+                    set_id=set_id,
+                    workout_id=workout.workout_id,
+                    set_order=set_data.set_order,
+                    exercise_id=exercise.exercise_id,
+                    exercise=exercise,
+                    num_sets=set_data.num_sets,
+                    rest_seconds=set_data.rest_seconds,
+                    notes=set_data.notes,
+                    created_at=now,
+                    updated_at=now,
+                    steps=[
+                        SetStep(
+                            set_step_id=uuid.uuid4(),
+                            set_id=set_id,
+                            step_order=step_data.step_order,
+                            planned_reps=step_data.planned_reps,
+                            planned_weight=step_data.planned_weight,
+                            created_at=now,
+                            updated_at=now,
+                        )
+                        for step_data in sorted(set_data.steps, key=lambda st: st.step_order)
+                    ],
                 )
-                self.db.add(db_step)
+            )
+        workout.sets = sets
 
-        self.db.flush()
-        # Return fully-loaded tree
-        return self.get_with_tree(workout.workout_id)  # type: ignore[return-value]
+        self.db.add(workout)
+        self.db.flush()  # one batched INSERT per table
+        if workout.is_shared:
+            self._invalidate_after_commit(shared_workouts_cache)
+        return workout
 
     # -- update --------------------------------------------------------------
 
     def update_workout(self, workout: Workout, data: WorkoutUpdate) -> Workout:
         """Patch top-level workout fields (name, description, is_shared)."""
         update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(workout, field, value)
-        self.db.flush()
-        self.db.refresh(workout)
-        return workout
+        workout_response_cache.invalidate(workout.workout_id)
+        if workout.is_shared or update_data.get("is_shared"):
+            self._invalidate_after_commit(shared_workouts_cache)
+        return self.update_fields(workout, update_data)
+
+    def delete(self, entity: Workout) -> None:
+        """Soft-delete a workout and drop its cached tree and catalog pages."""
+        workout_response_cache.invalidate(entity.workout_id)
+        super().delete(entity)
+        if entity.is_shared:
+            self._invalidate_after_commit(shared_workouts_cache)
+
+    def _touch(
+        self,
+        workout_id: Optional[uuid.UUID] = None,
+        *,
+        set_id: Optional[uuid.UUID] = None,
+    ) -> None:
+        """Bump the parent workout's ``updated_at`` after a set/step write.
+
+        Moving the version stamp is what keeps other workers from serving a
+        cached tree that no longer matches.
+        """
+        if workout_id is None:
+            target = select(Set.workout_id).where(Set.set_id == set_id).scalar_subquery()
+        else:
+            target = workout_id
+            workout_response_cache.invalidate(workout_id)
+        self.db.execute(
+            update(Workout)
+            .where(Workout.workout_id == target)
+            .values(updated_at=datetime.utcnow()),
+            execution_options={"synchronize_session": False},
+        )
 
     # -- set CRUD (nested under workouts) ------------------------------------
 
@@ -160,13 +293,13 @@ class WorkoutRepository(BaseRepository[Workout]):
             raise PermissionError("Not the workout owner")
 
         # Resolve exercise (existing or create new)
-        exercise_id = self._resolve_exercise(data, creator_id)
+        exercise = self._resolve_exercises([data], creator_id)[0]
 
         # Create set
         db_set = Set(
             workout_id=workout_id,
             set_order=data.set_order,
-            exercise_id=exercise_id,
+            exercise_id=exercise.exercise_id,
             num_sets=data.num_sets,
             rest_seconds=data.rest_seconds,
             notes=data.notes,
@@ -185,19 +318,17 @@ class WorkoutRepository(BaseRepository[Workout]):
             self.db.add(db_step)
 
         self.db.flush()
+        self._touch(workout_id)
         return self.get_set(db_set.set_id)  # type: ignore[return-value]
 
     def update_set(self, db_set: Set, data: SetUpdate) -> Set:
         """Update set fields."""
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_set, field, value)
-        self.db.flush()
-        self.db.refresh(db_set)
-        return db_set
+        self._touch(db_set.workout_id)
+        return self.update_fields(db_set, data.model_dump(exclude_unset=True))
 
     def delete_set(self, db_set: Set) -> None:
         """Delete a set (and cascade to its steps)."""
+        self._touch(db_set.workout_id)
         self.db.delete(db_set)
         self.db.flush()
 
@@ -224,40 +355,57 @@ class WorkoutRepository(BaseRepository[Workout]):
         self.db.add(db_step)
         self.db.flush()
         self.db.refresh(db_step)
+        self._touch(db_set.workout_id)
         return db_step
 
     def update_step(self, db_step: SetStep, data: SetStepUpdate) -> SetStep:
         """Update step fields."""
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_step, field, value)
-        self.db.flush()
-        self.db.refresh(db_step)
-        return db_step
+        self._touch(set_id=db_step.set_id)
+        return self.update_fields(db_step, data.model_dump(exclude_unset=True))
 
     def delete_step(self, db_step: SetStep) -> None:
         """Delete a step."""
+        self._touch(set_id=db_step.set_id)
         self.db.delete(db_step)
         self.db.flush()
 
     # -- private helpers -----------------------------------------------------
 
-    def _resolve_exercise(
-        self, set_data: SetCreate, creator_id: uuid.UUID
-    ) -> uuid.UUID:
-        """Return an exercise_id — either the one supplied or from a newly created exercise."""
-        if set_data.exercise_id is not None:
-            # Validate existence
-            exercise = self._exercise_repo.get_by_id(set_data.exercise_id)
-            if exercise is None:
-                raise ValueError(
-                    f"Exercise {set_data.exercise_id} not found or has been deleted."
-                )
-            return exercise.exercise_id
+    def _resolve_exercises(
+        self, sets: List[SetCreate], creator_id: uuid.UUID
+    ) -> Dict[int, Exercise]:
+        """Map each set's position in ``sets`` to its exercise.
 
-        # ``new_exercise`` must be set (Pydantic validator guarantees one-of)
-        assert set_data.new_exercise is not None
-        exercise = self._exercise_repo.create_exercise(
-            set_data.new_exercise, creator_id
+        Referenced ``exercise_id``s are validated with one ``IN`` query and
+        every ``new_exercise`` is created with one batched INSERT.
+
+        Raises:
+            ValueError: Listing every referenced exercise that does not exist
+        """
+        existing = self._exercise_repo.get_many(
+            s.exercise_id for s in sets if s.exercise_id is not None
         )
-        return exercise.exercise_id
+        missing = list(dict.fromkeys(
+            str(s.exercise_id) for s in sets
+            if s.exercise_id is not None and s.exercise_id not in existing
+        ))
+        if missing:
+            raise ValueError(
+                f"Exercise(s) not found or deleted: {', '.join(missing)}"
+            )
+
+        # ``new_exercise`` is set whenever ``exercise_id`` is not (Pydantic one-of)
+        new_positions = [i for i, s in enumerate(sets) if s.exercise_id is None]
+        created: List[Exercise] = []
+        if new_positions:
+            created = self._exercise_repo.create_exercises(
+                [sets[i].new_exercise for i in new_positions], creator_id
+            )
+
+        resolved = {
+            i: existing[s.exercise_id]
+            for i, s in enumerate(sets)
+            if s.exercise_id is not None
+        }
+        resolved.update(zip(new_positions, created))
+        return resolved
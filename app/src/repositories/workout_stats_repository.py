@@ -0,0 +1,183 @@
+"""Workout stats repository – per-user rollup of finished workout logs.
+
+``UserWorkoutStats`` holds one row per user so ``GET /workouts/stats`` is a
+primary-key read instead of an aggregate over the user's whole history.
+``LogRepository`` keeps it current: every change to a log's finish time
+(finishing, re-timing, deleting, or creating an already finished log) is
+applied as a relative ``UPDATE`` in the same transaction. A user without a
+row is rebuilt from ``WorkoutLogs`` on first use, and
+``scripts.rebuild_workout_stats`` recomputes every row from scratch.
+"""
+
+import uuid
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import and_, case, delete, func, insert, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from src.db.orm_models import User, UserWorkoutStats, WorkoutLog
+from src.models.logs import WorkoutStats
+from src.repositories.base import BaseRepository
+
+
+def week_start(day: date) -> date:
+    """Monday of the week containing ``day``."""
+    return day - timedelta(days=day.weekday())
+
+
+def duration_minutes(start_time: datetime, end_time: Optional[datetime]) -> int:
+    """``DATEDIFF(MINUTE, start, end)`` (minute boundaries crossed), as stored
+    in ``WorkoutLogs.TotalDurationMinutes``; 0 for an unfinished log."""
+    if end_time is None:
+        return 0
+    start = start_time.replace(second=0, microsecond=0, tzinfo=None)
+    end = end_time.replace(second=0, microsecond=0, tzinfo=None)
+    return int((end - start).total_seconds()) // 60
+
+
+def _period_counter(start_col, count_col, period: date, delta: int) -> Dict[Any, Any]:
+    """SET clauses adding ``delta`` workouts started in ``period`` to a
+    (period start, count) pair.
+
+    The pair only moves forward: a workout in a later period restarts the
+    count there, one in an earlier period leaves it alone.
+    """
+    current = start_col == period
+    if delta < 0:
+        return {count_col: case((current, count_col + delta), else_=count_col)}
+    newer = or_(start_col.is_(None), start_col < period)
+    return {
+        start_col: case((newer, period), else_=start_col),
+        count_col: case((current, count_col + delta), (newer, delta), else_=count_col),
+    }
+
+
+class WorkoutStatsRepository(BaseRepository[UserWorkoutStats]):
+    model = UserWorkoutStats
+
+    def get_stats(self, user_id: uuid.UUID, *, today: Optional[date] = None) -> WorkoutStats:
+        """The user's WorkoutStats from their rollup row."""
+        today = today or datetime.utcnow().date()
+        stmt = select(
+            UserWorkoutStats.total_workouts,
+            UserWorkoutStats.total_duration_minutes,
+            UserWorkoutStats.week_start,
+            UserWorkoutStats.week_workouts,
+            UserWorkoutStats.month_start,
+            UserWorkoutStats.month_workouts,
+        ).where(UserWorkoutStats.user_id == user_id)
+        row = self.db.execute(stmt).first()
+        if row is None:
+            self._create_row(user_id, today=today)
+            row = self.db.execute(stmt).one()
+        workouts, minutes, week, week_workouts, month, month_workouts = row
+        return WorkoutStats(
+            total_workouts=workouts,
+            total_duration_minutes=minutes,
+            avg_duration_minutes=round(minutes / workouts, 1) if workouts else 0.0,
+            workouts_this_week=week_workouts if week == week_start(today) else 0,
+            workouts_this_month=month_workouts if month == today.replace(day=1) else 0,
+        )
+
+    def record_finish(
+        self,
+        user_id: uuid.UUID,
+        start_time: datetime,
+        previous_end: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> None:
+        """Apply a change of one log's end time (None = unfinished or deleted).
+
+        Call after the log change is flushed: a user without a rollup row is
+        rebuilt from their logs instead, unless a concurrent request created
+        the row first, in which case the change is applied to that row.
+        """
+        workouts = (end_time is not None) - (previous_end is not None)
+        minutes = duration_minutes(start_time, end_time) - duration_minutes(start_time, previous_end)
+        if not workouts and not minutes:
+            return
+        values = {
+            UserWorkoutStats.total_workouts: UserWorkoutStats.total_workouts + workouts,
+            UserWorkoutStats.total_duration_minutes: UserWorkoutStats.total_duration_minutes + minutes,
+        }
+        if workouts:
+            started = start_time.date()
+            values.update(_period_counter(
+                UserWorkoutStats.week_start, UserWorkoutStats.week_workouts,
+                week_start(started), workouts,
+            ))
+            values.update(_period_counter(
+                UserWorkoutStats.month_start, UserWorkoutStats.month_workouts,
+                started.replace(day=1), workouts,
+            ))
+        stmt = update(UserWorkoutStats).where(UserWorkoutStats.user_id == user_id).values(values)
+        options = {"synchronize_session": False}
+        if self.db.execute(stmt, execution_options=options).rowcount == 0 and not self._create_row(user_id):
+            self.db.execute(stmt, execution_options=options)
+
+    def _create_row(self, user_id: uuid.UUID, *, today: Optional[date] = None) -> bool:
+        """Build a missing rollup row in a savepoint.
+
+        Returns False if a concurrent request inserted the row first; it is
+        then left as that request wrote it.
+        """
+        try:
+            with self.db.begin_nested():
+                self.rebuild([user_id], today=today)
+        except IntegrityError:
+            return False
+        return True
+
+    def rebuild(self, user_ids: Iterable[uuid.UUID], *, today: Optional[date] = None) -> None:
+        """Recompute the rollup rows of ``user_ids`` from their workout logs.
+
+        One DELETE and one INSERT ... SELECT; users without finished logs
+        get a zero row.
+        """
+        user_ids = list(user_ids)
+        today = today or datetime.utcnow().date()
+        week = week_start(today)
+        month = today.replace(day=1)
+        next_month = (month + timedelta(days=31)).replace(day=1)
+
+        def started_between(first: date, after: date):
+            in_period = and_(
+                WorkoutLog.start_time >= datetime.combine(first, time.min),
+                WorkoutLog.start_time < datetime.combine(after, time.min),
+            )
+            return func.sum(case((in_period, 1), else_=0))
+
+        rollup = (
+            select(
+                User.user_id,
+                func.count(WorkoutLog.workout_log_id),
+                func.coalesce(func.sum(WorkoutLog.total_duration_minutes), 0),
+                literal(week),
+                started_between(week, week + timedelta(days=7)),
+                literal(month),
+                started_between(month, next_month),
+                literal(datetime.utcnow()),
+            )
+            .select_from(User)
+            .outerjoin(WorkoutLog, and_(
+                WorkoutLog.user_id == User.user_id,
+                WorkoutLog.end_time.is_not(None),
+            ))
+            .where(User.user_id.in_(user_ids))
+            .group_by(User.user_id)
+        )
+        self.db.execute(
+            delete(UserWorkoutStats).where(UserWorkoutStats.user_id.in_(user_ids)),
+            execution_options={"synchronize_session": False},
+        )
+        self.db.execute(insert(UserWorkoutStats).from_select([
+            UserWorkoutStats.user_id,
+            UserWorkoutStats.total_workouts,
+            UserWorkoutStats.total_duration_minutes,
+            UserWorkoutStats.week_start,
+            UserWorkoutStats.week_workouts,
+            UserWorkoutStats.month_start,
+            UserWorkoutStats.month_workouts,
+            UserWorkoutStats.updated_at,
+        ], rollup))
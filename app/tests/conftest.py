@@ -0,0 +1,89 @@
+"""
+Shared fixtures
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# Add parent directory to path to import main and src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from main import app
+from src.auth.dependencies import get_current_user
+from src.auth.models import UserContext
+from src.db.orm_models import Base, Exercise, User
+from src.db.session import get_db
+from src.db.sqlite_compat import SQLITE_EXECUTION_OPTIONS
+from src.models.exercises import MuscleGroup
+from src.models.logs import WorkoutLogCreate
+from src.repositories.log_repository import LogRepository
+
+
+@pytest.fixture
+def db(tmp_path):
+    """ORM session on a throwaway SQLite file with the full schema"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}",
+                           execution_options=SQLITE_EXECUTION_OPTIONS)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def auth0_sub(request):
+    """Subject the ``client`` authenticates as, unique per test because
+    ``resolve_user_id`` caches sub -> user id across the whole run"""
+    return f"auth0|{request.node.name}"
+
+
+@pytest.fixture
+def client(db, auth0_sub):
+    """API client on the ``db`` session, signed in as ``auth0_sub``"""
+    def _db():
+        yield db
+        db.flush()
+
+    app.dependency_overrides[get_db] = _db
+    app.dependency_overrides[get_current_user] = lambda: UserContext(auth0_sub=auth0_sub)
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def seed_logs(db, auth0_sub):
+    """Factory for a user with a logged history of two exercises.
+
+    ``seed_logs(*workouts)`` creates the ``auth0_sub`` user, a chest
+    "bench" and a back "row" exercise, and logs each workout
+    ``(day, (exercise, [(reps, weight), ...]), ...)`` at 18:00 on that day
+    of March 2026, one set log per pair. Returns (user, bench, row, logs).
+    """
+    def _seed(*workouts):
+        user = User(auth0_sub=auth0_sub, email=f"{auth0_sub}@example.com")
+        exercises = {
+            "bench": Exercise(name=f"Bench {auth0_sub}", primary_muscle_group=MuscleGroup.CHEST.value),
+            "row": Exercise(name=f"Row {auth0_sub}", primary_muscle_group=MuscleGroup.BACK.value),
+        }
+        db.add_all([user, *exercises.values()])
+        db.flush()
+        repo = LogRepository(db)
+        logs = [
+            repo.create_workout_log(WorkoutLogCreate(
+                start_time=datetime(2026, 3, day, 18),
+                set_logs=[
+                    {"set_order": order, "exercise_id": exercises[name].exercise_id, "set_number": 1,
+                     "steps": [{"step_order": i, "completed_reps": reps, "completed_weight": weight}
+                               for i, (reps, weight) in enumerate(steps, 1)]}
+                    for order, (name, steps) in enumerate(sets, 1)
+                ],
+            ), user.user_id)
+            for day, *sets in workouts
+        ]
+        return user, exercises["bench"], exercises["row"], logs
+
+    return _seed
@@ -0,0 +1,113 @@
+"""
+TTL cache tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.cache import CacheBackend, CatalogCache, InMemoryCacheBackend, ResponseCache, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    """Entries are served until their TTL elapses"""
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl=60, clock=clock)
+    cache.set("auth0|a", "user-a")
+
+    clock.now = 59
+    assert cache.get("auth0|a") == "user-a"
+    clock.now = 60
+    assert cache.get("auth0|a") is None
+
+
+def test_lru_eviction_and_delete():
+    """Oldest entries are evicted first; delete removes a key"""
+    cache = TTLCache(max_size=2, ttl=60, clock=FakeClock())
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    cache.delete("a")
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_zero_ttl_disables_cache():
+    """A TTL of 0 turns the cache off"""
+    cache = TTLCache(max_size=10, ttl=0, clock=FakeClock())
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert not cache.enabled
+
+
+def test_response_cache_is_version_scoped():
+    """An entry is only served for the version it was built from"""
+    cache = ResponseCache(max_size=10, ttl=60, clock=FakeClock())
+    entry = cache.put("w1", ("2026-01-01", None), b'{"name":"Legs"}')
+
+    assert cache.get("w1", ("2026-01-01", None)) == entry
+    assert cache.get("w1", ("2026-01-02", None)) is None
+    assert entry.etag == ResponseCache.make_etag(b'{"name":"Legs"}')
+    assert entry.etag != ResponseCache.make_etag(b'{"name":"Arms"}')
+    cache.invalidate("w1")
+    assert cache.get("w1", ("2026-01-01", None)) is None
+
+
+def test_catalog_invalidation_reaches_other_workers():
+    """Bumping the shared generation retires pages cached by every worker"""
+    backend = InMemoryCacheBackend(clock=FakeClock())
+    worker_a = CatalogCache("catalog:test", ttl=60, backend=backend, clock=FakeClock())
+    worker_b = CatalogCache("catalog:test", ttl=60, backend=backend, clock=FakeClock())
+
+    worker_a.set((None, 0, 50), b"page-1")
+    assert worker_b.get((None, 0, 50)) == b"page-1"  # filled from the backend
+
+    worker_a.invalidate()
+    assert worker_a.get((None, 0, 50)) is None
+    assert worker_b.get((None, 0, 50)) is None
+
+
+def test_catalog_backend_outage_is_a_miss():
+    """A failing shared backend degrades to the local cache"""
+    class Down(CacheBackend):
+        def get(self, key):
+            raise ConnectionError("down")
+
+        def set(self, key, value, ttl):
+            raise ConnectionError("down")
+
+        def incr(self, key):
+            raise ConnectionError("down")
+
+    cache = CatalogCache("catalog:test", ttl=60, backend=Down(), clock=FakeClock())
+    cache.set("k", b"v")
+    assert cache.get("k") == b"v"
+    cache.invalidate()
+    assert cache.get("k") is None
+
+
+def test_incomplete_backend_is_rejected():
+    """A backend missing a method fails when built, not as silent misses"""
+    class NoIncr(CacheBackend):
+        def get(self, key):
+            return None
+
+        def set(self, key, value, ttl):
+            pass
+
+    with pytest.raises(TypeError):
+        NoIncr()
@@ -0,0 +1,55 @@
+"""
+Connection pool instrumentation tests
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.pool import InstrumentedQueuePool, install_idle_pre_ping, pool_status
+
+
+def _engine(tmp_path, **kwargs):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        **kwargs,
+    )
+
+
+def test_checkouts_and_timeouts_are_recorded(tmp_path):
+    """Each checkout lands in the histogram; exhaustion counts a timeout"""
+    engine = _engine(tmp_path, pool_timeout=0.05)
+    held = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    status = pool_status(engine.pool)
+    assert status["checked_out"] == 1
+    assert status["checkouts"] == 2
+    assert status["checkout_timeouts"] == 1
+    assert sum(status["wait_histogram"].values()) == 2
+    assert status["wait_ms_max"] >= 50
+
+    held.close()
+    assert pool_status(engine.pool)["checked_out"] == 0
+
+
+def test_idle_pre_ping_replaces_dead_connection(tmp_path):
+    """An idle connection that fails the ping is discarded and reconnected"""
+    engine = _engine(tmp_path)
+    install_idle_pre_ping(engine, idle_seconds=0)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        raw = conn.connection.dbapi_connection
+    raw.close()  # simulate the server dropping the idle connection
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+        assert conn.connection.dbapi_connection is not raw
@@ -0,0 +1,132 @@
+"""
+In-memory exercise catalog tests
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+
+from src.models.exercises import DifficultyLevel, ExerciseCreate, ExerciseUpdate, MuscleGroup
+from src.repositories import exercise_catalog as catalog_module
+from src.repositories.exercise_catalog import ExerciseCatalog
+from src.repositories.exercise_repository import ExerciseRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def catalog(clock):
+    return ExerciseCatalog(refresh_seconds=5, clock=clock)
+
+
+def _seed(db):
+    repo = ExerciseRepository(db)
+    repo.create_exercises([
+        ExerciseCreate(name="Bench Press", primary_muscle_group=MuscleGroup.CHEST,
+                       difficulty_level=DifficultyLevel.BEGINNER,
+                       equipment_required=["barbell", "bench"]),
+        ExerciseCreate(name="Incline Bench Press", primary_muscle_group=MuscleGroup.CHEST,
+                       difficulty_level=DifficultyLevel.INTERMEDIATE,
+                       equipment_required=["Dumbbell", "bench"]),
+        ExerciseCreate(name="Bench", primary_muscle_group=MuscleGroup.CHEST),
+        ExerciseCreate(name="Back Squat", primary_muscle_group=MuscleGroup.QUADS,
+                       equipment_required=["barbell"]),
+        ExerciseCreate(name="Benchmark Burpees", primary_muscle_group=MuscleGroup.CARDIO),
+    ], creator_id=None)
+    return repo
+
+
+def _names(rows):
+    return [r.name for r in rows]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"name": "b"},
+    {"name": "bench"},
+    {"name": "benchm"},
+    {"name": "BENCH pr"},
+    {"name": "bench", "offset": 1, "limit": 2},
+    {"name": "sqaut"},
+    {"name": "bencj pres"},
+    {"name": "ench"},
+    {"muscle_group": MuscleGroup.CHEST, "difficulty": DifficultyLevel.INTERMEDIATE},
+    {"name": "bench", "muscle_group": MuscleGroup.CARDIO},
+])
+@pytest.mark.parametrize("sort_threshold", [2048, 0])
+def test_matches_database_search(db, catalog, monkeypatch, kwargs, sort_threshold):
+    """Same results and order as ExerciseRepository.search, on both paging paths"""
+    monkeypatch.setattr(catalog_module, "_SORT_THRESHOLD", sort_threshold)
+    repo = _seed(db)
+    assert _names(catalog.search(db, **kwargs)) == _names(repo.search(**kwargs))
+
+
+def test_name_order_ignores_case(db, catalog):
+    """Names sort case-insensitively, as SQL Server's collation does"""
+    repo = _seed(db)
+    repo.create_exercise(ExerciseCreate(name="barbell Row"), creator_id=None)
+    expected = ["Back Squat", "barbell Row", "Bench", "Bench Press", "Benchmark Burpees"]
+    assert _names(repo.search(limit=5)) == expected
+    assert _names(catalog.search(db, limit=5)) == expected
+
+
+def test_equipment_filter(db, catalog):
+    """Only exercises needing nothing beyond the available equipment"""
+    repo = _seed(db)
+    for available in (["barbell"], [" BARBELL", "Bench"], ["dumbbell", "bench"], []):
+        assert _names(catalog.search(db, equipment=available)) == \
+            _names(repo.search(equipment=available))
+    assert _names(repo.search(equipment=["barbell"])) == ["Back Squat", "Bench", "Benchmark Burpees"]
+    assert _names(repo.search(equipment=["barbell", "bench"])) == [
+        "Back Squat", "Bench", "Bench Press", "Benchmark Burpees"
+    ]
+
+
+def test_incremental_refresh(db, catalog, clock):
+    """Creates, renames and deletes are picked up without a full reload"""
+    repo = _seed(db)
+    assert _names(catalog.search(db, name="squat")) == ["Back Squat"]
+
+    squat = repo.get_by_name("Back Squat")
+    repo.update_exercise(squat, ExerciseUpdate(name="Front Squat"))
+    repo.delete(repo.get_by_name("Bench"))
+    repo.create_exercise(ExerciseCreate(name="Split Squat"), creator_id=None)
+
+    clock.now = 10
+    assert _names(catalog.search(db, name="squat")) == ["Front Squat", "Split Squat"]
+    assert _names(catalog.search(db, name="bench")) == [
+        "Bench Press", "Benchmark Burpees", "Incline Bench Press"
+    ]
+    assert catalog.stats()["full_loads"] == 1
+    assert catalog.stats()["incremental_loads"] == 1
+    assert catalog.stats()["tombstones"] == 2
+
+
+def test_compaction(db, catalog, clock, monkeypatch):
+    """Tombstones are dropped once they outnumber live slots"""
+    monkeypatch.setattr(catalog_module, "_COMPACT_MIN_DEAD", 0)
+    repo = _seed(db)
+    catalog.search(db)
+    for exercise in repo.search():
+        repo.update_exercise(exercise, ExerciseUpdate(description="edited"))
+    repo.delete(repo.get_by_name("Back Squat"))
+
+    clock.now = 10
+    assert _names(catalog.search(db, name="bench", muscle_group=MuscleGroup.CHEST)) == [
+        "Bench", "Bench Press", "Incline Bench Press"
+    ]
+    assert catalog.stats()["tombstones"] == 0
+    assert catalog.stats()["size"] == 4
@@ -0,0 +1,52 @@
+"""
+Exercise response mapping tests
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.models.exercises import (
+    DIFFICULTY_LEVEL_LOOKUP,
+    MUSCLE_GROUP_LOOKUP,
+    DifficultyLevel,
+    ExerciseCreate,
+    ExerciseResponse,
+    MuscleGroup,
+)
+from src.repositories.exercise_repository import ExerciseRepository
+
+
+def test_lookup_tables():
+    """Canonical values and legacy spellings map to members; others to None"""
+    assert MUSCLE_GROUP_LOOKUP["full_body"] is MuscleGroup.FULL_BODY
+    assert MUSCLE_GROUP_LOOKUP["Chest"] is MuscleGroup.CHEST
+    assert MUSCLE_GROUP_LOOKUP["Full Body"] is MuscleGroup.FULL_BODY
+    assert DIFFICULTY_LEVEL_LOOKUP["Beginner"] is DifficultyLevel.BEGINNER
+    assert MUSCLE_GROUP_LOOKUP.get("neck") is None
+    assert MUSCLE_GROUP_LOOKUP.get(None) is None
+
+
+def test_search_page_payload(client, db):
+    """The pre-serialized page matches the declared response model"""
+    ExerciseRepository(db).create_exercises([
+        ExerciseCreate(name="Bench Press", primary_muscle_group=MuscleGroup.CHEST,
+                       difficulty_level=DifficultyLevel.BEGINNER,
+                       equipment_required=["barbell", "bench"]),
+        ExerciseCreate(name="Plank"),
+    ], creator_id=None)
+
+    response = client.get("/api/v1/exercises", params={"name": "bench"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    [body] = response.json()
+    assert body["primary_muscle_group"] == "chest"
+    assert body["difficulty_level"] == "beginner"
+    assert body["equipment_required"] == ["barbell", "bench"]
+    assert ExerciseResponse.model_validate(body).name == "Bench Press"
+
+
+def test_get_exercise_sync_session(client, db):
+    """With async mode off, GET /exercises/{id} reads through the sync session"""
+    plank, = ExerciseRepository(db).create_exercises([ExerciseCreate(name="Plank")], creator_id=None)
+    assert client.get(f"/api/v1/exercises/{plank.exercise_id}").json()["name"] == "Plank"
@@ -0,0 +1,113 @@
+"""
+Exercise name search tests
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import select
+
+from src.db.orm_models import ExerciseNameToken
+from src.models.exercises import DifficultyLevel, ExerciseCreate, ExerciseUpdate, MuscleGroup
+from src.repositories.exercise_repository import ExerciseRepository
+from src.repositories.exercise_search import name_tokens, normalize_name, token_distance
+
+
+def test_normalize_and_tokens():
+    """Accents, case and punctuation are folded away"""
+    assert normalize_name("  Pull-Up (Wide Grip) ") == "pull up wide grip"
+    assert normalize_name("Développé Couché") == "developpe couche"
+    assert name_tokens("Curl, Curl & Press") == ["curl", "press"]
+
+
+def test_token_distance():
+    """Typo budget grows with query length; unfinished words match prefixes"""
+    assert token_distance("squat", "squat") == 0
+    assert token_distance("sqaut", "squat") == 1      # transposition
+    assert token_distance("sqat", "squat") == 1       # missing letter
+    assert token_distance("bnch", "benchpress") == 1  # prefix of a longer word
+    assert token_distance("ab", "ac") is None         # short words must be exact
+    assert token_distance("dedlfit", "deadlift") is None
+    assert token_distance("deadlfit", "deadlift") == 1
+
+
+def _seed(db):
+    repo = ExerciseRepository(db)
+    repo.create_exercises([
+        ExerciseCreate(name="Bench Press", primary_muscle_group=MuscleGroup.CHEST,
+                       difficulty_level=DifficultyLevel.BEGINNER),
+        ExerciseCreate(name="Incline Bench Press", primary_muscle_group=MuscleGroup.CHEST,
+                       difficulty_level=DifficultyLevel.INTERMEDIATE),
+        ExerciseCreate(name="Bench", primary_muscle_group=MuscleGroup.CHEST),
+        ExerciseCreate(name="Back Squat", primary_muscle_group=MuscleGroup.QUADS),
+    ], creator_id=None)
+    return repo
+
+
+def _names(exercises):
+    return [e.name for e in exercises]
+
+
+def test_search_ranks_prefix_matches(db):
+    """Exact name, then name prefix, then any word prefix"""
+    repo = _seed(db)
+    assert _names(repo.search(name="bench")) == ["Bench", "Bench Press", "Incline Bench Press"]
+    assert _names(repo.search(name="BENCH pr")) == ["Bench Press", "Incline Bench Press"]
+    assert _names(repo.search(name="bench", difficulty=DifficultyLevel.INTERMEDIATE)) == [
+        "Incline Bench Press"
+    ]
+    assert _names(repo.search(name="bench", offset=1, limit=1)) == ["Bench Press"]
+    assert repo.search(name="ench") == []  # words match on prefix only
+
+
+def test_search_tolerates_typos(db):
+    """Typos are only considered when nothing matches exactly"""
+    repo = _seed(db)
+    assert _names(repo.search(name="sqaut")) == ["Back Squat"]
+    assert _names(repo.search(name="bencj pres")) == ["Bench Press", "Incline Bench Press"]
+    assert repo.search(name="sqaut", muscle_group=MuscleGroup.CHEST) == []
+
+
+def test_typo_ranking_covers_every_match(db):
+    """Closeness is ranked over all matches before paging, not a sample"""
+    repo = ExerciseRepository(db)
+    repo.create_exercises(
+        [ExerciseCreate(name=f"Alt Deedlift {i:03d}") for i in range(600)]
+        + [ExerciseCreate(name="Romanian Deadlift")],
+        creator_id=None,
+    )
+    assert _names(repo.search(name="deadlfit", limit=2)) == ["Romanian Deadlift", "Alt Deedlift 000"]
+    assert _names(repo.search(name="deadlfit", offset=600)) == ["Alt Deedlift 599"]
+
+
+def test_rename_reindexes(db):
+    """Renaming replaces the name tokens; get_by_name is case-insensitive"""
+    repo = _seed(db)
+    squat = repo.get_by_name("back SQUAT")
+    assert squat is not None
+
+    repo.update_exercise(squat, ExerciseUpdate(name="Front Squat"))
+    tokens = db.execute(
+        select(ExerciseNameToken.token).where(ExerciseNameToken.exercise_id == squat.exercise_id)
+    ).scalars().all()
+    assert sorted(tokens) == ["front", "squat"]
+    assert repo.get_by_name("back squat") is None
+    assert _names(repo.search(name="front")) == ["Front Squat"]
+
+
+def test_equipment_filter_follows_updates(db):
+    """Equipment rows are canonical and replaced when the list changes"""
+    repo = ExerciseRepository(db)
+    row = repo.create_exercise(
+        ExerciseCreate(name="Goblet Squat", equipment_required=[" Kettlebell ", "kettlebell"]),
+        creator_id=None,
+    )
+    assert _names(repo.search(equipment=["KETTLEBELL"])) == ["Goblet Squat"]
+
+    repo.update_exercise(row, ExerciseUpdate(equipment_required=["Dumbbell"]))
+    assert repo.search(equipment=["kettlebell"]) == []
+    assert _names(repo.search(equipment=["dumbbell"])) == ["Goblet Squat"]
+
+    repo.update_exercise(row, ExerciseUpdate(equipment_required=None))
+    assert _names(repo.search(equipment=[])) == ["Goblet Squat"]
@@ -17,3 +17,10 @@ def test_health_check():
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
+
+
+def test_db_pool_stats():
+    """Pool stats endpoint responds before any engine is created"""
+    response = client.get("/api/v1/health/db-pool")
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
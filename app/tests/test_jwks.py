@@ -0,0 +1,203 @@
+"""
+JWKS key store tests
+"""
+import asyncio
+import base64
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwt
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.auth.jwks import JWKSKeyStore
+from src.auth.models import JWKS
+
+
+def _b64url_uint(value: int) -> str:
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _make_key(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+    jwk = {"kid": kid, "kty": "RSA", "use": "sig", "alg": "RS256",
+           "n": _b64url_uint(numbers.n), "e": _b64url_uint(numbers.e)}
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return jwk, pem
+
+
+class FakeFetcher:
+    def __init__(self, *jwks):
+        self.keys = list(jwks)
+        self.calls = 0
+
+    def __call__(self, url: str) -> JWKS:
+        self.calls += 1
+        return JWKS(keys=self.keys)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_key_verifies_token():
+    """Keys are indexed by kid and usable directly by jwt.decode"""
+    jwk, pem = _make_key("k1")
+    store = JWKSKeyStore("https://example/jwks.json", fetcher=FakeFetcher(jwk))
+    store.refresh()
+    token = jwt.encode({"sub": "auth0|1"}, pem, algorithm="RS256", headers={"kid": "k1"})
+
+    claims = jwt.decode(token, store.get_key("k1"), algorithms=["RS256"])
+    assert claims["sub"] == "auth0|1"
+
+
+def test_unknown_kid_triggers_rate_limited_refetch():
+    """An unknown kid schedules a background refetch at most once per interval"""
+    old_jwk, _ = _make_key("old")
+    new_jwk, _ = _make_key("new")
+    fetcher = FakeFetcher(old_jwk)
+    clock = FakeClock()
+    store = JWKSKeyStore("https://example/jwks.json", min_refetch_interval=30,
+                         fetcher=fetcher, clock=clock)
+    store.refresh()
+    store.get_key("old")
+    assert fetcher.calls == 1
+
+    # Auth0 rotates keys; the first lookup fails fast and refetches in the background
+    fetcher.keys = [new_jwk]
+    clock.now = 31
+    with pytest.raises(JWTError):
+        store.get_key("new")
+    store._refresh_thread.join(timeout=5)
+    assert fetcher.calls == 2
+    assert store.get_key("new") is not None
+    assert store.kids == ["new"]
+
+    # A second unknown kid inside the interval does not refetch
+    with pytest.raises(JWTError):
+        store.get_key("missing")
+    assert store.request_refresh() is False
+    assert fetcher.calls == 2
+
+
+def test_failed_refresh_keeps_previous_keys():
+    """A failing fetch leaves the last good key set in place"""
+    jwk, _ = _make_key("k1")
+    fetcher = FakeFetcher(jwk)
+    store = JWKSKeyStore("https://example/jwks.json", fetcher=fetcher)
+    store.refresh()
+
+    def failing(url):
+        raise ConnectionError("down")
+
+    store._fetcher = failing
+    assert store.refresh() is False
+    assert store.get_key("k1") is not None
+
+
+def test_empty_store_never_fetches_inline():
+    """Lookups on an empty store fail fast and share one background fetch"""
+    calls = []
+
+    def failing(url):
+        calls.append(url)
+        raise ConnectionError("down")
+
+    clock = FakeClock()
+    store = JWKSKeyStore("https://example/jwks.json", min_refetch_interval=30,
+                         fetcher=failing, clock=clock)
+    for _ in range(5):
+        with pytest.raises(JWTError):
+            store.get_key("k1")
+        store._refresh_thread.join(timeout=5)
+    assert len(calls) == 1
+
+    clock.now = 31
+    with pytest.raises(JWTError):
+        store.get_key("k1")
+    store._refresh_thread.join(timeout=5)
+    assert len(calls) == 2
+
+
+def test_scheduler_retries_until_loaded():
+    """The background thread retries a failed bootstrap at the refetch rate"""
+    jwk, _ = _make_key("k1")
+    fetcher = FakeFetcher(jwk)
+    attempts = []
+
+    def flaky(url):
+        attempts.append(url)
+        if len(attempts) < 3:
+            raise ConnectionError("down")
+        return fetcher(url)
+
+    store = JWKSKeyStore("https://example/jwks.json", min_refetch_interval=0.01, fetcher=flaky)
+    store.start()
+    try:
+        for _ in range(500):
+            if store.loaded:
+                break
+            time.sleep(0.01)
+        assert store.get_key("k1") is not None
+        assert len(attempts) == 3
+    finally:
+        store.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_bootstrap_uses_async_fetcher():
+    """An empty store is loaded through the async client, never the blocking one"""
+    jwk, _ = _make_key("k1")
+    sync_fetcher = FakeFetcher(jwk)
+    async_calls = []
+
+    async def async_fetcher(url):
+        async_calls.append(url)
+        return JWKS(keys=[jwk])
+
+    store = JWKSKeyStore("https://example/jwks.json", fetcher=sync_fetcher,
+                         async_fetcher=async_fetcher)
+    await store.ensure_loaded_async()
+    await store.ensure_loaded_async()
+
+    assert store.get_key("k1") is not None
+    assert async_calls == ["https://example/jwks.json"]
+    assert sync_fetcher.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_async_bootstrap_fails_fast():
+    """Callers queued behind a failed bootstrap do not fetch again"""
+    calls = []
+
+    async def failing(url):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    clock = FakeClock()
+    store = JWKSKeyStore("https://example/jwks.json", min_refetch_interval=30,
+                         async_fetcher=failing, clock=clock)
+    results = await asyncio.gather(*(store.ensure_loaded_async() for _ in range(20)),
+                                   return_exceptions=True)
+    assert all(isinstance(r, JWTError) for r in results)
+    assert len(calls) == 1
+
+    clock.now = 31
+    with pytest.raises(JWTError):
+        await store.ensure_loaded_async()
+    assert len(calls) == 2
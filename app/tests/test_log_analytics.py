@@ -0,0 +1,86 @@
+"""
+Log history analytics tests
+"""
+import sys
+import uuid
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.repositories.log_analytics import LogAnalytics
+
+
+WORKOUTS = [
+    (2, ("bench", [(5, 100), (5, 100), (1, 130)]), ("row", [(10, 60)])),
+    (4, ("bench", [(8, None), (3, 110)])),
+    (10, ("bench", [(5, 110), (15, 60)])),
+]
+
+
+def test_history_is_columnar(db, seed_logs):
+    user, bench, _, _ = seed_logs(*WORKOUTS)
+    history = LogAnalytics(db).history(user.user_id, exercise_id=bench.exercise_id)
+    assert history.days.dtype.str == "<M8[D]"
+    assert history.reps.tolist() == [5, 5, 1, 8, 3, 5, 15]
+    assert history.weights[3] != history.weights[3]  # missing weight is NaN
+
+
+def test_rolling_volume(db, seed_logs):
+    user, _, _, _ = seed_logs(*WORKOUTS)
+    analytics = LogAnalytics(db)
+
+    full = analytics.rolling_volume(user.user_id)
+    assert (full.dates[0], full.dates[-1], len(full.dates)) == (date(2026, 3, 2), date(2026, 3, 10), 9)
+    assert full.volume[:3] == [1730.0, 0.0, 330.0]
+    assert full.rolling_volume == [1730.0, 1730.0, 2060.0, 2060.0, 2060.0, 2060.0, 2060.0, 330.0, 1780.0]
+
+    # Days before start_date still count towards the window
+    ranged = analytics.rolling_volume(user.user_id, start_date=date(2026, 3, 9), end_date=date(2026, 3, 11))
+    assert ranged.dates == [date(2026, 3, 9), date(2026, 3, 10), date(2026, 3, 11)]
+    assert (ranged.volume, ranged.rolling_volume) == ([0.0, 1450.0, 0.0], [330.0, 1780.0, 1450.0])
+
+
+def test_e1rm_trend(db, seed_logs):
+    user, bench, _, _ = seed_logs(*WORKOUTS)
+    trend = LogAnalytics(db).e1rm_trend(user.user_id, bench.exercise_id)
+    # 130 single; 3 x 110; 5 x 110 (the 15-rep set is past the cutoff)
+    assert trend.dates == [date(2026, 3, 2), date(2026, 3, 4), date(2026, 3, 10)]
+    assert trend.estimated_1rm == [130.0, 121.0, 128.33]
+    assert trend.best_to_date == [130.0, 130.0, 130.0]
+    assert trend.slope_per_week == 0.85
+    assert LogAnalytics(db).e1rm_trend(user.user_id, uuid.uuid4()) is None
+
+
+def test_weekly_volume(db, seed_logs):
+    user, _, row, _ = seed_logs(*WORKOUTS)
+    analytics = LogAnalytics(db)
+
+    weekly = analytics.weekly_volume(user.user_id)
+    assert weekly.week_starts == [date(2026, 3, 2), date(2026, 3, 9)]
+    assert (weekly.volume, weekly.reps) == ([2060.0, 1450.0], [32, 20])
+    assert weekly.volume_change == [2060.0, -610.0]
+    assert weekly.volume_change_pct == [None, -29.61]
+
+    # The week before start_date is read for the first change
+    ranged = analytics.weekly_volume(user.user_id, start_date=date(2026, 3, 10))
+    assert (ranged.week_starts, ranged.volume_change) == ([date(2026, 3, 9)], [-610.0])
+
+    rows = analytics.weekly_volume(user.user_id, exercise_id=row.exercise_id, end_date=date(2026, 3, 15))
+    assert (rows.volume, rows.volume_change_pct) == ([600.0, 0.0], [None, -100.0])
+
+
+def test_analytics_endpoints(client, db, seed_logs):
+    _, bench, _, _ = seed_logs(*WORKOUTS)
+    body = client.get("/api/v1/analytics/volume", params={"window": 3, "start_date": "2026-03-03",
+                                                          "end_date": "2026-03-04"}).json()
+    assert (body["dates"], body["rolling_volume"]) == (["2026-03-03", "2026-03-04"], [1730.0, 2060.0])
+    body = client.get(f"/api/v1/analytics/exercises/{bench.exercise_id}/e1rm").json()
+    assert body["estimated_1rm"] == [130.0, 121.0, 128.33]
+    body = client.get("/api/v1/analytics/weekly").json()
+    assert body["volume_change_pct"] == [None, -29.61]
+
+    assert client.get(f"/api/v1/analytics/exercises/{uuid.uuid4()}/e1rm").status_code == 404
+    assert client.get("/api/v1/analytics/weekly",
+                      params={"start_date": "2026-03-05", "end_date": "2026-03-01"}).status_code == 400
+    assert client.get("/api/v1/analytics/volume", params={"window": 0}).status_code == 422
@@ -0,0 +1,205 @@
+"""
+Workout log repository tests
+"""
+import sys
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+from sqlalchemy import event, select
+
+from src.db.orm_models import Exercise, SetLog, SetStepLog, User, WorkoutLog
+from src.models.logs import LogBatchOperation, PerformanceBucket, WorkoutLogCreate
+from src.repositories.log_repository import LogRepository
+
+
+def _seed_log(db, sub: str):
+    user = User(auth0_sub=sub, email=f"{sub}@example.com")
+    exercise = Exercise(name=f"Squat {sub}")
+    db.add_all([user, exercise])
+    db.flush()
+    log = WorkoutLog(user_id=user.user_id, start_time=datetime(2026, 1, 1))
+    db.add(log)
+    db.flush()
+    set_log = SetLog(workout_log_id=log.workout_log_id, set_order=1,
+                     exercise_id=exercise.exercise_id, set_number=1)
+    db.add(set_log)
+    db.flush()
+    step_log = SetStepLog(set_log_id=set_log.set_log_id, step_order=1, completed_reps=5)
+    db.add(step_log)
+    db.flush()
+    return user, log, set_log, step_log
+
+
+def test_check_access(db):
+    """Ownership and parent/child linkage are verified together"""
+    user, log, set_log, step_log = _seed_log(db, "a")
+    other_user, other_log, other_set, other_step = _seed_log(db, "b")
+    repo = LogRepository(db)
+
+    assert repo.check_access(log.workout_log_id, user.user_id,
+                             set_log.set_log_id, step_log.set_step_log_id) == (True, True, True)
+    # Someone else's log
+    assert not repo.check_access(log.workout_log_id, other_user.user_id).log
+    # A set log from another workout log
+    assert repo.check_access(log.workout_log_id, user.user_id,
+                             other_set.set_log_id) == (True, False, False)
+    # A step log from another set log
+    assert repo.check_access(log.workout_log_id, user.user_id, set_log.set_log_id,
+                             other_step.set_step_log_id) == (True, True, False)
+    assert not repo.check_access(uuid.uuid4(), user.user_id).log
+
+
+def test_apply_batch(db):
+    """Ops apply in order, invalid ones fail alone, and a replay is a no-op"""
+    user, log, set_log, step_log = _seed_log(db, "c")
+    repo = LogRepository(db)
+    new_set_id, new_step_id = uuid.uuid4(), uuid.uuid4()
+    ops = [
+        LogBatchOperation(action="create", target="set_log", client_ref="s2",
+                          set_log_id=new_set_id,
+                          data={"set_order": 2, "exercise_id": str(set_log.exercise_id),
+                                "set_number": 1}),
+        LogBatchOperation(action="create", target="step_log", set_log_ref="s2",
+                          step_log_id=new_step_id,
+                          data={"step_order": 1, "completed_reps": 8}),
+        LogBatchOperation(action="update", target="step_log", step_log_id=step_log.set_step_log_id,
+                          data={"completed_reps": 6, "notes": "grind"}),
+        # Step order 1 is already taken in the seeded set log
+        LogBatchOperation(action="create", target="step_log", set_log_id=set_log.set_log_id,
+                          data={"step_order": 1, "completed_reps": 3}),
+        LogBatchOperation(action="create", target="set_log",
+                          data={"set_order": 3, "exercise_id": str(uuid.uuid4()),
+                                "set_number": 1}),
+        LogBatchOperation(action="update", target="step_log", step_log_id=new_step_id,
+                          data={"completed_reps": 9}),
+    ]
+
+    results = repo.apply_batch(log.workout_log_id, ops)
+    assert [r.status.value for r in results] == [
+        "created", "created", "updated", "failed", "failed", "updated",
+    ]
+    assert "step_order 1" in results[3].error
+    assert "not found" in results[4].error
+
+    db.expire_all()
+    assert db.get(SetStepLog, step_log.set_step_log_id).completed_reps == 6
+    assert db.get(SetStepLog, new_step_id).completed_reps == 9
+    assert db.get(SetStepLog, new_step_id).set_log_id == new_set_id
+
+    # Replaying the same batch creates nothing new
+    replay = repo.apply_batch(log.workout_log_id, ops[:2])
+    assert [r.status.value for r in replay] == ["unchanged", "unchanged"]
+
+    deleted = repo.apply_batch(log.workout_log_id, [
+        LogBatchOperation(action="delete", target="set_log", set_log_id=new_set_id),
+        LogBatchOperation(action="delete", target="set_log", set_log_id=new_set_id),
+    ])
+    assert [r.status.value for r in deleted] == ["deleted", "unchanged"]
+    remaining = db.execute(
+        select(SetLog.set_log_id).where(SetLog.workout_log_id == log.workout_log_id)
+    ).scalars().all()
+    assert remaining == [set_log.set_log_id]
+    assert db.get(SetStepLog, new_step_id) is None
+
+
+def test_create_full_session(db):
+    """A finished session is written with one INSERT per table and not re-read"""
+    user = User(auth0_sub="auth0|full", email="full@example.com")
+    squat = Exercise(name="Squat full")
+    db.add_all([user, squat])
+    db.flush()
+    data = WorkoutLogCreate(
+        start_time=datetime(2026, 2, 1, 9, 0),
+        end_time=datetime(2026, 2, 1, 10, 0),
+        set_logs=[
+            {"set_order": order, "exercise_id": squat.exercise_id, "set_number": order,
+             "steps": [{"step_order": 2, "completed_reps": 3}, {"step_order": 1, "completed_reps": 5}]}
+            for order in (3, 1, 2)
+        ],
+    )
+
+    statements = []
+
+    @event.listens_for(db.get_bind(), "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    log = LogRepository(db).create_workout_log(data, user.user_id)
+
+    assert statements.count("INSERT") == 5  # + stats rollup and daily volume rows
+    assert statements.count("SELECT") == 1  # exercise lookup
+    assert [sl.set_order for sl in log.set_logs] == [1, 2, 3]
+    assert all([st.step_order for st in sl.step_logs] == [1, 2] for sl in log.set_logs)
+    assert all(sl.exercise.name == "Squat full" for sl in log.set_logs)
+
+    db.expire_all()
+    reloaded = LogRepository(db).get_with_tree(log.workout_log_id)
+    assert sum(len(sl.step_logs) for sl in reloaded.set_logs) == 6
+
+
+def test_create_full_session_unknown_exercise(db):
+    user = User(auth0_sub="auth0|bad", email="bad@example.com")
+    db.add(user)
+    db.flush()
+    missing = uuid.uuid4()
+    data = WorkoutLogCreate(
+        start_time=datetime(2026, 2, 1),
+        set_logs=[{"set_order": 1, "exercise_id": missing, "set_number": 1}],
+    )
+    with pytest.raises(ValueError, match=str(missing)):
+        LogRepository(db).create_workout_log(data, user.user_id)
+
+
+def test_exercise_performance(db):
+    """Totals and calendar periods come from one aggregate over the user's logs"""
+    user = User(auth0_sub="auth0|perf", email="perf@example.com")
+    other = User(auth0_sub="auth0|perf2", email="perf2@example.com")
+    bench, row = Exercise(name="Bench perf"), Exercise(name="Row perf")
+    db.add_all([user, other, bench, row])
+    db.flush()
+    repo = LogRepository(db)
+
+    def _log(owner, day, *sets):
+        repo.create_workout_log(WorkoutLogCreate(
+            start_time=datetime(2026, 3, day, 18),
+            set_logs=[
+                {"set_order": order, "exercise_id": exercise.exercise_id, "set_number": 1,
+                 "steps": [{"step_order": i, "completed_reps": reps, "completed_weight": weight}
+                           for i, (reps, weight) in enumerate(steps, 1)]}
+                for order, (exercise, steps) in enumerate(sets, 1)
+            ],
+        ), owner.user_id)
+
+    _log(user, 2, (bench, [(5, 100), (5, 100)]), (bench, [(3, 110)]), (row, [(10, 60)]))
+    _log(user, 4, (bench, [(8, None)]))
+    _log(user, 10, (bench, [(5, 120)]))
+    _log(other, 3, (bench, [(1, 200)]))
+
+    perf = repo.exercise_performance(user.user_id, bench.exercise_id)
+    assert (perf.exercise_name, perf.total_sets, perf.total_reps) == ("Bench perf", 4, 26)
+    assert (perf.max_weight, perf.avg_weight) == (Decimal("120"), Decimal("107.50"))
+    assert perf.periods == []
+
+    weekly = repo.exercise_performance(user.user_id, bench.exercise_id, bucket=PerformanceBucket.WEEK)
+    assert [(p.period_start, p.total_sets, p.total_reps, p.max_weight, p.avg_weight)
+            for p in weekly.periods] == [
+        (date(2026, 3, 2), 3, 21, Decimal("110"), Decimal("103.33")),
+        (date(2026, 3, 9), 1, 5, Decimal("120"), Decimal("120.00")),
+    ]
+    assert weekly.model_dump(exclude={"periods", "bucket"}) == perf.model_dump(exclude={"periods", "bucket"})
+
+    monthly = repo.exercise_performance(user.user_id, bench.exercise_id, bucket=PerformanceBucket.MONTH)
+    assert [p.period_start for p in monthly.periods] == [date(2026, 3, 1)]
+
+    one_day = repo.exercise_performance(user.user_id, bench.exercise_id,
+                                        start_date=date(2026, 3, 4), end_date=date(2026, 3, 4))
+    assert (one_day.total_sets, one_day.total_reps, one_day.avg_weight) == (1, 8, None)
+
+    empty = repo.exercise_performance(other.user_id, row.exercise_id, bucket=PerformanceBucket.DAY)
+    assert (empty.total_sets, empty.total_reps, empty.periods) == (0, 0, [])
+    assert repo.exercise_performance(user.user_id, uuid.uuid4()) is None
@@ -0,0 +1,49 @@
+"""
+Keyset pagination tests
+"""
+import sys
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.orm_models import User, WorkoutLog
+from src.repositories.log_repository import LogRepository
+from src.repositories.pagination import decode_cursor, encode_cursor, next_cursor
+
+
+def test_cursor_round_trip():
+    """Cursors decode back to the encoded position"""
+    when, entity_id = datetime(2026, 1, 2, 3, 4, 5, 678), uuid.uuid4()
+    assert decode_cursor(encode_cursor(when, entity_id)) == (when, entity_id)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_cursor_pages_match_offset_pages(db):
+    """Walking by cursor visits every log once, including timestamp ties"""
+    user = User(auth0_sub="auth0|pages", email="pages@example.com")
+    db.add(user)
+    db.flush()
+    base = datetime(2026, 1, 1)
+    for i in range(23):
+        # Pairs of logs share a start time to exercise the id tiebreaker
+        db.add(WorkoutLog(user_id=user.user_id, start_time=base + timedelta(hours=i // 2)))
+    db.flush()
+
+    repo = LogRepository(db)
+    by_offset = repo.list_by_user(user.user_id, limit=100)
+
+    walked, cursor = [], None
+    while True:
+        page = repo.list_by_user(user.user_id, limit=5, cursor=cursor)
+        walked.extend(page)
+        cursor = next_cursor(page, 5, "start_time", "workout_log_id")
+        if cursor is None:
+            break
+
+    assert [l.workout_log_id for l in walked] == [l.workout_log_id for l in by_offset]
+    assert len(walked) == 23
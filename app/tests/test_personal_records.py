@@ -0,0 +1,131 @@
+"""
+Personal record maintenance tests
+"""
+import sys
+import uuid
+from decimal import Decimal
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import select
+
+from src.db.orm_models import Exercise, PersonalRecord
+from src.models.logs import (
+    LogBatchOperation,
+    SetLogCreate,
+    SetLogUpdate,
+    SetStepLogCreate,
+    SetStepLogUpdate,
+)
+from src.repositories.log_repository import LogRepository
+from src.repositories.personal_record_repository import PersonalRecordRepository, StepResult
+
+
+WORKOUTS = [
+    (2, ("bench", [(5, 100), (5, 100)]), ("bench", [(1, 130)]), ("row", [(10, 60)])),
+    (4, ("bench", [(8, None), (5, 100)])),
+    (10, ("bench", [(5, 110), (15, 60)])),
+]
+
+
+def _records(db):
+    return db.execute(
+        select(PersonalRecord.exercise_id, PersonalRecord.reps, PersonalRecord.weight,
+               PersonalRecord.set_step_log_id, PersonalRecord.achieved_at)
+        .order_by(PersonalRecord.exercise_id, PersonalRecord.reps)
+    ).all()
+
+
+def _assert_matches_recompute(db, user):
+    incremental = _records(db)
+    PersonalRecordRepository(db).recompute(user.user_id)
+    assert _records(db) == incremental
+
+
+def test_records(db, seed_logs):
+    """Best weight per rep count; max weight and e1RM derived from them"""
+    user, bench, row, logs = seed_logs(*WORKOUTS)
+    _assert_matches_recompute(db, user)
+
+    records = PersonalRecordRepository(db).get_records(user.user_id, bench.exercise_id)
+    assert [(rm.reps, rm.weight) for rm in records.rep_maxes] == [(1, 130), (5, 110), (15, 60)]
+    assert (records.max_weight.reps, records.max_weight.weight) == (1, 130)
+    # 110 x 5 -> 128.33 loses to the 130 single; 15 reps is past the e1RM cutoff
+    assert (records.estimated_1rm.reps, records.estimated_1rm.estimated_1rm) == (1, Decimal("130"))
+    assert PersonalRecordRepository(db).get_records(user.user_id, uuid.uuid4()) is None
+
+
+def test_writes_keep_records_current(db, seed_logs):
+    """Every set/step-log write path leaves the records equal to a recompute"""
+    user, bench, row, logs = seed_logs(*WORKOUTS)
+    repo = LogRepository(db)
+    first = repo.get_with_tree(logs[0].workout_log_id)
+    bench_set, single_set, row_set = first.set_logs
+
+    # Lowering the record-holding single falls back to nothing else at 1 rep
+    repo.update_step_log(single_set.step_logs[0], SetStepLogUpdate(completed_weight=90))
+    repo.update_step_log(bench_set.step_logs[1], SetStepLogUpdate(completed_weight=112.5))
+    repo.update_set_log(row_set, SetLogUpdate(exercise_id=bench.exercise_id))
+    repo.create_step_log(single_set.set_log_id,
+                         SetStepLogCreate(step_order=2, completed_reps=3, completed_weight=120))
+    repo.add_set_log(logs[1].workout_log_id, SetLogCreate(
+        set_order=2, exercise_id=row.exercise_id, set_number=1,
+        steps=[{"step_order": 1, "completed_reps": 12, "completed_weight": 50}],
+    ))
+    _assert_matches_recompute(db, user)
+    records = PersonalRecordRepository(db).get_records(user.user_id, bench.exercise_id)
+    assert [(rm.reps, rm.weight) for rm in records.rep_maxes] == [
+        (1, 90), (3, 120), (5, Decimal("112.5")), (10, 60), (15, 60),
+    ]
+
+    repo.delete_step_log(repo.get_step_log(bench_set.step_logs[1].set_step_log_id))
+    repo.apply_batch(logs[2].workout_log_id, [
+        LogBatchOperation(action="update", target="step_log",
+                          step_log_id=logs[2].set_logs[0].step_logs[0].set_step_log_id,
+                          data={"completed_weight": 95}),
+        LogBatchOperation(action="create", target="set_log", data={
+            "set_order": 2, "exercise_id": str(row.exercise_id), "set_number": 1,
+            "steps": [{"step_order": 1, "completed_reps": 12, "completed_weight": 55}],
+        }),
+    ])
+    _assert_matches_recompute(db, user)
+    records = PersonalRecordRepository(db).get_records(user.user_id, bench.exercise_id)
+    # Of the equal 5 x 100s, the earliest workout's holds the record
+    assert [(rm.reps, rm.weight, rm.achieved_at.day) for rm in records.rep_maxes][2] == (5, 100, 2)
+
+    repo.delete_set_log(repo.get_set_log(row_set.set_log_id))
+    db.expire_all()  # earlier deletes left the loaded tree stale
+    repo.delete(repo.get_by_id(logs[0].workout_log_id))
+    _assert_matches_recompute(db, user)
+    records = PersonalRecordRepository(db).get_records(user.user_id, bench.exercise_id)
+    assert [(rm.reps, rm.weight, rm.achieved_at.day) for rm in records.rep_maxes] == [
+        (5, 100, 4), (15, 60, 10),
+    ]
+
+
+def test_concurrent_insert_falls_back_to_recompute(db, seed_logs, monkeypatch):
+    """A record inserted by another writer since the read is not a 500"""
+    user, bench, _, logs = seed_logs(*WORKOUTS)
+    records = PersonalRecordRepository(db)
+    # Another writer inserted the 5-rep record after this one read
+    monkeypatch.setattr(records, "_current", lambda user_id, exercise_ids: {})
+    step = logs[0].set_logs[0].step_logs[0]
+    records.record_steps(user.user_id, logs[0].start_time, [
+        StepResult(bench.exercise_id, step.set_step_log_id, 5, Decimal("100")),
+    ])
+    _assert_matches_recompute(db, user)
+
+
+def test_records_endpoint(client, db, seed_logs):
+    _, bench, _, _ = seed_logs(*WORKOUTS)
+    body = client.get(f"/api/v1/exercises/{bench.exercise_id}/records").json()
+    assert body["max_weight"]["weight"] == "130.00"
+    assert [rm["reps"] for rm in body["rep_maxes"]] == [1, 5, 15]
+
+    unused = Exercise(name="Unused pr-api")
+    db.add(unused)
+    db.flush()
+    empty = client.get(f"/api/v1/exercises/{unused.exercise_id}/records").json()
+    assert (empty["max_weight"], empty["estimated_1rm"], empty["rep_maxes"]) == (None, None, [])
+    assert client.get(f"/api/v1/exercises/{uuid.uuid4()}/records").status_code == 404
@@ -0,0 +1,59 @@
+"""
+Raw-SQL helper tests
+"""
+import sys
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.query import (
+    IntegrityViolationError,
+    QueryExecutionError,
+    execute_query,
+    stream_query,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'query.db'}")
+    execute_query("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)", engine=engine)
+    for i in range(25):
+        execute_query("INSERT INTO t (id, name) VALUES (:id, :name)",
+                      {"id": i, "name": f"row{i}"}, engine=engine)
+    yield engine
+    engine.dispose()
+
+
+def test_named_params(engine):
+    """Named parameters are bound and rows come back as dicts"""
+    rows = execute_query("SELECT id, name FROM t WHERE id >= :low ORDER BY id",
+                         {"low": 23}, engine=engine)
+    assert rows == [{"id": 23, "name": "row23"}, {"id": 24, "name": "row24"}]
+
+
+def test_positional_params(engine):
+    """Positional parameters still work for driver-style SQL"""
+    rows = execute_query("SELECT name FROM t WHERE id = ?", (3,), engine=engine)
+    assert rows == [{"name": "row3"}]
+
+
+def test_stream_query_yields_all_rows(engine):
+    """Streaming returns every row and releases the connection when closed"""
+    with closing(stream_query("SELECT id FROM t ORDER BY id", batch_size=4,
+                              engine=engine)) as rows:
+        assert [r["id"] for r in rows] == list(range(25))
+    assert engine.pool.checkedout() == 0
+
+
+def test_typed_errors(engine):
+    """Bad statements and constraint violations raise distinct error types"""
+    with pytest.raises(QueryExecutionError):
+        execute_query("SELECT nope FROM t", engine=engine)
+    with pytest.raises(IntegrityViolationError):
+        execute_query("INSERT INTO t (id, name) VALUES (:id, 'dup')", {"id": 1},
+                      engine=engine)
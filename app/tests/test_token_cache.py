@@ -0,0 +1,78 @@
+"""
+Verified-token cache tests
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.auth.models import TokenPayload
+from src.auth.token_cache import VerifiedTokenCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _payload(sub: str, exp: int) -> TokenPayload:
+    return TokenPayload(sub=sub, exp=exp)
+
+
+def test_hit_until_exp():
+    """Cached payloads are served until the token's exp claim"""
+    clock = FakeClock()
+    cache = VerifiedTokenCache(max_size=10, clock=clock)
+    cache.put("token-a", _payload("auth0|a", exp=1060))
+
+    assert cache.get("token-a").sub == "auth0|a"
+
+    clock.now = 1060
+    assert cache.get("token-a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted when full"""
+    clock = FakeClock()
+    cache = VerifiedTokenCache(max_size=2, clock=clock)
+    cache.put("a", _payload("a", exp=2000))
+    cache.put("b", _payload("b", exp=2000))
+    cache.get("a")
+    cache.put("c", _payload("c", exp=2000))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_tokens_without_exp_are_not_cached():
+    """A payload without exp has no safe expiry and is skipped"""
+    cache = VerifiedTokenCache(max_size=10, clock=FakeClock())
+    cache.put("a", TokenPayload(sub="a"))
+    assert cache.get("a") is None
+
+
+def test_disabled_cache():
+    """Disabled caches never store or count lookups"""
+    cache = VerifiedTokenCache(max_size=10, enabled=False, clock=FakeClock())
+    cache.put("a", _payload("a", exp=2000))
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 0
+
+
+def test_hit_rate():
+    """Hit rate is hits over total lookups"""
+    cache = VerifiedTokenCache(max_size=10, clock=FakeClock())
+    cache.put("a", _payload("a", exp=2000))
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert abs(stats["hit_rate"] - 2 / 3) < 1e-9
@@ -0,0 +1,103 @@
+"""
+Daily training volume materialization tests
+"""
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import select
+
+from src.db.orm_models import DailyExerciseVolume
+from src.models.exercises import MuscleGroup
+from src.models.logs import (
+    LogBatchOperation,
+    PerformanceBucket,
+    SetLogCreate,
+    SetLogUpdate,
+    SetStepLogCreate,
+    SetStepLogUpdate,
+)
+from src.repositories.log_repository import LogRepository
+from src.repositories.training_volume_repository import TrainingVolumeRepository
+
+
+WORKOUTS = [
+    (2, ("bench", [(5, 100), (5, 100)]), ("bench", [(3, 110)]), ("row", [(10, 60)])),
+    (4, ("bench", [(8, None)])),
+    (10, ("bench", [(5, 120)])),
+]
+
+
+def _materialized(db):
+    return db.execute(
+        select(DailyExerciseVolume.exercise_id, DailyExerciseVolume.day, DailyExerciseVolume.sets,
+               DailyExerciseVolume.reps, DailyExerciseVolume.volume)
+        .order_by(DailyExerciseVolume.day, DailyExerciseVolume.exercise_id)
+    ).all()
+
+
+def _assert_matches_rebuild(db, user):
+    incremental = _materialized(db)
+    TrainingVolumeRepository(db).rebuild([user.user_id])
+    assert _materialized(db) == incremental
+
+
+def test_series(db, seed_logs):
+    """Daily rows roll up per week and filter by exercise or muscle group"""
+    user, bench, row, _ = seed_logs(*WORKOUTS)
+    volume = TrainingVolumeRepository(db)
+
+    daily = volume.series(user.user_id, exercise_id=bench.exercise_id)
+    assert daily.dates == [date(2026, 3, 2), date(2026, 3, 4), date(2026, 3, 10)]
+    assert (daily.volume, daily.sets, daily.reps) == ([1330.0, 0.0, 600.0], [2, 1, 1], [13, 8, 5])
+
+    weekly = volume.series(user.user_id, bucket=PerformanceBucket.WEEK)
+    assert weekly.dates == [date(2026, 3, 2), date(2026, 3, 9)]
+    assert (weekly.volume, weekly.sets) == ([1930.0, 600.0], [4, 1])
+
+    back = volume.series(user.user_id, muscle_group=MuscleGroup.BACK)
+    assert (back.dates, back.volume) == ([date(2026, 3, 2)], [600.0])
+    ranged = volume.series(user.user_id, start_date=date(2026, 3, 3), end_date=date(2026, 3, 10))
+    assert ranged.dates == [date(2026, 3, 4), date(2026, 3, 10)]
+
+
+def test_writes_keep_rows_current(db, seed_logs):
+    """Every set/step-log write path leaves the rows equal to a rebuild"""
+    user, bench, row, logs = seed_logs(*WORKOUTS)
+    repo = LogRepository(db)
+    _assert_matches_rebuild(db, user)
+
+    first = repo.get_with_tree(logs[0].workout_log_id)
+    bench_set, second_bench_set, row_set = first.set_logs
+    repo.update_step_log(bench_set.step_logs[0], SetStepLogUpdate(completed_reps=6))
+    repo.update_set_log(row_set, SetLogUpdate(exercise_id=bench.exercise_id))
+    repo.delete_step_log(second_bench_set.step_logs[0])
+    repo.create_step_log(second_bench_set.set_log_id,
+                         SetStepLogCreate(step_order=2, completed_reps=4, completed_weight=115))
+    repo.add_set_log(logs[1].workout_log_id, SetLogCreate(
+        set_order=2, exercise_id=row.exercise_id, set_number=1,
+        steps=[{"step_order": 1, "completed_reps": 12, "completed_weight": 50}],
+    ))
+    _assert_matches_rebuild(db, user)
+    assert TrainingVolumeRepository(db).series(user.user_id).volume == [2160.0, 600.0, 600.0]
+
+    repo.apply_batch(logs[2].workout_log_id, [
+        LogBatchOperation(action="delete", target="set_log",
+                          set_log_id=logs[2].set_logs[0].set_log_id),
+    ])
+    repo.delete_set_log(repo.get_set_log(row_set.set_log_id))
+    repo.delete(repo.get_by_id(logs[1].workout_log_id))
+    _assert_matches_rebuild(db, user)
+    assert [r.day for r in _materialized(db)] == [date(2026, 3, 2)]
+
+
+def test_volume_endpoint(client, db, seed_logs):
+    """Columnar arrays, not row objects"""
+    seed_logs(*WORKOUTS)
+    body = client.get("/api/v1/workouts/volume", params={"bucket": "week", "muscle_group": "chest"}).json()
+    assert body["dates"] == ["2026-03-02", "2026-03-09"]
+    assert (body["volume"], body["sets"], body["reps"]) == ([1330.0, 600.0], [3, 1], [21, 5])
+    assert client.get("/api/v1/workouts/volume",
+                      params={"start_date": "2026-03-05", "end_date": "2026-03-01"}).status_code == 400
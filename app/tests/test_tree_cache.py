@@ -0,0 +1,82 @@
+"""
+ETag / response cache tests for workout and program trees
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.orm_models import Exercise, User
+from src.models.programs import ProgramCreate
+from src.models.workouts import SetUpdate, WorkoutCreate
+from src.repositories.program_repository import ProgramRepository, program_response_cache
+from src.repositories.workout_repository import WorkoutRepository, workout_response_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_caches():
+    workout_response_cache.clear()
+    program_response_cache.clear()
+
+
+def _seed_workout(db, sub):
+    user = User(auth0_sub=sub, email=f"{sub}@example.com")
+    squat = Exercise(name="Squat")
+    db.add_all([user, squat])
+    db.flush()
+    data = WorkoutCreate(
+        name="Legs",
+        sets=[{"set_order": 1, "exercise_id": squat.exercise_id,
+               "steps": [{"step_order": 1, "planned_reps": 5}]}],
+    )
+    return user, WorkoutRepository(db).create_workout(data, user.user_id)
+
+
+def test_workout_etag_and_child_invalidation(client, db, auth0_sub):
+    """304 on a matching ETag; a set edit changes the version and the ETag"""
+    user, workout = _seed_workout(db, auth0_sub)
+    url = f"/api/v1/workouts/{workout.workout_id}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('"') and first.json()["name"] == "Legs"
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert workout_response_cache.stats()["hits"] >= 1
+
+    repo = WorkoutRepository(db)
+    repo.update_set(workout.sets[0], SetUpdate(notes="pause at bottom"))
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["sets"][0]["notes"] == "pause at bottom"
+
+    repo.delete(workout)
+    assert client.get(url).status_code == 404
+
+
+def test_program_etag_tracks_scheduled_workouts(client, db, auth0_sub):
+    """Renaming a scheduled workout changes the program's ETag"""
+    user, workout = _seed_workout(db, auth0_sub)
+    program = ProgramRepository(db).create_program(
+        ProgramCreate(name="Block", duration_weeks=1,
+                      schedule=[{"week_number": 1, "day_of_week": 0,
+                                 "workout_id": workout.workout_id}]),
+        user.user_id,
+    )
+    url = f"/api/v1/programs/{program.program_id}"
+
+    etag = client.get(url).headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    # A workout write that bypasses the program repository entirely
+    workout.name = "Legs v2"
+    db.flush()
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["schedule"][0]["workout"]["name"] == "Legs v2"
@@ -0,0 +1,173 @@
+"""
+Workout repository tests
+"""
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from src.db.orm_models import Exercise, User
+from src.models.workouts import SetUpdate, WorkoutCreate, WorkoutUpdate
+from src.repositories.workout_repository import WorkoutRepository, shared_workouts_cache
+
+
+def _count_statements(db):
+    statements = []
+
+    @event.listens_for(db.get_bind(), "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0].upper())
+
+    return statements
+
+
+def test_create_workout_batches_inserts(db):
+    """The whole tree is written with one INSERT per table and not re-read"""
+    user = User(auth0_sub="auth0|w", email="w@example.com")
+    squat = Exercise(name="Squat")
+    db.add_all([user, squat])
+    db.flush()
+
+    data = WorkoutCreate(
+        name="Legs",
+        sets=[
+            {"set_order": order, "exercise_id": squat.exercise_id,
+             "steps": [{"step_order": 1, "planned_reps": 5},
+                       {"step_order": 2, "planned_reps": 3}]}
+            for order in (2, 1, 3)
+        ],
+    )
+    statements = _count_statements(db)
+    workout = WorkoutRepository(db).create_workout(data, user.user_id)
+
+    assert statements.count("INSERT") == 3
+    assert [s.set_order for s in workout.sets] == [1, 2, 3]
+    assert all(len(s.steps) == 2 and s.exercise.name == "Squat" for s in workout.sets)
+
+    db.expire_all()
+    reloaded = WorkoutRepository(db).get_with_tree(workout.workout_id)
+    assert sum(len(s.steps) for s in reloaded.sets) == 6
+
+
+def test_exercises_resolved_in_one_query(db):
+    """Existing IDs are checked in one SELECT, new exercises in one INSERT"""
+    user = User(auth0_sub="auth0|r", email="r@example.com")
+    squat, bench = Exercise(name="Squat"), Exercise(name="Bench")
+    db.add_all([user, squat, bench])
+    db.flush()
+
+    step = [{"step_order": 1, "planned_reps": 5}]
+    data = WorkoutCreate(
+        name="Full body",
+        sets=[
+            {"set_order": 1, "exercise_id": squat.exercise_id, "steps": step},
+            {"set_order": 2, "exercise_id": bench.exercise_id, "steps": step},
+            {"set_order": 3, "exercise_id": squat.exercise_id, "steps": step},
+            {"set_order": 4, "new_exercise": {"name": "Lunge"}, "steps": step},
+            {"set_order": 5, "new_exercise": {"name": "Row"}, "steps": step},
+        ],
+    )
+    statements = _count_statements(db)
+    workout = WorkoutRepository(db).create_workout(data, user.user_id)
+
+    assert statements.count("SELECT") == 1
+    assert statements.count("INSERT") == 5  # exercises, name tokens, workout, sets, steps
+    assert [s.exercise.name for s in workout.sets] == ["Squat", "Bench", "Squat", "Lunge", "Row"]
+
+
+def test_all_missing_exercises_reported(db):
+    """Every unknown exercise_id is listed in a single error"""
+    user = User(auth0_sub="auth0|m", email="m@example.com")
+    db.add(user)
+    db.flush()
+    missing = [uuid.uuid4(), uuid.uuid4()]
+    data = WorkoutCreate(
+        name="Ghost",
+        sets=[{"set_order": i + 1, "exercise_id": eid,
+               "steps": [{"step_order": 1, "planned_reps": 1}]}
+              for i, eid in enumerate(missing)],
+    )
+    with pytest.raises(ValueError) as exc_info:
+        WorkoutRepository(db).create_workout(data, user.user_id)
+    assert all(str(eid) in str(exc_info.value) for eid in missing)
+
+
+def test_update_is_one_statement(db):
+    """An update writes and reads back the row with a single UPDATE ... RETURNING"""
+    user = User(auth0_sub="auth0|u", email="u@example.com")
+    squat = Exercise(name="Squat")
+    db.add_all([user, squat])
+    db.flush()
+    data = WorkoutCreate(
+        name="Legs",
+        sets=[{"set_order": 1, "exercise_id": squat.exercise_id,
+               "steps": [{"step_order": 1, "planned_reps": 5}]}],
+    )
+    repo = WorkoutRepository(db)
+    workout = repo.create_workout(data, user.user_id)
+    created_updated_at = workout.updated_at
+
+    statements = _count_statements(db)
+    repo.update_workout(workout, WorkoutUpdate(name="Legs day", is_shared=True))
+
+    assert statements == ["UPDATE"]
+    assert workout.name == "Legs day" and workout.is_shared
+    assert workout.updated_at >= created_updated_at
+    assert not db.is_modified(workout)
+    assert len(workout.sets) == 1  # loaded relationships survive
+
+    # Child entities go through the same path with their own mapper
+    db_set = repo.update_set(workout.sets[0], SetUpdate(notes="slow eccentric"))
+    assert db_set.notes == "slow eccentric"
+
+    db.expire_all()
+    assert repo.get_by_id(workout.workout_id).name == "Legs day"
+
+
+def test_set_exercise_change_reloads_exercise(client, db, auth0_sub):
+    """Changing a set's exercise_id does not leave the loaded exercise behind"""
+    user = User(auth0_sub=auth0_sub, email=f"{auth0_sub}@example.com")
+    squat, lunge = Exercise(name="Squat"), Exercise(name="Lunge")
+    db.add_all([user, squat, lunge])
+    db.flush()
+    workout = WorkoutRepository(db).create_workout(WorkoutCreate(
+        name="Legs",
+        sets=[{"set_order": 1, "exercise_id": squat.exercise_id,
+               "steps": [{"step_order": 1, "planned_reps": 5}]}],
+    ), user.user_id)
+    db_set = workout.sets[0]
+    assert db_set.exercise.name == "Squat"
+
+    response = client.patch(f"/api/v1/workouts/{workout.workout_id}/sets/{db_set.set_id}",
+                            json={"exercise_id": str(lunge.exercise_id)})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["exercise_id"] == str(lunge.exercise_id)
+    assert body["exercise"]["name"] == "Lunge"
+    assert db_set.exercise is lunge
+
+
+def test_shared_catalog_cached_until_sharing_changes(db):
+    """list_shared pages come from the cache until a shared workout changes"""
+    shared_workouts_cache.invalidate()
+    user = User(auth0_sub="auth0|s", email="s@example.com")
+    db.add(user)
+    db.flush()
+    repo = WorkoutRepository(db)
+    public = repo.create_workout(WorkoutCreate(name="Public", is_shared=True), user.user_id)
+    private = repo.create_workout(WorkoutCreate(name="Private"), user.user_id)
+
+    assert [w.name for w in repo.list_shared()] == ["Public"]
+    statements = _count_statements(db)
+    assert [w.workout_id for w in repo.list_shared()] == [public.workout_id]
+    assert statements == []
+
+    repo.update_workout(private, WorkoutUpdate(is_shared=True))
+    assert {w.name for w in repo.list_shared()} == {"Public", "Private"}
+
+    repo.delete(public)
+    assert [w.name for w in repo.list_shared()] == ["Private"]
@@ -0,0 +1,110 @@
+"""
+Workout stats rollup tests
+"""
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path to import src
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.db.orm_models import User, UserWorkoutStats
+from src.models.logs import WorkoutLogCreate, WorkoutLogUpdate
+from src.repositories.log_repository import LogRepository
+from src.repositories.workout_stats_repository import WorkoutStatsRepository, duration_minutes
+
+TODAY = date(2026, 3, 11)  # a Wednesday
+
+
+def _user(db, sub):
+    user = User(auth0_sub=sub, email=f"{sub}@example.com")
+    db.add(user)
+    db.flush()
+    return user
+
+
+def _finished(repo, user, start, minutes):
+    return repo.create_workout_log(WorkoutLogCreate(
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+    ), user.user_id)
+
+
+def test_duration_matches_datediff():
+    """Minute boundaries crossed, like the computed column"""
+    assert duration_minutes(datetime(2026, 1, 1, 9, 0, 59), datetime(2026, 1, 1, 10, 0, 1)) == 60
+    assert duration_minutes(datetime(2026, 1, 1, 9, 0, 59), datetime(2026, 1, 1, 9, 1, 0)) == 1
+    assert duration_minutes(datetime(2026, 1, 1, 9), None) == 0
+
+
+def test_incremental_rollup_matches_rebuild(db):
+    """Finishing, re-timing and deleting logs keep the row equal to a rebuild"""
+    user = _user(db, "auth0|stats")
+    stats = WorkoutStatsRepository(db)
+    stats.rebuild([user.user_id], today=date(2026, 2, 16))
+    repo = LogRepository(db)
+
+    _finished(repo, user, datetime(2026, 2, 20, 7), 60)
+    _finished(repo, user, datetime(2026, 3, 3, 7), 45)
+    open_log = repo.create_workout_log(WorkoutLogCreate(start_time=datetime(2026, 3, 10, 7)), user.user_id)
+    assert stats.get_stats(user.user_id, today=TODAY).total_workouts == 2
+
+    repo.finish_workout(open_log, WorkoutLogUpdate(end_time=datetime(2026, 3, 10, 7, 20)))
+    repo.finish_workout(open_log, WorkoutLogUpdate(end_time=datetime(2026, 3, 10, 7, 30)))
+    repo.delete(_finished(repo, user, datetime(2026, 3, 11, 7), 50))
+
+    incremental = stats.get_stats(user.user_id, today=TODAY)
+    assert incremental.model_dump() == {
+        "total_workouts": 3,
+        "total_duration_minutes": 135,
+        "avg_duration_minutes": 45.0,
+        "workouts_this_week": 1,
+        "workouts_this_month": 2,
+    }
+    stats.rebuild([user.user_id], today=TODAY)
+    assert stats.get_stats(user.user_id, today=TODAY) == incremental
+
+    # Counters for a period that has ended read as zero
+    assert stats.get_stats(user.user_id, today=date(2026, 4, 1)).workouts_this_month == 0
+
+
+def test_stats_endpoint(client, db, auth0_sub):
+    """A user without a rollup row gets one built; deleting a log updates it"""
+    user = _user(db, auth0_sub)
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    first = _finished(LogRepository(db), user, today.replace(hour=6), 40)
+    _finished(LogRepository(db), user, today.replace(hour=8), 20)
+
+    body = client.get("/api/v1/workouts/stats").json()
+    assert (body["total_workouts"], body["total_duration_minutes"]) == (2, 60)
+    assert body["workouts_this_week"] == body["workouts_this_month"] == 2
+
+    assert client.delete(f"/api/v1/workouts/logs/{first.workout_log_id}").status_code == 204
+    body = client.get("/api/v1/workouts/stats").json()
+    assert (body["total_workouts"], body["avg_duration_minutes"]) == (1, 20.0)
+
+
+def test_concurrently_created_row_is_reused(db, monkeypatch):
+    """A rollup row another request created first is read, not a PK error"""
+    user = _user(db, "auth0|stats-race")
+    _finished(LogRepository(db), user, datetime(2026, 3, 9, 7), 30)
+    db.execute(delete(UserWorkoutStats))
+    db.commit()
+    stats = WorkoutStatsRepository(db)
+    rebuild = stats.rebuild
+
+    def racing_rebuild(user_ids, today=None):
+        # The other request commits its row just before this one inserts
+        with Session(db.get_bind()) as other:
+            WorkoutStatsRepository(other).rebuild(user_ids, today=today)
+            other.commit()
+        raise IntegrityError("INSERT INTO UserWorkoutStats", {}, Exception("PK_UserWorkoutStats"))
+
+    monkeypatch.setattr(stats, "rebuild", racing_rebuild)
+    assert stats.get_stats(user.user_id, today=TODAY).total_workouts == 1
+
+    monkeypatch.setattr(stats, "rebuild", rebuild)
+    assert stats.get_stats(user.user_id, today=TODAY).total_duration_minutes == 30
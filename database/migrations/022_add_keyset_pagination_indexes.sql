@@ -0,0 +1,49 @@
+-- Add keyset pagination indexes
+-- Version: 022
+-- Created: 2026-10-18
+-- Description: Indexes matching the (owner, timestamp DESC, id DESC) order used by
+--              cursor pagination on workout logs, workouts and programs, so that
+--              "rows before cursor X" is an index seek regardless of page depth.
+
+-- Required for filtered indexes on SQL Server
+SET QUOTED_IDENTIFIER ON;
+SET ANSI_NULLS ON;
+
+-- ============================================================================
+-- Workout logs: GET /workouts/logs
+-- ============================================================================
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_WorkoutLogs_UserId_StartTime_Keyset' AND object_id = OBJECT_ID('dbo.WorkoutLogs'))
+    CREATE INDEX [IX_WorkoutLogs_UserId_StartTime_Keyset]
+        ON [dbo].[WorkoutLogs]([UserId], [StartTime] DESC, [WorkoutLogId] DESC)
+        INCLUDE ([EndTime], [OriginalWorkoutId]);
+
+-- ============================================================================
+-- Workouts: GET /workouts (own and shared)
+-- ============================================================================
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Workouts_Active_CreatorId_CreatedAt' AND object_id = OBJECT_ID('dbo.Workouts'))
+    CREATE INDEX [IX_Workouts_Active_CreatorId_CreatedAt]
+        ON [dbo].[Workouts]([CreatorId], [CreatedAt] DESC, [WorkoutId] DESC)
+        WHERE [DeletedAt] IS NULL;
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Workouts_Active_Shared_CreatedAt' AND object_id = OBJECT_ID('dbo.Workouts'))
+    CREATE INDEX [IX_Workouts_Active_Shared_CreatedAt]
+        ON [dbo].[Workouts]([CreatedAt] DESC, [WorkoutId] DESC)
+        WHERE [DeletedAt] IS NULL AND [IsShared] = 1;
+
+-- ============================================================================
+-- Programs: GET /programs (own and shared)
+-- ============================================================================
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Programs_Active_CreatorId_CreatedAt' AND object_id = OBJECT_ID('dbo.Programs'))
+    CREATE INDEX [IX_Programs_Active_CreatorId_CreatedAt]
+        ON [dbo].[Programs]([CreatorId], [CreatedAt] DESC, [ProgramId] DESC)
+        WHERE [DeletedAt] IS NULL;
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Programs_Active_Shared_CreatedAt' AND object_id = OBJECT_ID('dbo.Programs'))
+    CREATE INDEX [IX_Programs_Active_Shared_CreatedAt]
+        ON [dbo].[Programs]([CreatedAt] DESC, [ProgramId] DESC)
+        WHERE [DeletedAt] IS NULL AND [IsShared] = 1;
+
+PRINT 'Keyset pagination indexes created successfully';
@@ -0,0 +1,53 @@
+-- Add exercise name search index
+-- Version: 023
+-- Created: 2026-10-18
+-- Description: Replaces the unindexable Name LIKE '%...%' scan behind exercise search.
+--              Exercises.NameNormalized holds the accent/case/punctuation-folded name
+--              (exact-name lookups and whole-name ranking), and ExerciseNameTokens
+--              holds one row per word so per-word prefix matches are index seeks.
+--              Both are populated by the API on write; existing rows must be
+--              backfilled once with: python -m scripts.backfill_exercise_search
+
+-- Required for filtered indexes on SQL Server
+SET QUOTED_IDENTIFIER ON;
+SET ANSI_NULLS ON;
+
+-- ============================================================================
+-- Exercises.NameNormalized
+-- ============================================================================
+
+IF NOT EXISTS (SELECT 1 FROM sys.columns WHERE object_id = OBJECT_ID('dbo.Exercises') AND name = 'NameNormalized')
+BEGIN
+    ALTER TABLE [dbo].[Exercises]
+        ADD [NameNormalized] NVARCHAR(255) NULL;
+
+    PRINT 'Added NameNormalized column to Exercises table';
+END
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Exercises_Active_NameNormalized' AND object_id = OBJECT_ID('dbo.Exercises'))
+    CREATE INDEX [IX_Exercises_Active_NameNormalized]
+        ON [dbo].[Exercises]([NameNormalized])
+        INCLUDE ([Name], [PrimaryMuscleGroup], [DifficultyLevel])
+        WHERE [DeletedAt] IS NULL;
+
+-- ============================================================================
+-- ExerciseNameTokens
+-- ============================================================================
+
+IF NOT EXISTS (SELECT 1 FROM sys.tables WHERE name = 'ExerciseNameTokens' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE [dbo].[ExerciseNameTokens] (
+        [Token] NVARCHAR(64) NOT NULL,
+        [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+        CONSTRAINT [PK_ExerciseNameTokens] PRIMARY KEY ([Token], [ExerciseId]),
+        CONSTRAINT [FK_ExerciseNameTokens_Exercises] FOREIGN KEY ([ExerciseId])
+            REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE CASCADE
+    );
+
+    PRINT 'ExerciseNameTokens table created';
+END
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_ExerciseNameTokens_ExerciseId_Token' AND object_id = OBJECT_ID('dbo.ExerciseNameTokens'))
+    CREATE INDEX [IX_ExerciseNameTokens_ExerciseId_Token] ON [dbo].[ExerciseNameTokens]([ExerciseId], [Token]);
+
+PRINT 'Exercise search index created successfully';
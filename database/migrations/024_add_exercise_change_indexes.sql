@@ -0,0 +1,19 @@
+-- Add exercise change-tracking indexes
+-- Version: 024
+-- Created: 2026-10-18
+-- Description: The in-memory exercise catalog (GET /exercises) refreshes by reading
+--              rows whose CreatedAt, UpdatedAt or DeletedAt moved past its last
+--              watermark. Index the two timestamps not already covered
+--              (IX_Exercises_DeletedAt exists) so each refresh is a few seeks.
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Exercises_UpdatedAt' AND object_id = OBJECT_ID('dbo.Exercises'))
+BEGIN
+    CREATE INDEX [IX_Exercises_UpdatedAt] ON [dbo].[Exercises]([UpdatedAt]);
+    PRINT 'Index IX_Exercises_UpdatedAt created';
+END
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Exercises_CreatedAt' AND object_id = OBJECT_ID('dbo.Exercises'))
+BEGIN
+    CREATE INDEX [IX_Exercises_CreatedAt] ON [dbo].[Exercises]([CreatedAt]);
+    PRINT 'Index IX_Exercises_CreatedAt created';
+END
@@ -0,0 +1,34 @@
+-- Create ExerciseEquipment table
+-- Version: 025
+-- Created: 2026-10-18
+-- Description: Normalized exercise -> equipment relation (one canonical, lower-case
+--              name per row) so that equipment filters on GET /exercises are
+--              index seeks rather than parsing Exercises.EquipmentRequired per row.
+--              EquipmentRequired stays as the client-facing list. The API keeps both
+--              in step on write; existing rows must be backfilled once with:
+--              python -m scripts.backfill_exercise_equipment
+
+IF NOT EXISTS (SELECT 1 FROM sys.tables WHERE name = 'ExerciseEquipment' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE [dbo].[ExerciseEquipment] (
+        [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+        [Equipment] NVARCHAR(100) NOT NULL,
+        CONSTRAINT [PK_ExerciseEquipment] PRIMARY KEY ([ExerciseId], [Equipment]),
+        CONSTRAINT [FK_ExerciseEquipment_Exercises] FOREIGN KEY ([ExerciseId])
+            REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE CASCADE
+    );
+
+    PRINT 'ExerciseEquipment table created';
+END
+ELSE
+BEGIN
+    PRINT 'ExerciseEquipment table already exists';
+END
+
+-- "Exercises needing anything outside the available list" is a set of range seeks here
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_ExerciseEquipment_Equipment_ExerciseId' AND object_id = OBJECT_ID('dbo.ExerciseEquipment'))
+BEGIN
+    CREATE INDEX [IX_ExerciseEquipment_Equipment_ExerciseId]
+        ON [dbo].[ExerciseEquipment]([Equipment], [ExerciseId]);
+    PRINT 'Index IX_ExerciseEquipment_Equipment_ExerciseId created';
+END
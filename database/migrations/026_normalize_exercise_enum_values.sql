@@ -0,0 +1,62 @@
+-- Normalize exercise enum values
+-- Version: 026
+-- Created: 2026-10-18
+-- Description: PrimaryMuscleGroup and DifficultyLevel must hold the API's canonical
+--              enum values (lower-case, underscores). Rows seeded by hand ('Chest',
+--              'Beginner', ...) are rewritten once; values that match no enum member
+--              (already returned as null by the API) are cleared. CHECK constraints
+--              then keep every future write canonical, so readers map values with a
+--              plain lookup and the muscle-group/difficulty filters see every row.
+
+-- ============================================================================
+-- Canonicalize case, whitespace and spaces-for-underscores
+-- ============================================================================
+
+UPDATE [dbo].[Exercises]
+SET [PrimaryMuscleGroup] = LOWER(REPLACE(LTRIM(RTRIM([PrimaryMuscleGroup])), ' ', '_'))
+WHERE [PrimaryMuscleGroup] IS NOT NULL
+  AND [PrimaryMuscleGroup] COLLATE Latin1_General_BIN
+      <> LOWER(REPLACE(LTRIM(RTRIM([PrimaryMuscleGroup])), ' ', '_')) COLLATE Latin1_General_BIN;
+
+UPDATE [dbo].[Exercises]
+SET [DifficultyLevel] = LOWER(LTRIM(RTRIM([DifficultyLevel])))
+WHERE [DifficultyLevel] IS NOT NULL
+  AND [DifficultyLevel] COLLATE Latin1_General_BIN
+      <> LOWER(LTRIM(RTRIM([DifficultyLevel]))) COLLATE Latin1_General_BIN;
+
+-- ============================================================================
+-- Clear values outside the enums
+-- ============================================================================
+
+UPDATE [dbo].[Exercises]
+SET [PrimaryMuscleGroup] = NULL
+WHERE [PrimaryMuscleGroup] NOT IN ('chest', 'back', 'shoulders', 'biceps', 'triceps', 'forearms',
+                                   'abs', 'obliques', 'quads', 'hamstrings', 'glutes', 'calves',
+                                   'full_body', 'cardio');
+
+UPDATE [dbo].[Exercises]
+SET [DifficultyLevel] = NULL
+WHERE [DifficultyLevel] NOT IN ('beginner', 'intermediate', 'advanced');
+
+-- ============================================================================
+-- Keep them canonical
+-- ============================================================================
+
+IF NOT EXISTS (SELECT 1 FROM sys.check_constraints WHERE name = 'CK_Exercises_PrimaryMuscleGroup')
+BEGIN
+    ALTER TABLE [dbo].[Exercises]
+        ADD CONSTRAINT [CK_Exercises_PrimaryMuscleGroup] CHECK ([PrimaryMuscleGroup] COLLATE Latin1_General_BIN IN (
+            'chest', 'back', 'shoulders', 'biceps', 'triceps', 'forearms', 'abs', 'obliques',
+            'quads', 'hamstrings', 'glutes', 'calves', 'full_body', 'cardio'));
+    PRINT 'Constraint CK_Exercises_PrimaryMuscleGroup created';
+END
+
+IF NOT EXISTS (SELECT 1 FROM sys.check_constraints WHERE name = 'CK_Exercises_DifficultyLevel')
+BEGIN
+    ALTER TABLE [dbo].[Exercises]
+        ADD CONSTRAINT [CK_Exercises_DifficultyLevel] CHECK ([DifficultyLevel] COLLATE Latin1_General_BIN IN (
+            'beginner', 'intermediate', 'advanced'));
+    PRINT 'Constraint CK_Exercises_DifficultyLevel created';
+END
+
+PRINT 'Exercise enum values normalized successfully';
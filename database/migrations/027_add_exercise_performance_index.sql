@@ -0,0 +1,16 @@
+-- Add covering index for per-exercise performance history
+-- Version: 027
+-- Created: 2026-10-18
+-- Description: GET /exercises/{id}/performance aggregates SetLogs ⋈ WorkoutLogs ⋈ SetStepLogs
+--              for one user and exercise. SetLogs are sought on
+--              IX_SetLogs_ExerciseId_WorkoutLogId (migration 020) and WorkoutLogs by
+--              primary key; this index lets the step side be read without key
+--              lookups by carrying the reps and weight being summed.
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_SetStepLogs_SetLogId_Performance' AND object_id = OBJECT_ID('dbo.SetStepLogs'))
+BEGIN
+    CREATE INDEX [IX_SetStepLogs_SetLogId_Performance]
+        ON [dbo].[SetStepLogs]([SetLogId])
+        INCLUDE ([CompletedReps], [CompletedWeight]);
+    PRINT 'Index IX_SetStepLogs_SetLogId_Performance created';
+END
@@ -0,0 +1,33 @@
+-- Create UserWorkoutStats rollup table
+-- Version: 028
+-- Created: 2026-10-18
+-- Description: One row per user with totals of their finished workout logs, so
+--              GET /workouts/stats is a primary-key read rather than an aggregate
+--              over the user's whole history. The API adjusts the row in the same
+--              transaction whenever a log is finished, re-timed or deleted, and
+--              builds it from WorkoutLogs the first time a user has none. To
+--              recompute every row from scratch (e.g. after manual data fixes):
+--              python -m scripts.rebuild_workout_stats
+
+IF NOT EXISTS (SELECT 1 FROM sys.tables WHERE name = 'UserWorkoutStats' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE [dbo].[UserWorkoutStats] (
+        [UserId] UNIQUEIDENTIFIER NOT NULL,
+        [TotalWorkouts] INT NOT NULL DEFAULT 0,
+        [TotalDurationMinutes] INT NOT NULL DEFAULT 0,
+        [WeekStart] DATE,
+        [WeekWorkouts] INT NOT NULL DEFAULT 0,
+        [MonthStart] DATE,
+        [MonthWorkouts] INT NOT NULL DEFAULT 0,
+        [UpdatedAt] DATETIME2 NOT NULL DEFAULT GETUTCDATE(),
+        CONSTRAINT [PK_UserWorkoutStats] PRIMARY KEY ([UserId]),
+        CONSTRAINT [FK_UserWorkoutStats_Users] FOREIGN KEY ([UserId])
+            REFERENCES [dbo].[Users]([UserId]) ON DELETE CASCADE
+    );
+
+    PRINT 'UserWorkoutStats table created';
+END
+ELSE
+BEGIN
+    PRINT 'UserWorkoutStats table already exists';
+END
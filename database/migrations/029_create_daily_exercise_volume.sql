@@ -0,0 +1,42 @@
+-- Create DailyExerciseVolume table
+-- Version: 029
+-- Created: 2026-10-18
+-- Description: Materialized training volume per (user, exercise, day) for charts:
+--              set count, reps and SUM(CompletedReps * CompletedWeight) of the set/step
+--              logs in workouts started that day (UTC). GET /workouts/volume reads it
+--              instead of scanning every step log a user has written. The API rewrites
+--              the affected user/day in the same transaction as each set/step-log
+--              write; existing history must be backfilled once with:
+--              python -m scripts.backfill_training_volume
+
+IF NOT EXISTS (SELECT 1 FROM sys.tables WHERE name = 'DailyExerciseVolume' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE [dbo].[DailyExerciseVolume] (
+        [UserId] UNIQUEIDENTIFIER NOT NULL,
+        [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+        [Day] DATE NOT NULL,
+        [Sets] INT NOT NULL,
+        [Reps] INT NOT NULL,
+        [Volume] DECIMAL(18, 2) NOT NULL,
+        CONSTRAINT [PK_DailyExerciseVolume] PRIMARY KEY ([UserId], [ExerciseId], [Day]),
+        CONSTRAINT [FK_DailyExerciseVolume_Users] FOREIGN KEY ([UserId])
+            REFERENCES [dbo].[Users]([UserId]) ON DELETE CASCADE,
+        CONSTRAINT [FK_DailyExerciseVolume_Exercises] FOREIGN KEY ([ExerciseId])
+            REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE NO ACTION
+    );
+
+    PRINT 'DailyExerciseVolume table created';
+END
+ELSE
+BEGIN
+    PRINT 'DailyExerciseVolume table already exists';
+END
+
+-- All-exercise and per-muscle-group series, and per-day rewrites, seek on (UserId, Day)
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_DailyExerciseVolume_UserId_Day' AND object_id = OBJECT_ID('dbo.DailyExerciseVolume'))
+BEGIN
+    CREATE INDEX [IX_DailyExerciseVolume_UserId_Day]
+        ON [dbo].[DailyExerciseVolume]([UserId], [Day])
+        INCLUDE ([ExerciseId], [Sets], [Reps], [Volume]);
+    PRINT 'Index IX_DailyExerciseVolume_UserId_Day created';
+END
@@ -0,0 +1,42 @@
+-- Create PersonalRecords table
+-- Version: 030
+-- Created: 2026-10-18
+-- Description: Personal records per (user, exercise, rep count): the heaviest
+--              CompletedWeight logged for exactly that many reps, the step log that
+--              set it and the start time of its workout. Max weight and estimated 1RM
+--              are derived from these rows, so GET /exercises/{id}/records is a single
+--              primary-key range read. The API applies new step logs incrementally and
+--              recomputes an exercise when a record-holding step is edited or deleted;
+--              existing history must be backfilled once with:
+--              python -m scripts.rebuild_personal_records
+
+IF NOT EXISTS (SELECT 1 FROM sys.tables WHERE name = 'PersonalRecords' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE [dbo].[PersonalRecords] (
+        [UserId] UNIQUEIDENTIFIER NOT NULL,
+        [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+        [Reps] INT NOT NULL,
+        [Weight] DECIMAL(10, 2) NOT NULL,
+        [SetStepLogId] UNIQUEIDENTIFIER NOT NULL,
+        [AchievedAt] DATETIME2 NOT NULL,
+        CONSTRAINT [PK_PersonalRecords] PRIMARY KEY ([UserId], [ExerciseId], [Reps]),
+        CONSTRAINT [FK_PersonalRecords_Users] FOREIGN KEY ([UserId])
+            REFERENCES [dbo].[Users]([UserId]) ON DELETE CASCADE,
+        CONSTRAINT [FK_PersonalRecords_Exercises] FOREIGN KEY ([ExerciseId])
+            REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE NO ACTION
+    );
+
+    PRINT 'PersonalRecords table created';
+END
+ELSE
+BEGIN
+    PRINT 'PersonalRecords table already exists';
+END
+
+-- Edits and deletes look up which records a step log holds
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_PersonalRecords_SetStepLogId' AND object_id = OBJECT_ID('dbo.PersonalRecords'))
+BEGIN
+    CREATE INDEX [IX_PersonalRecords_SetStepLogId]
+        ON [dbo].[PersonalRecords]([SetStepLogId]);
+    PRINT 'Index IX_PersonalRecords_SetStepLogId created';
+END
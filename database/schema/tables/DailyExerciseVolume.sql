@@ -0,0 +1,19 @@
+-- DailyExerciseVolume Table
+-- Sets, reps and volume (reps x weight) per user, exercise and day; backs GET /workouts/volume
+
+CREATE TABLE [dbo].[DailyExerciseVolume] (
+    [UserId] UNIQUEIDENTIFIER NOT NULL,
+    [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+    [Day] DATE NOT NULL,
+    [Sets] INT NOT NULL,
+    [Reps] INT NOT NULL,
+    [Volume] DECIMAL(18, 2) NOT NULL,
+    CONSTRAINT [PK_DailyExerciseVolume] PRIMARY KEY ([UserId], [ExerciseId], [Day]),
+    CONSTRAINT [FK_DailyExerciseVolume_Users] FOREIGN KEY ([UserId])
+        REFERENCES [dbo].[Users]([UserId]) ON DELETE CASCADE,
+    CONSTRAINT [FK_DailyExerciseVolume_Exercises] FOREIGN KEY ([ExerciseId])
+        REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE NO ACTION
+);
+
+-- Create indexes
+CREATE INDEX [IX_DailyExerciseVolume_UserId_Day] ON [dbo].[DailyExerciseVolume]([UserId], [Day]) INCLUDE ([ExerciseId], [Sets], [Reps], [Volume]);
@@ -0,0 +1,13 @@
+-- ExerciseEquipment Table
+-- Canonical (lower-case) equipment names required by each exercise; backs equipment filters
+
+CREATE TABLE [dbo].[ExerciseEquipment] (
+    [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+    [Equipment] NVARCHAR(100) NOT NULL,
+    CONSTRAINT [PK_ExerciseEquipment] PRIMARY KEY ([ExerciseId], [Equipment]),
+    CONSTRAINT [FK_ExerciseEquipment_Exercises] FOREIGN KEY ([ExerciseId])
+        REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE CASCADE
+);
+
+-- Create indexes
+CREATE INDEX [IX_ExerciseEquipment_Equipment_ExerciseId] ON [dbo].[ExerciseEquipment]([Equipment], [ExerciseId]);
@@ -0,0 +1,13 @@
+-- ExerciseNameTokens Table
+-- One row per normalized word of an exercise name; backs prefix and typo-tolerant search
+
+CREATE TABLE [dbo].[ExerciseNameTokens] (
+    [Token] NVARCHAR(64) NOT NULL,
+    [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+    CONSTRAINT [PK_ExerciseNameTokens] PRIMARY KEY ([Token], [ExerciseId]),
+    CONSTRAINT [FK_ExerciseNameTokens_Exercises] FOREIGN KEY ([ExerciseId])
+        REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE CASCADE
+);
+
+-- Create indexes
+CREATE INDEX [IX_ExerciseNameTokens_ExerciseId_Token] ON [dbo].[ExerciseNameTokens]([ExerciseId], [Token]);
@@ -5,8 +5,9 @@ CREATE TABLE [dbo].[Exercises] (
     [ExerciseId] UNIQUEIDENTIFIER PRIMARY KEY DEFAULT NEWID(),
     [CreatorId] UNIQUEIDENTIFIER NULL, -- NULL = system/admin-seeded, non-null = user-created
     [Name] NVARCHAR(255) NOT NULL,
+    [NameNormalized] NVARCHAR(255) NULL, -- Folded name for search (see ExerciseNameTokens)
     [Description] NVARCHAR(MAX),
-    [EquipmentRequired] NVARCHAR(MAX), -- JSON array of equipment needed
+    [EquipmentRequired] NVARCHAR(MAX), -- Comma-joined equipment list as sent (canonical rows in ExerciseEquipment)
     [PrimaryMuscleGroup] NVARCHAR(100),
     [DifficultyLevel] NVARCHAR(50),
     [Instructions] NVARCHAR(MAX),
@@ -14,6 +15,11 @@ CREATE TABLE [dbo].[Exercises] (
     [CreatedAt] DATETIME2 NOT NULL DEFAULT GETUTCDATE(),
     [UpdatedAt] DATETIME2 NOT NULL DEFAULT GETUTCDATE(),
     CONSTRAINT [UQ_Exercises_Name] UNIQUE ([Name]),
+    CONSTRAINT [CK_Exercises_PrimaryMuscleGroup] CHECK ([PrimaryMuscleGroup] COLLATE Latin1_General_BIN IN (
+        'chest', 'back', 'shoulders', 'biceps', 'triceps', 'forearms', 'abs', 'obliques',
+        'quads', 'hamstrings', 'glutes', 'calves', 'full_body', 'cardio')),
+    CONSTRAINT [CK_Exercises_DifficultyLevel] CHECK ([DifficultyLevel] COLLATE Latin1_General_BIN IN (
+        'beginner', 'intermediate', 'advanced')),
     CONSTRAINT [FK_Exercises_Users] FOREIGN KEY ([CreatorId])
         REFERENCES [dbo].[Users]([UserId]) ON DELETE SET NULL
 );
@@ -25,3 +31,6 @@ CREATE INDEX [IX_Exercises_DifficultyLevel] ON [dbo].[Exercises]([DifficultyLeve
 CREATE INDEX [IX_Exercises_DeletedAt] ON [dbo].[Exercises]([DeletedAt]);
 CREATE INDEX [IX_Exercises_Active_MuscleGroup] ON [dbo].[Exercises]([PrimaryMuscleGroup]) WHERE [DeletedAt] IS NULL;
 CREATE INDEX [IX_Exercises_Active_CreatorId] ON [dbo].[Exercises]([CreatorId]) WHERE [DeletedAt] IS NULL;
+CREATE INDEX [IX_Exercises_Active_NameNormalized] ON [dbo].[Exercises]([NameNormalized]) INCLUDE ([Name], [PrimaryMuscleGroup], [DifficultyLevel]) WHERE [DeletedAt] IS NULL;
+CREATE INDEX [IX_Exercises_UpdatedAt] ON [dbo].[Exercises]([UpdatedAt]);
+CREATE INDEX [IX_Exercises_CreatedAt] ON [dbo].[Exercises]([CreatedAt]);
@@ -0,0 +1,19 @@
+-- PersonalRecords Table
+-- Heaviest weight per user, exercise and rep count; backs GET /exercises/{id}/records
+
+CREATE TABLE [dbo].[PersonalRecords] (
+    [UserId] UNIQUEIDENTIFIER NOT NULL,
+    [ExerciseId] UNIQUEIDENTIFIER NOT NULL,
+    [Reps] INT NOT NULL,
+    [Weight] DECIMAL(10, 2) NOT NULL,
+    [SetStepLogId] UNIQUEIDENTIFIER NOT NULL,
+    [AchievedAt] DATETIME2 NOT NULL,
+    CONSTRAINT [PK_PersonalRecords] PRIMARY KEY ([UserId], [ExerciseId], [Reps]),
+    CONSTRAINT [FK_PersonalRecords_Users] FOREIGN KEY ([UserId])
+        REFERENCES [dbo].[Users]([UserId]) ON DELETE CASCADE,
+    CONSTRAINT [FK_PersonalRecords_Exercises] FOREIGN KEY ([ExerciseId])
+        REFERENCES [dbo].[Exercises]([ExerciseId]) ON DELETE NO ACTION
+);
+
+-- Create indexes
+CREATE INDEX [IX_PersonalRecords_SetStepLogId] ON [dbo].[PersonalRecords]([SetStepLogId]);
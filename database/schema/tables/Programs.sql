@@ -21,3 +21,5 @@ CREATE INDEX [IX_Programs_IsShared] ON [dbo].[Programs]([IsShared]);
 CREATE INDEX [IX_Programs_DeletedAt] ON [dbo].[Programs]([DeletedAt]);
 CREATE INDEX [IX_Programs_Active_CreatorId] ON [dbo].[Programs]([CreatorId]) WHERE [DeletedAt] IS NULL;
 CREATE INDEX [IX_Programs_Active_Shared] ON [dbo].[Programs]([IsShared]) WHERE [DeletedAt] IS NULL AND [IsShared] = 1;
+CREATE INDEX [IX_Programs_Active_CreatorId_CreatedAt] ON [dbo].[Programs]([CreatorId], [CreatedAt] DESC, [ProgramId] DESC) WHERE [DeletedAt] IS NULL;
+CREATE INDEX [IX_Programs_Active_Shared_CreatedAt] ON [dbo].[Programs]([CreatedAt] DESC, [ProgramId] DESC) WHERE [DeletedAt] IS NULL AND [IsShared] = 1;
@@ -22,3 +22,4 @@ CREATE TABLE [dbo].[SetStepLogs] (
 CREATE INDEX [IX_SetStepLogs_SetLogId] ON [dbo].[SetStepLogs]([SetLogId]);
 CREATE INDEX [IX_SetStepLogs_OriginalSetStepId] ON [dbo].[SetStepLogs]([OriginalSetStepId]);
 CREATE UNIQUE INDEX [IX_SetStepLogs_SetLogId_StepOrder] ON [dbo].[SetStepLogs]([SetLogId], [StepOrder]);
+CREATE INDEX [IX_SetStepLogs_SetLogId_Performance] ON [dbo].[SetStepLogs]([SetLogId]) INCLUDE ([CompletedReps], [CompletedWeight]);
@@ -0,0 +1,16 @@
+-- UserWorkoutStats Table
+-- Per-user rollup of finished workout logs; backs GET /workouts/stats
+
+CREATE TABLE [dbo].[UserWorkoutStats] (
+    [UserId] UNIQUEIDENTIFIER NOT NULL,
+    [TotalWorkouts] INT NOT NULL DEFAULT 0,
+    [TotalDurationMinutes] INT NOT NULL DEFAULT 0,
+    [WeekStart] DATE,
+    [WeekWorkouts] INT NOT NULL DEFAULT 0,
+    [MonthStart] DATE,
+    [MonthWorkouts] INT NOT NULL DEFAULT 0,
+    [UpdatedAt] DATETIME2 NOT NULL DEFAULT GETUTCDATE(),
+    CONSTRAINT [PK_UserWorkoutStats] PRIMARY KEY ([UserId]),
+    CONSTRAINT [FK_UserWorkoutStats_Users] FOREIGN KEY ([UserId])
+        REFERENCES [dbo].[Users]([UserId]) ON DELETE CASCADE
+);
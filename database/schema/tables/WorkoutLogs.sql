@@ -25,3 +25,4 @@ CREATE INDEX [IX_WorkoutLogs_OriginalWorkoutId] ON [dbo].[WorkoutLogs]([Original
 CREATE INDEX [IX_WorkoutLogs_ProgramId] ON [dbo].[WorkoutLogs]([ProgramId]);
 CREATE INDEX [IX_WorkoutLogs_StartTime] ON [dbo].[WorkoutLogs]([StartTime] DESC);
 CREATE INDEX [IX_WorkoutLogs_UserId_StartTime] ON [dbo].[WorkoutLogs]([UserId], [StartTime] DESC);
+CREATE INDEX [IX_WorkoutLogs_UserId_StartTime_Keyset] ON [dbo].[WorkoutLogs]([UserId], [StartTime] DESC, [WorkoutLogId] DESC) INCLUDE ([EndTime], [OriginalWorkoutId]);
@@ -20,3 +20,5 @@ CREATE INDEX [IX_Workouts_IsShared] ON [dbo].[Workouts]([IsShared]);
 CREATE INDEX [IX_Workouts_DeletedAt] ON [dbo].[Workouts]([DeletedAt]);
 CREATE INDEX [IX_Workouts_Active_CreatorId] ON [dbo].[Workouts]([CreatorId]) WHERE [DeletedAt] IS NULL;
 CREATE INDEX [IX_Workouts_Active_Shared] ON [dbo].[Workouts]([IsShared]) WHERE [DeletedAt] IS NULL AND [IsShared] = 1;
+CREATE INDEX [IX_Workouts_Active_CreatorId_CreatedAt] ON [dbo].[Workouts]([CreatorId], [CreatedAt] DESC, [WorkoutId] DESC) WHERE [DeletedAt] IS NULL;
+CREATE INDEX [IX_Workouts_Active_Shared_CreatedAt] ON [dbo].[Workouts]([CreatedAt] DESC, [WorkoutId] DESC) WHERE [DeletedAt] IS NULL AND [IsShared] = 1;